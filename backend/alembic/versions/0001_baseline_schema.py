@@ -0,0 +1,498 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 16:14:00.564267
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('campus_locations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('latitude', sa.Float(), nullable=False),
+    sa.Column('longitude', sa.Float(), nullable=False),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('campus_locations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_campus_locations_id'), ['id'], unique=False)
+
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('department', sa.String(length=100), nullable=True),
+    sa.Column('managed_modules', sa.String(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_email'), ['email'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_id'), ['id'], unique=False)
+
+    op.create_table('announcements',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=30), nullable=False),
+    sa.Column('pinned', sa.Boolean(), nullable=False),
+    sa.Column('posted_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['posted_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('announcements', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_announcements_id'), ['id'], unique=False)
+
+    op.create_table('audit_logs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('action', sa.String(length=50), nullable=False),
+    sa.Column('target_type', sa.String(length=50), nullable=False),
+    sa.Column('target_id', sa.Integer(), nullable=True),
+    sa.Column('details', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_audit_logs_id'), ['id'], unique=False)
+
+    op.create_table('caravan_pools',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('destination', sa.String(length=255), nullable=False),
+    sa.Column('origin', sa.String(length=255), nullable=False),
+    sa.Column('travel_date', sa.DateTime(), nullable=False),
+    sa.Column('available_seats', sa.Integer(), nullable=False),
+    sa.Column('estimated_cost', sa.Float(), nullable=True),
+    sa.Column('contact_info', sa.String(length=255), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('posted_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['posted_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('caravan_pools', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_caravan_pools_id'), ['id'], unique=False)
+
+    op.create_table('clubs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('logo_url', sa.String(length=500), nullable=True),
+    sa.Column('lead_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['lead_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('clubs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_clubs_id'), ['id'], unique=False)
+
+    op.create_table('courses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('code', sa.String(length=20), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('semester', sa.String(length=20), nullable=True),
+    sa.Column('credits', sa.Integer(), nullable=False),
+    sa.Column('course_type', sa.String(length=20), nullable=False),
+    sa.Column('faculty_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['faculty_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_courses_id'), ['id'], unique=False)
+
+    op.create_table('forum_posts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=30), nullable=False),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('author_id', sa.Integer(), nullable=False),
+    sa.Column('upvotes', sa.Integer(), nullable=False),
+    sa.Column('downvotes', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('forum_posts', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_forum_posts_id'), ['id'], unique=False)
+
+    op.create_table('grievances',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('is_anonymous', sa.Boolean(), nullable=False),
+    sa.Column('submitted_by', sa.Integer(), nullable=False),
+    sa.Column('assigned_to', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['assigned_to'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['submitted_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('grievances', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_grievances_id'), ['id'], unique=False)
+
+    op.create_table('incidents',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=False),
+    sa.Column('latitude', sa.Float(), nullable=True),
+    sa.Column('longitude', sa.Float(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('resolved_at', sa.DateTime(), nullable=True),
+    sa.Column('resolution_notes', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('incidents', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_incidents_id'), ['id'], unique=False)
+
+    op.create_table('internships',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('company', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('location', sa.String(length=100), nullable=True),
+    sa.Column('stipend', sa.Integer(), nullable=True),
+    sa.Column('role_type', sa.String(length=30), nullable=False),
+    sa.Column('required_skills', sa.Text(), nullable=True),
+    sa.Column('duration', sa.String(length=50), nullable=True),
+    sa.Column('deadline', sa.Date(), nullable=True),
+    sa.Column('posted_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['posted_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('internships', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_internships_id'), ['id'], unique=False)
+
+    op.create_table('lost_found_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=True),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('category', sa.String(length=30), nullable=False),
+    sa.Column('item_type', sa.String(length=10), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('posted_by', sa.Integer(), nullable=False),
+    sa.Column('claimed_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['claimed_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['posted_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('lost_found_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_lost_found_items_id'), ['id'], unique=False)
+
+    op.create_table('mercenary_gigs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('budget', sa.String(length=100), nullable=True),
+    sa.Column('required_skills', sa.Text(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('posted_by', sa.Integer(), nullable=False),
+    sa.Column('assigned_to', sa.Integer(), nullable=True),
+    sa.Column('rating', sa.Integer(), nullable=True),
+    sa.Column('review_content', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['assigned_to'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['posted_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('mercenary_gigs', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_mercenary_gigs_id'), ['id'], unique=False)
+
+    op.create_table('resources',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('file_url', sa.String(length=500), nullable=False),
+    sa.Column('course_code', sa.String(length=20), nullable=True),
+    sa.Column('year', sa.String(length=10), nullable=True),
+    sa.Column('exam_type', sa.String(length=30), nullable=True),
+    sa.Column('resource_type', sa.String(length=30), nullable=False),
+    sa.Column('tags', sa.Text(), nullable=True),
+    sa.Column('uploaded_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['uploaded_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('resources', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_resources_id'), ['id'], unique=False)
+
+    op.create_table('tasks',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('category', sa.String(length=30), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_tasks_id'), ['id'], unique=False)
+
+    op.create_table('academic_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('event_date', sa.Date(), nullable=False),
+    sa.Column('event_type', sa.String(length=30), nullable=False),
+    sa.Column('course_id', sa.Integer(), nullable=True),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('academic_events', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_academic_events_id'), ['id'], unique=False)
+
+    op.create_table('applications',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('internship_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('resume_url', sa.String(length=500), nullable=True),
+    sa.Column('faculty_feedback', sa.Text(), nullable=True),
+    sa.Column('applied_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['internship_id'], ['internships.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_applications_id'), ['id'], unique=False)
+
+    op.create_table('attendance',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('course_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_attendance_id'), ['id'], unique=False)
+
+    op.create_table('club_announcements',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('club_announcements', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_club_announcements_id'), ['id'], unique=False)
+
+    op.create_table('club_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('event_date', sa.DateTime(), nullable=False),
+    sa.Column('location', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('club_events', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_club_events_id'), ['id'], unique=False)
+
+    op.create_table('club_members',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('club_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('role', sa.String(length=30), nullable=False),
+    sa.Column('joined_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['club_id'], ['clubs.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('club_members', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_club_members_id'), ['id'], unique=False)
+
+    op.create_table('enrollments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('course_id', sa.Integer(), nullable=False),
+    sa.Column('enrolled_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['course_id'], ['courses.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('enrollments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_enrollments_id'), ['id'], unique=False)
+
+    op.create_table('forum_comments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('parent_id', sa.Integer(), nullable=True),
+    sa.Column('author_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('upvotes', sa.Integer(), nullable=False),
+    sa.Column('downvotes', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['parent_id'], ['forum_comments.id'], ),
+    sa.ForeignKeyConstraint(['post_id'], ['forum_posts.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('forum_comments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_forum_comments_id'), ['id'], unique=False)
+
+    op.create_table('grievance_comments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('grievance_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['grievance_id'], ['grievances.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('grievance_comments', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_grievance_comments_id'), ['id'], unique=False)
+
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('grievance_comments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_grievance_comments_id'))
+
+    op.drop_table('grievance_comments')
+    with op.batch_alter_table('forum_comments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_forum_comments_id'))
+
+    op.drop_table('forum_comments')
+    with op.batch_alter_table('enrollments', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_enrollments_id'))
+
+    op.drop_table('enrollments')
+    with op.batch_alter_table('club_members', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_club_members_id'))
+
+    op.drop_table('club_members')
+    with op.batch_alter_table('club_events', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_club_events_id'))
+
+    op.drop_table('club_events')
+    with op.batch_alter_table('club_announcements', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_club_announcements_id'))
+
+    op.drop_table('club_announcements')
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_attendance_id'))
+
+    op.drop_table('attendance')
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_applications_id'))
+
+    op.drop_table('applications')
+    with op.batch_alter_table('academic_events', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_academic_events_id'))
+
+    op.drop_table('academic_events')
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_tasks_id'))
+
+    op.drop_table('tasks')
+    with op.batch_alter_table('resources', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_resources_id'))
+
+    op.drop_table('resources')
+    with op.batch_alter_table('mercenary_gigs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_mercenary_gigs_id'))
+
+    op.drop_table('mercenary_gigs')
+    with op.batch_alter_table('lost_found_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_lost_found_items_id'))
+
+    op.drop_table('lost_found_items')
+    with op.batch_alter_table('internships', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_internships_id'))
+
+    op.drop_table('internships')
+    with op.batch_alter_table('incidents', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_incidents_id'))
+
+    op.drop_table('incidents')
+    with op.batch_alter_table('grievances', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_grievances_id'))
+
+    op.drop_table('grievances')
+    with op.batch_alter_table('forum_posts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_forum_posts_id'))
+
+    op.drop_table('forum_posts')
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_courses_id'))
+
+    op.drop_table('courses')
+    with op.batch_alter_table('clubs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_clubs_id'))
+
+    op.drop_table('clubs')
+    with op.batch_alter_table('caravan_pools', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_caravan_pools_id'))
+
+    op.drop_table('caravan_pools')
+    with op.batch_alter_table('audit_logs', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_audit_logs_id'))
+
+    op.drop_table('audit_logs')
+    with op.batch_alter_table('announcements', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_announcements_id'))
+
+    op.drop_table('announcements')
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_id'))
+        batch_op.drop_index(batch_op.f('ix_users_email'))
+
+    op.drop_table('users')
+    with op.batch_alter_table('campus_locations', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_campus_locations_id'))
+
+    op.drop_table('campus_locations')
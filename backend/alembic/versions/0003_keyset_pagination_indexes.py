@@ -0,0 +1,69 @@
+"""keyset pagination indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 16:38:48.537421
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('announcements', schema=None) as batch_op:
+        batch_op.create_index('ix_announcements_pinned_created_at_id', ['pinned', 'created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('grievances', schema=None) as batch_op:
+        batch_op.create_index('ix_grievances_assigned_to_created_at_id', ['assigned_to', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_grievances_created_at_id', ['created_at', 'id'], unique=False)
+        batch_op.create_index('ix_grievances_status_created_at_id', ['status', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_grievances_submitted_by_created_at_id', ['submitted_by', 'created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('incidents', schema=None) as batch_op:
+        batch_op.create_index('ix_incidents_created_at_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('lost_found_items', schema=None) as batch_op:
+        batch_op.create_index('ix_lost_found_items_created_at_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('resources', schema=None) as batch_op:
+        batch_op.create_index('ix_resources_created_at_id', ['created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.create_index('ix_tasks_user_id_created_at_id', ['user_id', 'created_at', 'id'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_created_at_id', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_created_at_id')
+
+    with op.batch_alter_table('tasks', schema=None) as batch_op:
+        batch_op.drop_index('ix_tasks_user_id_created_at_id')
+
+    with op.batch_alter_table('resources', schema=None) as batch_op:
+        batch_op.drop_index('ix_resources_created_at_id')
+
+    with op.batch_alter_table('lost_found_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_lost_found_items_created_at_id')
+
+    with op.batch_alter_table('incidents', schema=None) as batch_op:
+        batch_op.drop_index('ix_incidents_created_at_id')
+
+    with op.batch_alter_table('grievances', schema=None) as batch_op:
+        batch_op.drop_index('ix_grievances_submitted_by_created_at_id')
+        batch_op.drop_index('ix_grievances_status_created_at_id')
+        batch_op.drop_index('ix_grievances_created_at_id')
+        batch_op.drop_index('ix_grievances_assigned_to_created_at_id')
+
+    with op.batch_alter_table('announcements', schema=None) as batch_op:
+        batch_op.drop_index('ix_announcements_pinned_created_at_id')
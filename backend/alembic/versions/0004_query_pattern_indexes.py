@@ -0,0 +1,114 @@
+"""query pattern indexes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 16:43:11.102206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _dedupe(table: str, columns: str, keep: str = "MIN") -> None:
+    """Drop rows that would violate a new unique index, keeping one per key."""
+    op.execute(f"DELETE FROM {table} WHERE id NOT IN (SELECT {keep}(id) FROM {table} GROUP BY {columns})")
+
+
+def upgrade() -> None:
+    # The old check-then-insert paths could race; unique indexes need clean data.
+    _dedupe("applications", "internship_id, student_id")
+    _dedupe("attendance", "student_id, course_id, date", keep="MAX")  # a re-mark overwrites the earlier one
+    _dedupe("club_members", "club_id, user_id")
+    _dedupe("enrollments", "student_id, course_id")
+
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.create_index('ix_applications_internship_id_student_id', ['internship_id', 'student_id'], unique=True)
+        batch_op.create_index('ix_applications_student_id', ['student_id'], unique=False)
+
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.create_index('ix_attendance_course_id_date', ['course_id', 'date'], unique=False)
+        batch_op.create_index('ix_attendance_student_id_course_id_date', ['student_id', 'course_id', 'date'], unique=True)
+
+    with op.batch_alter_table('club_announcements', schema=None) as batch_op:
+        batch_op.create_index('ix_club_announcements_club_id_created_at', ['club_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('club_events', schema=None) as batch_op:
+        batch_op.create_index('ix_club_events_club_id_event_date', ['club_id', 'event_date'], unique=False)
+
+    with op.batch_alter_table('club_members', schema=None) as batch_op:
+        batch_op.create_index('ix_club_members_club_id_user_id', ['club_id', 'user_id'], unique=True)
+
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.create_index('ix_courses_faculty_id', ['faculty_id'], unique=False)
+
+    with op.batch_alter_table('enrollments', schema=None) as batch_op:
+        batch_op.create_index('ix_enrollments_course_id', ['course_id'], unique=False)
+        batch_op.create_index('ix_enrollments_student_id_course_id', ['student_id', 'course_id'], unique=True)
+
+    with op.batch_alter_table('forum_comments', schema=None) as batch_op:
+        batch_op.create_index('ix_forum_comments_post_id_created_at', ['post_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('forum_posts', schema=None) as batch_op:
+        batch_op.create_index('ix_forum_posts_created_at', ['created_at'], unique=False)
+
+    with op.batch_alter_table('grievance_comments', schema=None) as batch_op:
+        batch_op.create_index('ix_grievance_comments_grievance_id_created_at', ['grievance_id', 'created_at'], unique=False)
+
+    with op.batch_alter_table('internships', schema=None) as batch_op:
+        batch_op.create_index('ix_internships_created_at_id', ['created_at', 'id'], unique=False)
+        batch_op.create_index('ix_internships_posted_by', ['posted_by'], unique=False)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index('ix_users_role_created_at_id', ['role', 'created_at', 'id'], unique=False)
+        batch_op.create_index('ix_users_status_created_at_id', ['status', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index('ix_users_status_created_at_id')
+        batch_op.drop_index('ix_users_role_created_at_id')
+
+    with op.batch_alter_table('internships', schema=None) as batch_op:
+        batch_op.drop_index('ix_internships_posted_by')
+        batch_op.drop_index('ix_internships_created_at_id')
+
+    with op.batch_alter_table('grievance_comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_grievance_comments_grievance_id_created_at')
+
+    with op.batch_alter_table('forum_posts', schema=None) as batch_op:
+        batch_op.drop_index('ix_forum_posts_created_at')
+
+    with op.batch_alter_table('forum_comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_forum_comments_post_id_created_at')
+
+    with op.batch_alter_table('enrollments', schema=None) as batch_op:
+        batch_op.drop_index('ix_enrollments_student_id_course_id')
+        batch_op.drop_index('ix_enrollments_course_id')
+
+    with op.batch_alter_table('courses', schema=None) as batch_op:
+        batch_op.drop_index('ix_courses_faculty_id')
+
+    with op.batch_alter_table('club_members', schema=None) as batch_op:
+        batch_op.drop_index('ix_club_members_club_id_user_id')
+
+    with op.batch_alter_table('club_events', schema=None) as batch_op:
+        batch_op.drop_index('ix_club_events_club_id_event_date')
+
+    with op.batch_alter_table('club_announcements', schema=None) as batch_op:
+        batch_op.drop_index('ix_club_announcements_club_id_created_at')
+
+    with op.batch_alter_table('attendance', schema=None) as batch_op:
+        batch_op.drop_index('ix_attendance_student_id_course_id_date')
+        batch_op.drop_index('ix_attendance_course_id_date')
+
+    with op.batch_alter_table('applications', schema=None) as batch_op:
+        batch_op.drop_index('ix_applications_student_id')
+        batch_op.drop_index('ix_applications_internship_id_student_id')
@@ -0,0 +1,49 @@
+"""stat counters
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 16:47:56.480196
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same totals as app.core.counters.reconcile(), in plain SQL so this revision
+# does not depend on the models as they evolve.
+BACKFILL = [
+    ("'grievances'", "grievances", None),
+    ("'grievances.status:' || status", "grievances", "status"),
+    ("'grievances.assignee:' || CAST(assigned_to AS VARCHAR)", "grievances", "assigned_to"),
+    ("'users'", "users", None),
+    ("'users.role:' || role", "users", "role"),
+    ("'courses'", "courses", None),
+    ("'internships'", "internships", None),
+]
+
+
+def upgrade() -> None:
+    op.create_table('stat_counters',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    for name, table, column in BACKFILL:
+        if column is None:
+            op.execute(f"INSERT INTO stat_counters (name, value) SELECT {name}, COUNT(*) FROM {table}")
+        else:
+            op.execute(
+                f"INSERT INTO stat_counters (name, value) SELECT {name}, COUNT(*) FROM {table} "
+                f"WHERE {column} IS NOT NULL GROUP BY {column}"
+            )
+
+def downgrade() -> None:
+    op.drop_table('stat_counters')
\ No newline at end of file
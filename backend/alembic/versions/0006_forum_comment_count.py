@@ -0,0 +1,33 @@
+"""forum comment count
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 16:51:43.002237
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('forum_posts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute(
+        "UPDATE forum_posts SET comment_count = "
+        "(SELECT COUNT(*) FROM forum_comments WHERE forum_comments.post_id = forum_posts.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('forum_posts', schema=None) as batch_op:
+        batch_op.drop_column('comment_count')
@@ -0,0 +1,36 @@
+"""forum votes
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 16:54:32.945805
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing upvotes/downvotes were cast before votes were recorded per user and
+    # are kept as they are; only new votes get rows here.
+    op.create_table('forum_votes',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('value', sa.SmallInteger(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['post_id'], ['forum_posts.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('post_id', 'user_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('forum_votes')
@@ -1,39 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.conditional import ANNOUNCEMENTS, USER_NAMES, bump, collection_validators_async
+from app.core.database import get_db, get_async_db
+from app.core.deps import get_current_user, get_current_user_async
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.announcement import Announcement
 from app.schemas.announcement import AnnouncementCreate, AnnouncementResponse
 
 router = APIRouter(prefix="/api/announcements", tags=["Announcements"])
 
+# Pinned first, then by date
+_keyset = Keyset(Announcement.pinned, Announcement.created_at, Announcement.id)
+
 
 @router.get("/", response_model=list[AnnouncementResponse])
-def list_announcements(
+async def list_announcements(
+    request: Request,
     category: str | None = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    q = db.query(Announcement)
+    validators = await collection_validators_async(db, (ANNOUNCEMENTS, USER_NAMES), category, page)
+    if validators.matches(request):
+        return validators.not_modified()
+
+    q = select(Announcement).options(joinedload(Announcement.poster).load_only(User.name))
     if category:
-        q = q.filter(Announcement.category == category)
-    # Pinned first, then by date
-    announcements = q.order_by(Announcement.pinned.desc(), Announcement.created_at.desc()).all()
-    return [
-        AnnouncementResponse(
-            id=a.id,
-            title=a.title,
-            content=a.content,
-            category=a.category,
-            pinned=a.pinned,
-            posted_by=a.posted_by,
-            poster_name=a.poster.name if a.poster else None,
-            created_at=a.created_at,
-        )
+        q = q.where(Announcement.category == category)
+    announcements, next_cursor = _keyset.page(await db.scalars(_keyset.apply(q, page)), page)
+    response = FastJSONResponse([
+        project(a, AnnouncementResponse, poster_name=a.poster.name if a.poster else None)
         for a in announcements
-    ]
+    ])
+    link_next(response, request, next_cursor)
+    return validators.apply(response)
 
 
 @router.post("/", response_model=AnnouncementResponse)
@@ -52,6 +58,7 @@ def create_announcement(
         posted_by=current_user.id,
     )
     db.add(a)
+    bump(db, ANNOUNCEMENTS)
     db.commit()
     db.refresh(a)
     return AnnouncementResponse(
@@ -74,5 +81,6 @@ def delete_announcement(
     if a.posted_by != current_user.id and current_user.role != "admin":
         raise HTTPException(403, "Not authorized")
     db.delete(a)
+    bump(db, ANNOUNCEMENTS)
     db.commit()
     return {"detail": "Deleted"}
@@ -1,15 +1,62 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from datetime import date
+from typing import Literal
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.cache import TTLCache
+from app.core.conditional import (
+    ATTENDANCE, COURSES, ENROLLMENTS, USER_NAMES, attendance_course, bump, collection_validators,
+)
+from app.core.config import settings
 from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, require_role
+from app.core.pagination import PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse
 from app.models.user import User
 from app.models.attendance import Attendance
-from app.models.course import Enrollment
-from app.schemas.attendance import AttendanceCreate, AttendanceResponse
+from app.models.course import Course, Enrollment
+from app.schemas.attendance import (
+    AttendanceCreate,
+    AttendanceMatrix,
+    AttendanceResponse,
+    AtRiskAttendance,
+    CourseAttendanceReport,
+    CourseAttendanceSummary,
+    RosterAttendance,
+    RosterAttendanceResult,
+)
+from app.services import attendance_matrix, attendance_reports, attendance_roster
 
 router = APIRouter(prefix="/api/attendance", tags=["Attendance"])
 
+# Course report rows keyed on the course's versions ETag (before the threshold
+# is mixed in, so one entry serves every threshold): a write in any worker
+# changes the key.
+_course_report_cache = TTLCache(maxsize=256, ttl=settings.ATTENDANCE_REPORT_CACHE_TTL_SECONDS)
+
+
+def _threshold_param(
+    threshold: float = Query(
+        settings.ATTENDANCE_THRESHOLD_PERCENT, ge=0, le=100, description="At-risk cut-off, in percent",
+    ),
+) -> float:
+    return threshold
+
+
+def _staff_course(db: Session, course_id: int, current_user: User):
+    """The course row, or 404; faculty only reach their own courses."""
+    course = db.execute(
+        select(Course.id, Course.code, Course.name, Course.faculty_id).where(Course.id == course_id)
+    ).first()
+    if course is None:
+        raise HTTPException(404, "Course not found")
+    if current_user.role == "faculty" and course.faculty_id != current_user.id:
+        raise HTTPException(403, "Not your course")
+    return course
+
 
 @router.get("/", response_model=list[AttendanceResponse])
 def get_my_attendance(
@@ -17,7 +64,11 @@ def get_my_attendance(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(Attendance).filter(Attendance.student_id == current_user.id)
+    q = (
+        db.query(Attendance)
+        .options(joinedload(Attendance.course).load_only(Course.name, Course.code))
+        .filter(Attendance.student_id == current_user.id)
+    )
     if course_id:
         q = q.filter(Attendance.course_id == course_id)
     records = q.order_by(Attendance.date.desc()).all()
@@ -46,18 +97,22 @@ def mark_attendance(
     if current_user.role != "student":
         raise HTTPException(403, "Only students can mark attendance")
     # Check enrollment
-    enrollment = db.query(Enrollment).filter(
+    enrollment = db.query(Enrollment).options(
+        joinedload(Enrollment.course).load_only(Course.name, Course.code)
+    ).filter(
         Enrollment.student_id == current_user.id,
         Enrollment.course_id == data.course_id
     ).first()
     if not enrollment:
         raise HTTPException(400, "You are not enrolled in this course")
+    course_name, course_code = enrollment.course.name, enrollment.course.code
     # Check if already marked
     existing = db.query(Attendance).filter(
         Attendance.student_id == current_user.id,
         Attendance.course_id == data.course_id,
         Attendance.date == data.date,
     ).first()
+    bump(db, ATTENDANCE, attendance_course(data.course_id))
     if existing:
         existing.status = data.status
         db.commit()
@@ -77,38 +132,141 @@ def mark_attendance(
         id=rec.id,
         student_id=rec.student_id,
         course_id=rec.course_id,
-        course_name=rec.course.name if rec.course else None,
-        course_code=rec.course.code if rec.course else None,
+        course_name=course_name,
+        course_code=course_code,
         date=rec.date,
         status=rec.status,
         created_at=rec.created_at,
     )
 
 
-@router.get("/summary")
+@router.post("/courses/{course_id}/roster", response_model=RosterAttendanceResult)
+def mark_roster_attendance(
+    course_id: int,
+    data: RosterAttendance,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("faculty", "admin")),
+):
+    """Mark a class roster for one day in one transaction (the course's faculty or admin).
+
+    Students already marked for that day get the new status.
+    """
+    _staff_course(db, course_id, current_user)
+    marks = {mark.student_id: mark.status for mark in data.marks}
+    if not marks:
+        raise HTTPException(400, "The roster is empty")
+    if len(marks) != len(data.marks):
+        raise HTTPException(400, "A student appears more than once in the roster")
+    invalid = sorted({status for status in marks.values() if status not in attendance_roster.VALID_STATUSES})
+    if invalid:
+        raise HTTPException(400, f"Invalid status: {', '.join(invalid)}")
+    missing = attendance_roster.not_enrolled(db, course_id, marks)
+    if missing:
+        raise HTTPException(400, f"Not enrolled in this course: {', '.join(map(str, missing))}")
+
+    attendance_roster.mark_roster(db, course_id, data.date, marks)
+    bump(db, ATTENDANCE, attendance_course(course_id))
+    db.commit()
+    return RosterAttendanceResult(course_id=course_id, date=data.date, marked=len(marks))
+
+
+@router.get("/summary", response_model=list[CourseAttendanceSummary])
 def attendance_summary(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get attendance percentage per enrolled course."""
-    enrollments = db.query(Enrollment).filter(Enrollment.student_id == current_user.id).all()
-    summary = []
-    for e in enrollments:
-        total = db.query(Attendance).filter(
-            Attendance.student_id == current_user.id,
-            Attendance.course_id == e.course_id,
-        ).count()
-        present = db.query(Attendance).filter(
-            Attendance.student_id == current_user.id,
-            Attendance.course_id == e.course_id,
-            Attendance.status == "present",
-        ).count()
-        summary.append({
-            "course_id": e.course_id,
-            "course_name": e.course.name if e.course else None,
-            "course_code": e.course.code if e.course else None,
-            "total_classes": total,
-            "present": present,
-            "percentage": round(present / total * 100, 1) if total > 0 else 0,
-        })
-    return summary
+    return FastJSONResponse(attendance_reports.student_summary(db, current_user.id))
+
+
+@router.get("/courses/{course_id}/report", response_model=CourseAttendanceReport)
+def course_attendance_report(
+    course_id: int,
+    request: Request,
+    threshold: float = Depends(_threshold_param),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("faculty", "admin", "authority")),
+):
+    """Per-student attendance for a whole course (its faculty, admin or authority)."""
+    course = _staff_course(db, course_id, current_user)
+    report = collection_validators(db, (attendance_course(course_id), ENROLLMENTS, COURSES, USER_NAMES), course_id)
+    validators = report.vary(threshold)
+    if validators.matches(request):
+        return validators.not_modified()
+
+    students = _course_report_cache.get(report.etag)
+    if students is None:
+        students = tuple(attendance_reports.course_report(db, course_id))
+        _course_report_cache.set(report.etag, students)
+    return validators.apply(FastJSONResponse({
+        "course_id": course.id,
+        "course_code": course.code,
+        "course_name": course.name,
+        "threshold": threshold,
+        "students": attendance_reports.flag_at_risk(students, threshold),
+    }))
+
+
+@router.get("/at-risk", response_model=list[AtRiskAttendance])
+def at_risk_report(
+    request: Request,
+    threshold: float = Depends(_threshold_param),
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("faculty", "admin", "authority")),
+):
+    """Students under the attendance threshold in any course; faculty see their own courses.
+
+    Paged by student id, then course id, both descending. (Before paging, the
+    list was ordered by course code, then student name.)
+    """
+    faculty_id = current_user.id if current_user.role == "faculty" else None
+    validators = collection_validators(
+        db, (ATTENDANCE, ENROLLMENTS, COURSES, USER_NAMES), faculty_id, threshold, page.cursor, page.limit,
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+
+    rows, next_cursor = attendance_reports.below_threshold(db, threshold, page, faculty_id)
+    response = FastJSONResponse(rows)
+    link_next(response, request, next_cursor)
+    return validators.apply(response)
+
+
+@router.get("/courses/{course_id}/matrix", response_model=AttendanceMatrix)
+def course_attendance_matrix(
+    course_id: int,
+    request: Request,
+    date_from: date | None = Query(None, description="First date included"),
+    date_to: date | None = Query(None, description="Last date included"),
+    format: Literal["json", "csv"] = Query("json", description="json (columnar) or csv (one row per student)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("faculty", "admin", "authority")),
+):
+    """Students × dates attendance grid for a course (its faculty, admin or authority).
+
+    Courses with more than ATTENDANCE_MATRIX_STREAM_ROWS students are streamed.
+    """
+    course = _staff_course(db, course_id, current_user)
+    validators = collection_validators(
+        db, (attendance_course(course_id), ENROLLMENTS, COURSES, USER_NAMES), course_id, date_from, date_to, format,
+    )
+    if validators.matches(request):
+        return validators.not_modified()
+
+    matrix = attendance_matrix.build(db, course_id, date_from, date_to)
+    rows_per_chunk = settings.ATTENDANCE_MATRIX_STREAM_ROWS
+    if format == "csv":
+        chunks = attendance_matrix.csv_chunks(matrix, rows_per_chunk)
+        media_type = "text/csv"
+        headers = {"Content-Disposition": f'attachment; filename="attendance-course-{course.id}.csv"'}
+    else:
+        header = {"course_id": course.id, "course_code": course.code, "course_name": course.name}
+        chunks = attendance_matrix.json_chunks(matrix, header, rows_per_chunk)
+        media_type = "application/json"
+        headers = {}
+    if len(matrix) > rows_per_chunk:
+        response = StreamingResponse(chunks, media_type=media_type, headers=headers)
+    else:
+        response = Response(b"".join(chunks), media_type=media_type, headers=headers)
+    return validators.apply(response)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.counters import added, adjust_async, user_counters
+from app.core.database import get_async_db
+from app.core.security import hash_password_async, verify_password_async, create_access_token
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, TokenResponse
@@ -11,7 +13,7 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(data: UserCreate, db: Session = Depends(get_db)):
+async def register(data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user."""
     from app.core.config import settings
     
@@ -23,7 +25,7 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
         )
 
     # Check if email already exists
-    existing = db.query(User).filter(User.email == data.email).first()
+    existing = await db.scalar(select(User.id).where(User.email == data.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
@@ -36,24 +38,28 @@ def register(data: UserCreate, db: Session = Depends(get_db)):
     user = User(
         email=data.email,
         name=data.name,
-        hashed_password=hash_password(data.password),
+        hashed_password=await hash_password_async(data.password),
         role=data.role,
         department=data.department,
         status="pending"
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await adjust_async(db, added(user_counters(user.role)))
+    await db.commit()
+    await db.refresh(user)
 
     return UserResponse.model_validate(user)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(data: UserLogin, db: Session = Depends(get_db)):
+async def login(data: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Login with email and password."""
-    user = db.query(User).filter(User.email == data.email).first()
-    
-    if not user or not verify_password(data.password, user.hashed_password):
+    user = await db.scalar(select(User).where(User.email == data.email))
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid email or password")
+
+    valid, new_hash = await verify_password_async(data.password, user.hashed_password)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     if user.status == "pending":
@@ -68,6 +74,11 @@ def login(data: UserLogin, db: Session = Depends(get_db)):
             detail="Your registration request was rejected. Contact admin for details."
         )
 
+    if new_hash:
+        # Stored hash predates the current BCRYPT_ROUNDS; upgrade it transparently.
+        user.hashed_password = new_hash
+        await db.commit()
+
     token = create_access_token({"sub": str(user.id), "role": user.role})
 
     return TokenResponse(
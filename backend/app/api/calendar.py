@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.conditional import CALENDAR_EVENTS, USER_NAMES, bump, collection_validators
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.academic_event import AcademicEvent
+from app.models.course import Course
 from app.schemas.academic_event import AcademicEventCreate, AcademicEventResponse
 
 router = APIRouter(prefix="/api/calendar", tags=["Academic Calendar"])
@@ -12,32 +16,34 @@ router = APIRouter(prefix="/api/calendar", tags=["Academic Calendar"])
 
 @router.get("/events", response_model=list[AcademicEventResponse])
 def list_events(
+    request: Request,
     event_type: str | None = None,
     course_id: int | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(AcademicEvent)
+    validators = collection_validators(db, (CALENDAR_EVENTS, USER_NAMES), event_type, course_id)
+    if validators.matches(request):
+        return validators.not_modified()
+
+    q = db.query(AcademicEvent).options(
+        joinedload(AcademicEvent.course).load_only(Course.name),
+        joinedload(AcademicEvent.creator).load_only(User.name),
+    )
     if event_type:
         q = q.filter(AcademicEvent.event_type == event_type)
     if course_id:
         q = q.filter(AcademicEvent.course_id == course_id)
     events = q.order_by(AcademicEvent.event_date.asc()).all()
-    return [
-        AcademicEventResponse(
-            id=e.id,
-            title=e.title,
-            description=e.description,
-            event_date=e.event_date,
-            event_type=e.event_type,
-            course_id=e.course_id,
+    return validators.apply(FastJSONResponse([
+        project(
+            e,
+            AcademicEventResponse,
             course_name=e.course.name if e.course else None,
-            created_by=e.created_by,
             creator_name=e.creator.name if e.creator else None,
-            created_at=e.created_at,
         )
         for e in events
-    ]
+    ]))
 
 
 @router.post("/events", response_model=AcademicEventResponse)
@@ -57,6 +63,7 @@ def create_event(
         created_by=current_user.id,
     )
     db.add(e)
+    bump(db, CALENDAR_EVENTS)
     db.commit()
     db.refresh(e)
     return AcademicEventResponse(
@@ -66,7 +73,7 @@ def create_event(
         event_date=e.event_date,
         event_type=e.event_type,
         course_id=e.course_id,
-        course_name=e.course.name if e.course else None,
+        course_name=db.scalar(select(Course.name).where(Course.id == e.course_id)) if e.course_id else None,
         created_by=e.created_by,
         creator_name=current_user.name,
         created_at=e.created_at,
@@ -85,5 +92,6 @@ def delete_event(
     if e.created_by != current_user.id and current_user.role != "admin":
         raise HTTPException(403, "Not authorized")
     db.delete(e)
+    bump(db, CALENDAR_EVENTS)
     db.commit()
     return {"detail": "Deleted"}
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
 from typing import List
 
+from app.core.conditional import CLUBS, USER_NAMES, bump, collection_validators
 from app.core.database import get_db
+from app.core.responses import FastJSONResponse
 from app.core.deps import get_current_user, require_role
 from app.models.user import User
 from app.models.clubs import Club, ClubMember, ClubEvent, ClubAnnouncement
@@ -17,6 +21,8 @@ class ClubCreate(BaseModel):
 
 router = APIRouter(prefix="/api/clubs", tags=["The Spirit - Clubs"])
 
+_with_lead = joinedload(Club.lead).load_only(User.name)
+
 @router.post("/", status_code=201)
 def create_club(
     data: ClubCreate,
@@ -31,6 +37,7 @@ def create_club(
         lead_id=data.lead_id
     )
     db.add(club)
+    bump(db, CLUBS)
     db.commit()
     db.refresh(club)
     return club
@@ -45,23 +52,38 @@ def delete_club(
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
     db.delete(club)
+    bump(db, CLUBS)
     db.commit()
     return {"message": "Club deleted"}
 
 @router.get("/", response_model=List[dict])
-def list_clubs(db: Session = Depends(get_db)):
-    clubs = db.query(Club).all()
-    return [
+def list_clubs(request: Request, db: Session = Depends(get_db)):
+    validators = collection_validators(db, (CLUBS, USER_NAMES))
+    if validators.matches(request):
+        return validators.not_modified()
+
+    member_counts = (
+        db.query(ClubMember.club_id, func.count().label("member_count"))
+        .group_by(ClubMember.club_id)
+        .subquery()
+    )
+    clubs = (
+        db.query(Club, func.coalesce(member_counts.c.member_count, 0))
+        .outerjoin(member_counts, member_counts.c.club_id == Club.id)
+        .options(_with_lead)
+        .all()
+    )
+    return validators.apply(FastJSONResponse([
         {
             "id": c.id,
             "name": c.name,
             "description": c.description,
             "category": c.category,
             "logo_url": c.logo_url,
-            "member_count": len(c.members),
+            "member_count": member_count,
             "lead": c.lead.name if c.lead else "Unknown"
-        } for c in clubs
-    ]
+        } for c, member_count in clubs
+    ]))
 
 @router.post("/{club_id}/join")
 def join_club(
@@ -69,6 +91,8 @@ def join_club(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    if not db.query(Club.id).filter(Club.id == club_id).first():
+        raise HTTPException(status_code=404, detail="Club not found")
     # Check if already a member
     existing = db.query(ClubMember).filter(ClubMember.club_id == club_id, ClubMember.user_id == current_user.id).first()
     if existing:
@@ -76,15 +100,21 @@ def join_club(
     
     member = ClubMember(club_id=club_id, user_id=current_user.id)
     db.add(member)
-    db.commit()
+    bump(db, CLUBS)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return {"message": "Already a member"}
     return {"message": "Joined club successfully"}
 
 @router.get("/{club_id}", response_model=dict)
 def get_club_detail(club_id: int, db: Session = Depends(get_db)):
-    club = db.query(Club).filter(Club.id == club_id).first()
+    club = db.query(Club).options(_with_lead).filter(Club.id == club_id).first()
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
     
+    member_count = db.query(func.count(ClubMember.id)).filter(ClubMember.club_id == club_id).scalar()
     events = db.query(ClubEvent).filter(ClubEvent.club_id == club_id).order_by(ClubEvent.event_date.asc()).all()
     announcements = db.query(ClubAnnouncement).filter(ClubAnnouncement.club_id == club_id).order_by(ClubAnnouncement.created_at.desc()).all()
     
@@ -95,7 +125,7 @@ def get_club_detail(club_id: int, db: Session = Depends(get_db)):
         "category": club.category,
         "logo_url": club.logo_url,
         "lead": club.lead.name if club.lead else "Unknown",
-        "member_count": len(club.members),
+        "member_count": member_count,
         "events": [
             {
                 "id": e.id,
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from typing import List
 from datetime import datetime
 
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/api/commons", tags=["The Commons"])
 
 @router.get("/caravan", response_model=List[dict])
 def list_caravans(db: Session = Depends(get_db)):
-    caravans = db.query(CaravanPool).all()
+    caravans = db.query(CaravanPool).options(joinedload(CaravanPool.poster).load_only(User.name)).all()
     return [
         {
             "id": c.id,
@@ -52,7 +52,7 @@ def create_caravan(
 
 @router.get("/mercenary", response_model=List[dict])
 def list_gigs(db: Session = Depends(get_db)):
-    gigs = db.query(MercenaryGig).all()
+    gigs = db.query(MercenaryGig).options(joinedload(MercenaryGig.poster).load_only(User.name)).all()
     return [
         {
             "id": g.id,
@@ -1,8 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.core.deps import get_current_user, require_role
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.cache import TTLCache
+from app.core.conditional import COURSES, ENROLLMENTS, USER_NAMES, bump, collection_validators_async
+from app.core.config import settings
+from app.core.counters import TOTAL_COURSES, added, adjust
+from app.core.database import get_db, get_async_db
+from app.core.deps import get_current_user_async, require_role, require_role_async
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.course import Course, Enrollment
 from app.schemas.course import CourseCreate, CourseResponse, EnrollmentCreate, EnrollmentResponse
@@ -10,38 +18,57 @@ from app.schemas.course import CourseCreate, CourseResponse, EnrollmentCreate, E
 router = APIRouter(prefix="/api/courses", tags=["Courses"])
 
 
+# Everything the catalog body depends on; create_course and enroll_in_course bump these.
+_CATALOG = (COURSES, ENROLLMENTS, USER_NAMES)
+
+# Catalog snapshots (course rows + faculty names + enrollment counts) shared by
+# all viewers, keyed on the catalog ETag: a write anywhere changes the key.
+_catalog_cache = TTLCache(maxsize=4, ttl=settings.COURSE_CATALOG_CACHE_TTL_SECONDS)
+
+
+async def _catalog_snapshot(db: AsyncSession) -> tuple[dict, ...]:
+    counts = (
+        select(Enrollment.course_id, func.count().label("enrollment_count"))
+        .group_by(Enrollment.course_id)
+        .subquery()
+    )
+    rows = await db.execute(
+        select(
+            Course.__table__,
+            User.name.label("faculty_name"),
+            func.coalesce(counts.c.enrollment_count, 0).label("enrollment_count"),
+        )
+        .outerjoin(User, User.id == Course.faculty_id)
+        .outerjoin(counts, counts.c.course_id == Course.id)
+        .order_by(Course.created_at.desc())
+    )
+    return tuple(project(row, CourseResponse) for row in rows)
+
+
 @router.get("/", response_model=list[CourseResponse])
-def list_courses(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def list_courses(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
     """List all courses with enrollment info."""
-    courses = db.query(Course).order_by(Course.created_at.desc()).all()
-    result = []
-    for c in courses:
-        enrollment_count = db.query(Enrollment).filter(Enrollment.course_id == c.id).count()
-        is_enrolled = False
-        if current_user.role == "student":
-            is_enrolled = db.query(Enrollment).filter(
-                Enrollment.course_id == c.id,
-                Enrollment.student_id == current_user.id,
-            ).first() is not None
-
-        result.append(CourseResponse(
-            id=c.id,
-            name=c.name,
-            code=c.code,
-            description=c.description,
-            semester=c.semester,
-            credits=c.credits,
-            course_type=c.course_type,
-            faculty_id=c.faculty_id,
-            faculty_name=c.faculty.name if c.faculty else None,
-            created_at=c.created_at,
-            enrollment_count=enrollment_count,
-            is_enrolled=is_enrolled,
-        ))
-    return result
+    catalog = await collection_validators_async(db, _CATALOG)
+    # is_enrolled is per student; everyone else gets the same body.
+    viewer = current_user.id if current_user.role == "student" else None
+    validators = catalog.vary(viewer)
+    if validators.matches(request):
+        return validators.not_modified()
+
+    snapshot = _catalog_cache.get(catalog.etag)
+    if snapshot is None:
+        snapshot = await _catalog_snapshot(db)
+        _catalog_cache.set(catalog.etag, snapshot)
+
+    if viewer is None:
+        return validators.apply(FastJSONResponse(snapshot))
+    enrolled = set(await db.scalars(select(Enrollment.course_id).where(Enrollment.student_id == viewer)))
+    result = [{**course, "is_enrolled": course["id"] in enrolled} for course in snapshot]
+    return validators.apply(FastJSONResponse(result))
 
 
 @router.post("/", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
@@ -65,6 +92,8 @@ def create_course(
         faculty_id=current_user.id,
     )
     db.add(course)
+    adjust(db, added([TOTAL_COURSES]))
+    bump(db, COURSES)
     db.commit()
     db.refresh(course)
 
@@ -103,7 +132,13 @@ def enroll_in_course(
 
     enrollment = Enrollment(student_id=current_user.id, course_id=data.course_id)
     db.add(enrollment)
-    db.commit()
+    bump(db, ENROLLMENTS)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request enrolled first (unique student_id, course_id).
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Already enrolled in this course")
     db.refresh(enrollment)
 
     return EnrollmentResponse(
@@ -119,12 +154,16 @@ def enroll_in_course(
 
 
 @router.get("/my-enrollments", response_model=list[EnrollmentResponse])
-def my_enrollments(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role("student")),
+async def my_enrollments(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_role_async("student")),
 ):
     """Get current student's enrollments."""
-    enrollments = db.query(Enrollment).filter(Enrollment.student_id == current_user.id).all()
+    enrollments = (await db.scalars(
+        select(Enrollment)
+        .options(joinedload(Enrollment.course).load_only(Course.name, Course.code, Course.credits, Course.course_type))
+        .where(Enrollment.student_id == current_user.id)
+    )).all()
     return [
         EnrollmentResponse(
             id=e.id,
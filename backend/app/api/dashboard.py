@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core import counters
+from app.core.database import get_async_db
+from app.core.deps import get_current_user_async
 from app.models.user import User
 from app.models.grievance import Grievance
 from app.models.course import Course, Enrollment
@@ -11,94 +13,100 @@ from app.models.internship import Internship, Application
 router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
 
+def _count_if(condition):
+    """COUNT of the rows matching `condition`, as one column of a conditional aggregate."""
+    return func.count(case((condition, 1)))
+
+
+def _subcount(model, *criteria):
+    """COUNT(*) over `model` as a scalar subquery, so several counts share one round trip."""
+    return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+
 @router.get("/stats")
-def get_dashboard_stats(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def get_dashboard_stats(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
     """Return role-aware dashboard statistics."""
     role = current_user.role
 
     if role == "student":
-        total_grievances = db.query(Grievance).filter(Grievance.submitted_by == current_user.id).count()
-        pending = db.query(Grievance).filter(Grievance.submitted_by == current_user.id, Grievance.status == "pending").count()
-        in_review = db.query(Grievance).filter(Grievance.submitted_by == current_user.id, Grievance.status == "in_review").count()
-        resolved = db.query(Grievance).filter(Grievance.submitted_by == current_user.id, Grievance.status == "resolved").count()
-        enrolled_courses = db.query(Enrollment).filter(Enrollment.student_id == current_user.id).count()
-        applied_internships = db.query(Application).filter(Application.student_id == current_user.id).count()
+        row = (await db.execute(
+            select(
+                func.count().label("total_grievances"),
+                _count_if(Grievance.status == "pending").label("pending"),
+                _count_if(Grievance.status == "in_review").label("in_review"),
+                _count_if(Grievance.status == "resolved").label("resolved"),
+                _subcount(Enrollment, Enrollment.student_id == current_user.id).label("enrolled_courses"),
+                _subcount(Application, Application.student_id == current_user.id).label("applied_internships"),
+            ).where(Grievance.submitted_by == current_user.id)
+        )).one()
 
-        return {
-            "role": role,
-            "stats": {
-                "total_grievances": total_grievances,
-                "pending": pending,
-                "in_review": in_review,
-                "resolved": resolved,
-                "enrolled_courses": enrolled_courses,
-                "applied_internships": applied_internships,
-            },
-        }
+        return {"role": role, "stats": dict(row._mapping)}
 
     elif role == "faculty":
-        my_courses = db.query(Course).filter(Course.faculty_id == current_user.id).count()
-        total_students = (
-            db.query(Enrollment)
-            .join(Course, Enrollment.course_id == Course.id)
-            .filter(Course.faculty_id == current_user.id)
-            .count()
-        )
-        my_internships = db.query(Internship).filter(Internship.posted_by == current_user.id).count()
+        row = (await db.execute(
+            select(
+                _subcount(Course, Course.faculty_id == current_user.id).label("my_courses"),
+                select(func.count())
+                .select_from(Enrollment)
+                .join(Course, Enrollment.course_id == Course.id)
+                .where(Course.faculty_id == current_user.id)
+                .scalar_subquery()
+                .label("total_students"),
+                _subcount(Internship, Internship.posted_by == current_user.id).label("posted_internships"),
+            )
+        )).one()
 
-        return {
-            "role": role,
-            "stats": {
-                "my_courses": my_courses,
-                "total_students": total_students,
-                "posted_internships": my_internships,
-            },
-        }
+        return {"role": role, "stats": dict(row._mapping)}
 
     elif role == "authority":
-        total = db.query(Grievance).count()
-        pending = db.query(Grievance).filter(Grievance.status == "pending").count()
-        in_review = db.query(Grievance).filter(Grievance.status == "in_review").count()
-        resolved = db.query(Grievance).filter(Grievance.status == "resolved").count()
-        rejected = db.query(Grievance).filter(Grievance.status == "rejected").count()
-        assigned_to_me = db.query(Grievance).filter(Grievance.assigned_to == current_user.id).count()
+        # Institution-wide totals come from stat_counters (app.core.counters): one lookup, no scan.
+        totals = await counters.read_async(
+            db,
+            counters.TOTAL_GRIEVANCES,
+            *(counters.grievance_status(s) for s in ("pending", "in_review", "resolved", "rejected")),
+            counters.grievance_assignee(current_user.id),
+        )
 
         return {
             "role": role,
             "stats": {
-                "total_grievances": total,
-                "pending": pending,
-                "in_review": in_review,
-                "resolved": resolved,
-                "rejected": rejected,
-                "assigned_to_me": assigned_to_me,
+                "total_grievances": totals[counters.TOTAL_GRIEVANCES],
+                "pending": totals[counters.grievance_status("pending")],
+                "in_review": totals[counters.grievance_status("in_review")],
+                "resolved": totals[counters.grievance_status("resolved")],
+                "rejected": totals[counters.grievance_status("rejected")],
+                "assigned_to_me": totals[counters.grievance_assignee(current_user.id)],
             },
         }
 
     elif role == "admin":
-        total_users = db.query(User).count()
-        students = db.query(User).filter(User.role == "student").count()
-        faculty = db.query(User).filter(User.role == "faculty").count()
-        authorities = db.query(User).filter(User.role == "authority").count()
-        total_grievances = db.query(Grievance).count()
-        active_grievances = db.query(Grievance).filter(Grievance.status.in_(["pending", "in_review"])).count()
-        total_courses = db.query(Course).count()
-        total_internships = db.query(Internship).count()
+        totals = await counters.read_async(
+            db,
+            counters.TOTAL_USERS,
+            *(counters.user_role(r) for r in ("student", "faculty", "authority")),
+            counters.TOTAL_GRIEVANCES,
+            counters.grievance_status("pending"),
+            counters.grievance_status("in_review"),
+            counters.TOTAL_COURSES,
+            counters.TOTAL_INTERNSHIPS,
+        )
 
         return {
             "role": role,
             "stats": {
-                "total_users": total_users,
-                "students": students,
-                "faculty": faculty,
-                "authorities": authorities,
-                "total_grievances": total_grievances,
-                "active_grievances": active_grievances,
-                "total_courses": total_courses,
-                "total_internships": total_internships,
+                "total_users": totals[counters.TOTAL_USERS],
+                "students": totals[counters.user_role("student")],
+                "faculty": totals[counters.user_role("faculty")],
+                "authorities": totals[counters.user_role("authority")],
+                "total_grievances": totals[counters.TOTAL_GRIEVANCES],
+                "active_grievances": (
+                    totals[counters.grievance_status("pending")] + totals[counters.grievance_status("in_review")]
+                ),
+                "total_courses": totals[counters.TOTAL_COURSES],
+                "total_internships": totals[counters.TOTAL_INTERNSHIPS],
             },
         }
 
@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import datetime, timezone
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse
 from app.models.user import User
 from app.models.incident import Incident
 
 router = APIRouter(prefix="/api/emergency", tags=["Guardian's Flare"])
 
+_keyset = Keyset(Incident.created_at, Incident.id)
+
 @router.post("/sos")
 def trigger_sos(
     latitude: Optional[float] = None,
@@ -35,14 +39,17 @@ def trigger_sos(
 
 @router.get("/incidents", response_model=List[dict])
 def list_incidents(
+    request: Request,
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     if current_user.role not in ("admin", "authority"):
         raise HTTPException(status_code=403, detail="Not authorized to view medical/security incidents")
     
-    incidents = db.query(Incident).order_by(Incident.created_at.desc()).all()
-    return [
+    query = db.query(Incident).options(joinedload(Incident.user).load_only(User.name))
+    incidents, next_cursor = _keyset.page(_keyset.apply(query, page).all(), page)
+    response = FastJSONResponse([
         {
             "id": i.id,
             "user": i.user.name,
@@ -50,4 +57,6 @@ def list_incidents(
             "location": {"lat": i.latitude, "lng": i.longitude},
             "created_at": i.created_at
         } for i in incidents
-    ]
+    ])
+    link_next(response, request, next_cursor)
+    return response
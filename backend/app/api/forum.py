@@ -1,75 +1,134 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.pagination import Keyset, PageParams, invalid_cursor, link_next, page_params
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
-from app.models.forum import ForumPost, ForumComment
+from app.models.forum import ForumPost, ForumComment, ForumVote
 from app.schemas.forum import (
     ForumPostCreate, ForumPostResponse,
     ForumCommentCreate, ForumCommentResponse,
 )
+from app.services.forum_threads import CommentThreads
+from app.services.forum_votes import apply_votes, vote_buffer
 
 router = APIRouter(prefix="/api/forum", tags=["Forum"])
 
+_keyset = Keyset(ForumPost.created_at, ForumPost.id)
+_with_author = joinedload(ForumPost.author).load_only(User.name)
+
+_VOTE_VALUES = {"up": 1, "down": -1}
+
+
+def _tally(value: int | None) -> tuple[int, int]:
+    """A vote's contribution to (upvotes, downvotes)."""
+    return {1: (1, 0), -1: (0, 1)}.get(value, (0, 0))
+
+
+def _load_threads(db: Session, post_id: int) -> CommentThreads:
+    rows = db.execute(
+        select(
+            ForumComment.id, ForumComment.post_id, ForumComment.parent_id, ForumComment.author_id,
+            User.name.label("author_name"), ForumComment.content, ForumComment.upvotes,
+            ForumComment.downvotes, ForumComment.created_at,
+        )
+        .outerjoin(User, User.id == ForumComment.author_id)
+        .where(ForumComment.post_id == post_id)
+        .order_by(ForumComment.created_at, ForumComment.id)
+    )
+    return CommentThreads(rows)
+
+
+def _adjust_comment_count(db: Session, post_id: int, delta: int) -> None:
+    # In SQL rather than read-modify-write, so concurrent comments don't lose updates.
+    db.execute(
+        update(ForumPost)
+        .where(ForumPost.id == post_id)
+        .values(comment_count=ForumPost.comment_count + delta)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _thread_page(
+    threads: CommentThreads, parent_id: int | None, page: PageParams, replies: int, depth: int,
+) -> tuple[list[dict], str | None]:
+    """One level of a thread and the cursor for the rest of that level."""
+    try:
+        nodes, next_after = threads.page(
+            parent_id, int(page.cursor) if page.cursor else None, page.limit, replies, depth,
+        )
+    except ValueError:
+        raise invalid_cursor()
+    return nodes, str(next_after) if next_after is not None else None
+
 
 @router.get("/posts", response_model=list[ForumPostResponse])
 def list_posts(
+    request: Request,
     category: str | None = None,
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(ForumPost)
+    """List posts, newest first. Threads are only returned by the post detail."""
+    q = db.query(ForumPost).options(_with_author)
     if category:
         q = q.filter(ForumPost.category == category)
-    posts = q.order_by(ForumPost.created_at.desc()).all()
-    result = []
-    for p in posts:
-        comment_count = db.query(ForumComment).filter(ForumComment.post_id == p.id).count()
-        result.append(ForumPostResponse(
-            id=p.id,
-            title=p.title,
-            content=p.content,
-            category=p.category,
-            image_url=p.image_url,
-            author_id=p.author_id,
-            author_name=p.author.name if p.author else None,
-            upvotes=p.upvotes,
-            downvotes=p.downvotes,
-            comment_count=comment_count,
-            created_at=p.created_at,
-        ))
-    return result
+    posts, next_cursor = _keyset.page(_keyset.apply(q, page).all(), page)
+    response = FastJSONResponse([
+        project(p, ForumPostResponse, author_name=p.author.name if p.author else None, comments=[])
+        for p in posts
+    ])
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.get("/posts/{post_id}", response_model=ForumPostResponse)
 def get_post(
     post_id: int,
+    request: Request,
+    page: PageParams = Depends(page_params),
+    replies: int = Query(3, ge=0, le=50, description="Replies shown under each comment"),
+    depth: int = Query(3, ge=1, le=10, description="Levels of nesting returned"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    p = db.query(ForumPost).filter(ForumPost.id == post_id).first()
+    """A post with its first page of top-level threads; the cursor pages through top-level comments."""
+    p = db.query(ForumPost).options(_with_author).filter(ForumPost.id == post_id).first()
     if not p:
         raise HTTPException(404, "Post not found")
-    comments = db.query(ForumComment).filter(ForumComment.post_id == post_id).order_by(ForumComment.created_at.asc()).all()
-    comment_list = [
-        ForumCommentResponse(
-            id=c.id, post_id=c.post_id, parent_id=c.parent_id,
-            author_id=c.author_id, author_name=c.author.name if c.author else None,
-            content=c.content, upvotes=c.upvotes, downvotes=c.downvotes,
-            created_at=c.created_at,
-        )
-        for c in comments
-    ]
-    return ForumPostResponse(
-        id=p.id, title=p.title, content=p.content,
-        category=p.category, image_url=p.image_url,
-        author_id=p.author_id,
-        author_name=p.author.name if p.author else None,
-        upvotes=p.upvotes, downvotes=p.downvotes,
-        comment_count=len(comment_list),
-        created_at=p.created_at, comments=comment_list,
-    )
+    nodes, next_cursor = _thread_page(_load_threads(db, post_id), None, page, replies, depth)
+    response = FastJSONResponse(project(
+        p, ForumPostResponse, author_name=p.author.name if p.author else None, comments=nodes,
+    ))
+    link_next(response, request, next_cursor)
+    return response
+
+
+@router.get("/posts/{post_id}/comments/{comment_id}/replies", response_model=list[ForumCommentResponse])
+def list_replies(
+    post_id: int,
+    comment_id: int,
+    request: Request,
+    page: PageParams = Depends(page_params),
+    replies: int = Query(3, ge=0, le=50, description="Replies shown under each reply"),
+    depth: int = Query(3, ge=1, le=10, description="Levels of nesting returned"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Page through the direct replies to a comment, each with its own nested replies."""
+    threads = _load_threads(db, post_id)
+    if comment_id not in threads:
+        raise HTTPException(404, "Comment not found")
+    nodes, next_cursor = _thread_page(threads, comment_id, page, replies, depth)
+    response = FastJSONResponse(nodes)
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.post("/posts", response_model=ForumPostResponse)
@@ -108,6 +167,10 @@ def add_comment(
     post = db.query(ForumPost).filter(ForumPost.id == post_id).first()
     if not post:
         raise HTTPException(404, "Post not found")
+    if data.parent_id is not None:
+        parent_post = db.scalar(select(ForumComment.post_id).where(ForumComment.id == data.parent_id))
+        if parent_post != post_id:
+            raise HTTPException(400, "Parent comment not found on this post")
     c = ForumComment(
         post_id=post_id,
         parent_id=data.parent_id,
@@ -115,6 +178,7 @@ def add_comment(
         content=data.content,
     )
     db.add(c)
+    _adjust_comment_count(db, post_id, 1)
     db.commit()
     db.refresh(c)
     return ForumCommentResponse(
@@ -125,6 +189,26 @@ def add_comment(
     )
 
 
+@router.delete("/posts/{post_id}/comments/{comment_id}")
+def delete_comment(
+    post_id: int,
+    comment_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Delete a comment together with its replies (author, admin or authority)."""
+    threads = _load_threads(db, post_id)
+    if comment_id not in threads:
+        raise HTTPException(404, "Comment not found")
+    if threads[comment_id].author_id != current_user.id and current_user.role not in ("admin", "authority"):
+        raise HTTPException(403, "Not authorized")
+    ids = threads.subtree(comment_id)
+    db.query(ForumComment).filter(ForumComment.id.in_(ids)).delete(synchronize_session=False)
+    _adjust_comment_count(db, post_id, -len(ids))
+    db.commit()
+    return {"detail": "Deleted", "deleted": len(ids)}
+
+
 @router.post("/posts/{post_id}/vote")
 def vote_post(
     post_id: int,
@@ -132,17 +216,46 @@ def vote_post(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    p = db.query(ForumPost).filter(ForumPost.id == post_id).first()
-    if not p:
+    """Cast or change the current user's vote; repeating the same vote changes nothing."""
+    value = _VOTE_VALUES.get(vote)
+    if value is None:
+        raise HTTPException(400, "Vote must be 'up' or 'down'")
+    if db.scalar(select(ForumPost.id).where(ForumPost.id == post_id)) is None:
         raise HTTPException(404, "Post not found")
-    if vote == "up":
-        p.upvotes += 1
-    elif vote == "down":
-        p.downvotes += 1
+    previous = db.scalar(
+        select(ForumVote.value).where(ForumVote.post_id == post_id, ForumVote.user_id == current_user.id)
+    )
+    if previous is None:
+        db.add(ForumVote(post_id=post_id, user_id=current_user.id, value=value))
+    elif previous != value:
+        # Compare-and-set, so two concurrent switches by the same user count once.
+        switched = db.execute(
+            update(ForumVote)
+            .where(ForumVote.post_id == post_id, ForumVote.user_id == current_user.id, ForumVote.value == previous)
+            .values(value=value)
+        ).rowcount
+        if not switched:
+            previous = value
+    delta = tuple(new - old for new, old in zip(_tally(value), _tally(previous)))
+
+    buffered = settings.FORUM_VOTE_FLUSH_SECONDS > 0
+    if not buffered and any(delta):
+        apply_votes(db, {post_id: delta})
+    try:
+        db.commit()
+    except IntegrityError:
+        # The same user's first vote arrived twice at once; the other request counted it.
+        db.rollback()
+        delta = (0, 0)
+    if buffered:
+        if any(delta):
+            vote_buffer.add(post_id, *delta)
+        totals = vote_buffer.totals(db, post_id)
     else:
-        raise HTTPException(400, "Vote must be 'up' or 'down'")
-    db.commit()
-    return {"upvotes": p.upvotes, "downvotes": p.downvotes}
+        totals = db.execute(select(ForumPost.upvotes, ForumPost.downvotes).where(ForumPost.id == post_id)).first()
+    if totals is None:  # deleted meanwhile
+        raise HTTPException(404, "Post not found")
+    return {"upvotes": totals[0], "downvotes": totals[1], "vote": vote}
 
 
 @router.delete("/posts/{post_id}")
@@ -156,8 +269,9 @@ def delete_post(
         raise HTTPException(404, "Post not found")
     if p.author_id != current_user.id and current_user.role not in ("admin", "authority"):
         raise HTTPException(403, "Not authorized")
-    # Delete comments first
+    # Delete comments and votes first
     db.query(ForumComment).filter(ForumComment.post_id == post_id).delete()
+    db.query(ForumVote).filter(ForumVote.post_id == post_id).delete()
     db.delete(p)
     db.commit()
     return {"detail": "Deleted"}
@@ -1,23 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, noload, selectinload
 
-from app.core.database import get_db
-from app.core.deps import get_current_user, require_role
+from app.core.counters import added, adjust, changes, grievance_counters, removed
+from app.core.database import get_db, get_async_db
+from app.core.deps import get_current_user, get_current_user_async, require_role
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.grievance import Grievance, GrievanceComment
 from app.schemas.grievance import (
     GrievanceCreate,
     GrievanceUpdate,
     GrievanceResponse,
+    GrievanceSummary,
     GrievanceCommentCreate,
     GrievanceCommentResponse,
 )
 
 router = APIRouter(prefix="/api/grievances", tags=["Grievances"])
 
+_keyset = Keyset(Grievance.created_at, Grievance.id)
+_comment_keyset = Keyset(GrievanceComment.created_at, GrievanceComment.id)
+
+# Names shown on every grievance representation
+_WITH_PEOPLE = (
+    joinedload(Grievance.submitter).load_only(User.name),
+    joinedload(Grievance.assignee).load_only(User.name),
+)
+_with_author = joinedload(GrievanceComment.user).load_only(User.name, User.role)
+# Everything _to_response reads
+_DETAIL = (*_WITH_PEOPLE, selectinload(Grievance.comments).options(_with_author))
+
+_comment_count = (
+    select(func.count(GrievanceComment.id))
+    .where(GrievanceComment.grievance_id == Grievance.id)
+    .correlate(Grievance)
+    .scalar_subquery()
+    .label("comment_count")
+)
+
 
 def _to_response(g: Grievance) -> GrievanceResponse:
-    """Convert Grievance ORM object to response schema."""
+    """Convert Grievance ORM object, loaded with _DETAIL, to response schema."""
     comments_data = []
     for c in (g.comments or []):
         comments_data.append(GrievanceCommentResponse(
@@ -50,36 +76,72 @@ def _to_response(g: Grievance) -> GrievanceResponse:
     )
 
 
-@router.get("/", response_model=list[GrievanceResponse])
-def list_grievances(
+def _load_detail(db: Session, grievance_id: int) -> Grievance:
+    """Re-read a grievance after a write, with everything _to_response needs."""
+    return db.scalars(
+        select(Grievance)
+        .options(*_DETAIL)
+        .where(Grievance.id == grievance_id)
+        .execution_options(populate_existing=True)
+    ).one()
+
+
+def _to_summary(g: Grievance, comment_count: int) -> dict:
+    """GrievanceSummary as an unvalidated dict, for the list endpoint's fast JSON path."""
+    return project(
+        g,
+        GrievanceSummary,
+        submitter_name="Anonymous" if g.is_anonymous else (g.submitter.name if g.submitter else None),
+        assignee_name=g.assignee.name if g.assignee else None,
+        comment_count=comment_count,
+    )
+
+
+def _comment_dict(c: GrievanceComment) -> dict:
+    return project(
+        c,
+        GrievanceCommentResponse,
+        user_name=c.user.name if c.user else None,
+        user_role=c.user.role if c.user else None,
+    )
+
+
+@router.get("/", response_model=list[GrievanceSummary])
+async def list_grievances(
+    request: Request,
     status_filter: str | None = Query(None, alias="status"),
     category: str | None = None,
     priority: str | None = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
-    """List grievances. Students see their own; authority/admin see all."""
-    query = db.query(Grievance)
+    """List grievances with comment counts. Students see their own; authority/admin see all."""
+    query = select(Grievance, _comment_count).options(*_WITH_PEOPLE, noload(Grievance.comments))
 
     # Students only see their own grievances
     if current_user.role == "student":
-        query = query.filter(Grievance.submitted_by == current_user.id)
+        query = query.where(Grievance.submitted_by == current_user.id)
     elif current_user.role == "authority":
         # Authority sees assigned + unassigned grievances
-        query = query.filter(
+        query = query.where(
             (Grievance.assigned_to == current_user.id) | (Grievance.assigned_to.is_(None))
         )
     # Admin and faculty see all
 
     if status_filter:
-        query = query.filter(Grievance.status == status_filter)
+        query = query.where(Grievance.status == status_filter)
     if category:
-        query = query.filter(Grievance.category == category)
+        query = query.where(Grievance.category == category)
     if priority:
-        query = query.filter(Grievance.priority == priority)
+        query = query.where(Grievance.priority == priority)
 
-    grievances = query.order_by(Grievance.created_at.desc()).all()
-    return [_to_response(g) for g in grievances]
+    rows = (await db.execute(_keyset.apply(query, page))).unique().all()
+    comment_counts = {g.id: comment_count for g, comment_count in rows}
+    grievances, next_cursor = _keyset.page([g for g, _ in rows], page)
+    response = FastJSONResponse([_to_summary(g, comment_counts[g.id]) for g in grievances])
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.post("/", response_model=GrievanceResponse, status_code=status.HTTP_201_CREATED)
@@ -100,19 +162,24 @@ def create_grievance(
         submitted_by=current_user.id,
     )
     db.add(grievance)
+    db.flush()  # applies the column defaults (status) the counters key on
+    adjust(db, added(grievance_counters(grievance)))
     db.commit()
-    db.refresh(grievance)
-    return _to_response(grievance)
+    return _to_response(_load_detail(db, grievance.id))
 
 
 @router.get("/{grievance_id}", response_model=GrievanceResponse)
-def get_grievance(
+async def get_grievance(
     grievance_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
     """Get a single grievance by ID."""
-    grievance = db.query(Grievance).filter(Grievance.id == grievance_id).first()
+    grievance = await db.scalar(
+        select(Grievance)
+        .options(*_DETAIL)
+        .where(Grievance.id == grievance_id)
+    )
     if not grievance:
         raise HTTPException(status_code=404, detail="Grievance not found")
 
@@ -134,6 +201,7 @@ def update_grievance(
     grievance = db.query(Grievance).filter(Grievance.id == grievance_id).first()
     if not grievance:
         raise HTTPException(status_code=404, detail="Grievance not found")
+    counted = grievance_counters(grievance)
 
     if data.status is not None:
         valid_statuses = {"pending", "in_review", "in_progress", "resolved", "rejected"}
@@ -148,9 +216,9 @@ def update_grievance(
             raise HTTPException(status_code=404, detail="Assignee not found")
         grievance.assigned_to = data.assigned_to
 
+    adjust(db, changes(counted, grievance_counters(grievance)))
     db.commit()
-    db.refresh(grievance)
-    return _to_response(grievance)
+    return _to_response(_load_detail(db, grievance_id))
 
 
 @router.delete("/{grievance_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -163,12 +231,36 @@ def delete_grievance(
     grievance = db.query(Grievance).filter(Grievance.id == grievance_id).first()
     if not grievance:
         raise HTTPException(status_code=404, detail="Grievance not found")
+    adjust(db, removed(grievance_counters(grievance)))
     db.delete(grievance)
     db.commit()
 
 
 # --- Comments (Timeline) ---
 
+@router.get("/{grievance_id}/comments", response_model=list[GrievanceCommentResponse])
+async def list_comments(
+    grievance_id: int,
+    request: Request,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """A grievance's comment timeline, newest first."""
+    submitted_by = await db.scalar(select(Grievance.submitted_by).where(Grievance.id == grievance_id))
+    if submitted_by is None:
+        raise HTTPException(status_code=404, detail="Grievance not found")
+    if current_user.role == "student" and submitted_by != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    query = select(GrievanceComment).options(_with_author).where(GrievanceComment.grievance_id == grievance_id)
+    result = await db.execute(_comment_keyset.apply(query, page))
+    comments, next_cursor = _comment_keyset.page(result.scalars(), page)
+    response = FastJSONResponse([_comment_dict(c) for c in comments])
+    link_next(response, request, next_cursor)
+    return response
+
+
 @router.post("/{grievance_id}/comments", response_model=GrievanceCommentResponse, status_code=status.HTTP_201_CREATED)
 def add_comment(
     grievance_id: int,
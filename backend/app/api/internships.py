@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import date
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import case, func, literal, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+
+from app.core.counters import TOTAL_INTERNSHIPS, added, adjust
 from app.core.database import get_db
 from app.core.deps import get_current_user, require_role
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.internship import Internship, Application
 from app.schemas.internship import (
@@ -15,47 +22,59 @@ from app.schemas.internship import (
 
 router = APIRouter(prefix="/api/internships", tags=["Internships"])
 
+_keyset = Keyset(Internship.created_at, Internship.id)
+_with_student = joinedload(Application.student).load_only(User.name)
+
+
+def _application_stats(db: Session, internship_ids: list[int], student_id: int | None) -> dict[int, tuple[int, bool]]:
+    """{internship_id: (application count, whether `student_id` applied)} in one grouped query."""
+    if not internship_ids:
+        return {}
+    applied = func.count(case((Application.student_id == student_id, 1))) if student_id else literal(0)
+    rows = db.execute(
+        select(Application.internship_id, func.count(), applied)
+        .where(Application.internship_id.in_(internship_ids))
+        .group_by(Application.internship_id)
+    )
+    return {internship_id: (count, bool(mine)) for internship_id, count, mine in rows}
+
 
 @router.get("/", response_model=list[InternshipResponse])
 def list_internships(
+    request: Request,
     role_type: str | None = None,
+    deadline_after: date | None = Query(None, description="Deadline on or after this date; postings without one are included"),
+    min_stipend: int | None = Query(None, ge=0),
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """List all internships with application info."""
-    query = db.query(Internship)
+    """List internships, newest first, with application info."""
+    query = db.query(Internship).options(joinedload(Internship.poster).load_only(User.name))
     if role_type:
         query = query.filter(Internship.role_type == role_type)
+    if deadline_after:
+        query = query.filter(or_(Internship.deadline.is_(None), Internship.deadline >= deadline_after))
+    if min_stipend is not None:
+        query = query.filter(Internship.stipend >= min_stipend)
+    internships, next_cursor = _keyset.page(_keyset.apply(query, page).all(), page)
+
+    student_id = current_user.id if current_user.role == "student" else None
+    stats = _application_stats(db, [i.id for i in internships], student_id)
 
-    internships = query.order_by(Internship.created_at.desc()).all()
     result = []
     for i in internships:
-        app_count = db.query(Application).filter(Application.internship_id == i.id).count()
-        has_applied = False
-        if current_user.role == "student":
-            has_applied = db.query(Application).filter(
-                Application.internship_id == i.id,
-                Application.student_id == current_user.id,
-            ).first() is not None
-
-        result.append(InternshipResponse(
-            id=i.id,
-            title=i.title,
-            company=i.company,
-            description=i.description,
-            location=i.location,
-            stipend=i.stipend,
-            role_type=i.role_type,
-            required_skills=i.required_skills,
-            duration=i.duration,
-            deadline=i.deadline,
-            posted_by=i.posted_by,
+        app_count, has_applied = stats.get(i.id, (0, False))
+        result.append(project(
+            i,
+            InternshipResponse,
             poster_name=i.poster.name if i.poster else None,
-            created_at=i.created_at,
             application_count=app_count,
             has_applied=has_applied,
         ))
-    return result
+    response = FastJSONResponse(result)
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.post("/", response_model=InternshipResponse, status_code=status.HTTP_201_CREATED)
@@ -78,6 +97,7 @@ def create_internship(
         posted_by=current_user.id,
     )
     db.add(internship)
+    adjust(db, added([TOTAL_INTERNSHIPS]))
     db.commit()
     db.refresh(internship)
 
@@ -118,7 +138,12 @@ def apply_to_internship(
 
     application = Application(student_id=current_user.id, internship_id=data.internship_id)
     db.add(application)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request applied first (unique internship_id, student_id).
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Already applied to this internship")
     db.refresh(application)
 
     return ApplicationResponse(
@@ -139,7 +164,12 @@ def my_applications(
     current_user: User = Depends(require_role("student")),
 ):
     """Get current student's internship applications."""
-    applications = db.query(Application).filter(Application.student_id == current_user.id).all()
+    applications = (
+        db.query(Application)
+        .options(joinedload(Application.internship).load_only(Internship.title, Internship.company))
+        .filter(Application.student_id == current_user.id)
+        .all()
+    )
     return [
         ApplicationResponse(
             id=a.id,
@@ -171,7 +201,7 @@ def list_applications(
     if internship.posted_by != current_user.id and current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Access denied")
 
-    applications = db.query(Application).filter(Application.internship_id == internship_id).all()
+    applications = db.query(Application).options(_with_student).filter(Application.internship_id == internship_id).all()
     return [
         ApplicationResponse(
             id=a.id,
@@ -203,7 +233,7 @@ def update_application_status(
     if internship.posted_by != current_user.id and current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Access denied")
 
-    application = db.query(Application).filter(
+    application = db.query(Application).options(_with_student).filter(
         Application.id == application_id,
         Application.internship_id == internship_id,
     ).first()
@@ -214,6 +244,7 @@ def update_application_status(
     if data.status not in valid_statuses:
         raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
 
+    student_name = application.student.name if application.student else None
     application.status = data.status
     if data.faculty_feedback is not None:
         application.faculty_feedback = data.faculty_feedback
@@ -224,7 +255,7 @@ def update_application_status(
     return ApplicationResponse(
         id=application.id,
         student_id=application.student_id,
-        student_name=application.student.name if application.student else None,
+        student_name=student_name,
         internship_id=application.internship_id,
         internship_title=internship.title,
         company=internship.company,
@@ -1,48 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.lost_found import LostFoundItem
 from app.schemas.lost_found import LostFoundCreate, LostFoundUpdate, LostFoundResponse
 
 router = APIRouter(prefix="/api/lost-found", tags=["Lost & Found"])
 
+_keyset = Keyset(LostFoundItem.created_at, LostFoundItem.id)
+_with_poster = joinedload(LostFoundItem.poster).load_only(User.name)
+
 
 @router.get("/", response_model=list[LostFoundResponse])
 def list_items(
+    request: Request,
     category: str | None = None,
     item_type: str | None = None,
     status: str | None = None,
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(LostFoundItem)
+    q = db.query(LostFoundItem).options(_with_poster)
     if category:
         q = q.filter(LostFoundItem.category == category)
     if item_type:
         q = q.filter(LostFoundItem.item_type == item_type)
     if status:
         q = q.filter(LostFoundItem.status == status)
-    items = q.order_by(LostFoundItem.created_at.desc()).all()
-    return [
-        LostFoundResponse(
-            id=i.id,
-            title=i.title,
-            description=i.description,
-            image_url=i.image_url,
-            location=i.location,
-            category=i.category,
-            item_type=i.item_type,
-            status=i.status,
-            posted_by=i.posted_by,
-            poster_name=i.poster.name if i.poster else None,
-            claimed_by=i.claimed_by,
-            created_at=i.created_at,
-        )
+    items, next_cursor = _keyset.page(_keyset.apply(q, page).all(), page)
+    response = FastJSONResponse([
+        project(i, LostFoundResponse, poster_name=i.poster.name if i.poster else None)
         for i in items
-    ]
+    ])
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.post("/", response_model=LostFoundResponse)
@@ -79,11 +75,12 @@ def claim_item(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    i = db.query(LostFoundItem).filter(LostFoundItem.id == item_id).first()
+    i = db.query(LostFoundItem).options(_with_poster).filter(LostFoundItem.id == item_id).first()
     if not i:
         raise HTTPException(404, "Item not found")
     if i.status != "open":
         raise HTTPException(400, "Item already claimed or closed")
+    poster_name = i.poster.name if i.poster else None
     i.claimed_by = current_user.id
     i.status = "claimed"
     db.commit()
@@ -93,7 +90,7 @@ def claim_item(
         image_url=i.image_url, location=i.location,
         category=i.category, item_type=i.item_type,
         status=i.status, posted_by=i.posted_by,
-        poster_name=i.poster.name if i.poster else None,
+        poster_name=poster_name,
         claimed_by=i.claimed_by, created_at=i.created_at,
     )
 
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
 from pydantic import BaseModel
 
+from app.core.conditional import MAP_LOCATIONS, bump, collection_validators
 from app.core.database import get_db
+from app.core.responses import FastJSONResponse
 from app.core.deps import require_role
 from app.models.location import CampusLocation
 from app.models.user import User
@@ -31,6 +33,7 @@ def create_location(
         longitude=data.longitude
     )
     db.add(loc)
+    bump(db, MAP_LOCATIONS)
     db.commit()
     db.refresh(loc)
     return loc
@@ -45,13 +48,18 @@ def delete_location(
     if not loc:
         raise HTTPException(status_code=404, detail="Location not found")
     db.delete(loc)
+    bump(db, MAP_LOCATIONS)
     db.commit()
     return {"message": "Location deleted"}
 
 @router.get("/locations", response_model=List[dict])
-def get_locations(db: Session = Depends(get_db)):
+def get_locations(request: Request, db: Session = Depends(get_db)):
+    validators = collection_validators(db, (MAP_LOCATIONS,))
+    if validators.matches(request):
+        return validators.not_modified()
+
     locations = db.query(CampusLocation).all()
-    return [
+    return validators.apply(FastJSONResponse([
         {
             "id": l.id,
             "name": l.name,
@@ -60,7 +68,7 @@ def get_locations(db: Session = Depends(get_db)):
             "lat": l.latitude,
             "lng": l.longitude
         } for l in locations
-    ]
+    ]))
 
 @router.get("/search")
 def search_locations(q: str, db: Session = Depends(get_db)):
@@ -1,48 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session, joinedload
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.resource import Resource
 from app.schemas.resource import ResourceCreate, ResourceResponse
 
 router = APIRouter(prefix="/api/resources", tags=["Resources"])
 
+_keyset = Keyset(Resource.created_at, Resource.id)
+
 
 @router.get("/", response_model=list[ResourceResponse])
 def list_resources(
+    request: Request,
     course_code: str | None = None,
     resource_type: str | None = None,
     exam_type: str | None = None,
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    q = db.query(Resource)
+    q = db.query(Resource).options(joinedload(Resource.uploader).load_only(User.name))
     if course_code:
         q = q.filter(Resource.course_code == course_code)
     if resource_type:
         q = q.filter(Resource.resource_type == resource_type)
     if exam_type:
         q = q.filter(Resource.exam_type == exam_type)
-    resources = q.order_by(Resource.created_at.desc()).all()
-    return [
-        ResourceResponse(
-            id=r.id,
-            title=r.title,
-            description=r.description,
-            file_url=r.file_url,
-            course_code=r.course_code,
-            year=r.year,
-            exam_type=r.exam_type,
-            resource_type=r.resource_type,
-            tags=r.tags,
-            uploaded_by=r.uploaded_by,
-            uploader_name=r.uploader.name if r.uploader else None,
-            created_at=r.created_at,
-        )
+    resources, next_cursor = _keyset.page(_keyset.apply(q, page).all(), page)
+    response = FastJSONResponse([
+        project(r, ResourceResponse, uploader_name=r.uploader.name if r.uploader else None)
         for r in resources
-    ]
+    ])
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.post("/", response_model=ResourceResponse)
@@ -1,19 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.core.deps import get_current_user
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse, project
 from app.models.user import User
 from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
+_keyset = Keyset(Task.created_at, Task.id)
+
 
 @router.get("/", response_model=list[TaskResponse])
 def list_tasks(
+    request: Request,
     category: str | None = None,
     status: str | None = None,
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -22,7 +28,10 @@ def list_tasks(
         q = q.filter(Task.category == category)
     if status:
         q = q.filter(Task.status == status)
-    return q.order_by(Task.created_at.desc()).all()
+    tasks, next_cursor = _keyset.page(_keyset.apply(q, page).all(), page)
+    response = FastJSONResponse([project(t, TaskResponse) for t in tasks])
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.post("/", response_model=TaskResponse)
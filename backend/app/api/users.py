@@ -1,21 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-import csv
-import io
-
-from app.core.database import get_db
-from app.core.deps import require_role
-from app.core.security import hash_password
+import shutil
+import tempfile
+
+from app.core.conditional import USER_NAMES, bump
+from app.core.counters import added, adjust, adjust_async, changes, removed, user_counters
+from app.core.database import get_db, get_async_db
+from app.core.deps import require_role, require_role_async, invalidate_principal
+from app.core.jobs import jobs
+from app.core.pagination import Keyset, PageParams, link_next, page_params
+from app.core.responses import FastJSONResponse, project
+from app.core.security import hash_password_async
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate, UserCreate
+from app.services.user_import import run_user_import
 
 router = APIRouter(prefix="/api/users", tags=["User Management"])
 
+_keyset = Keyset(User.created_at, User.id)
+
 
 @router.get("/", response_model=list[UserResponse])
 def list_users(
+    request: Request,
     role: str | None = None,
     status: str | None = None,
+    page: PageParams = Depends(page_params),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role("admin")),
 ):
@@ -25,32 +38,35 @@ def list_users(
         query = query.filter(User.role == role)
     if status:
         query = query.filter(User.status == status)
-    users = query.order_by(User.created_at.desc()).all()
-    return [UserResponse.model_validate(u) for u in users]
+    users, next_cursor = _keyset.page(_keyset.apply(query, page).all(), page)
+    response = FastJSONResponse([project(u, UserResponse) for u in users])
+    link_next(response, request, next_cursor)
+    return response
 
 
 @router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def create_user(
+async def create_user(
     data: UserCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role("admin")),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_role_async("admin")),
 ):
     """Create a user manually (admin only)."""
-    existing = db.query(User).filter(User.email == data.email).first()
+    existing = await db.scalar(select(User.id).where(User.email == data.email))
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
     
     user = User(
         email=data.email,
         name=data.name,
-        hashed_password=hash_password(data.password),
+        hashed_password=await hash_password_async(data.password),
         role=data.role,
         department=data.department,
         status="active"  # Admin-created users are active by default
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await adjust_async(db, added(user_counters(user.role)))
+    await db.commit()
+    await db.refresh(user)
     return UserResponse.model_validate(user)
 
 
@@ -66,14 +82,16 @@ def update_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if data.name is not None:
+    if data.name is not None and data.name != user.name:
         user.name = data.name
+        bump(db, USER_NAMES)
     if data.department is not None:
         user.department = data.department
     if data.role is not None:
         valid_roles = {"student", "faculty", "authority", "admin"}
         if data.role not in valid_roles:
             raise HTTPException(status_code=400, detail=f"Invalid role. Must be one of: {valid_roles}")
+        adjust(db, changes(user_counters(user.role), user_counters(data.role)))
         user.role = data.role
     
     if data.status is not None:
@@ -86,6 +104,7 @@ def update_user(
         user.managed_modules = data.managed_modules
 
     db.commit()
+    invalidate_principal(user.id)
     db.refresh(user)
     return UserResponse.model_validate(user)
 
@@ -102,61 +121,50 @@ def delete_user(
         raise HTTPException(status_code=404, detail="User not found")
     if user.id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot delete your own account")
+    adjust(db, removed(user_counters(user.role)))
     db.delete(user)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # foreign_keys=ON: the user still owns grievances, courses, posts, ...
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User still has linked records. Reject or deactivate the account instead.",
+        )
+    invalidate_principal(user_id)
 
 
-@router.post("/bulk-import", status_code=status.HTTP_201_CREATED)
+@router.post("/bulk-import", status_code=status.HTTP_202_ACCEPTED)
 def bulk_import_users(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
     current_user: User = Depends(require_role("admin")),
 ):
-    """Bulk import users from CSV (admin only)."""
+    """Start a bulk user import from CSV (admin only). Poll the returned status_url for progress."""
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are allowed")
 
-    try:
-        content = file.file.read().decode("utf-8")
-        reader = csv.DictReader(io.StringIO(content))
-        
-        imported_count = 0
-        errors = []
-        
-        for row in reader:
-            email = row.get("email", "").strip().lower()
-            name = row.get("name", "").strip()
-            role = row.get("role", "student").strip().lower()
-            dept = row.get("department", "").strip()
-
-            if not email or not name:
-                errors.append(f"Skipped row with missing email/name: {row}")
-                continue
-
-            # Check if user exists
-            existing = db.query(User).filter(User.email == email).first()
-            if existing:
-                errors.append(f"User {email} already exists")
-                continue
-
-            # Create user
-            default_password = hash_password("Aegis@123")
-            new_user = User(
-                email=email,
-                name=name,
-                role=role if role in {"student", "faculty", "authority", "admin"} else "student",
-                department=dept if dept else None,
-                hashed_password=default_password,
-                status="active"  # Admin imports are active by default
-            )
-            db.add(new_user)
-            imported_count += 1
+    # The upload is closed once the response is sent, so spool it to disk for the job.
+    with tempfile.NamedTemporaryFile("wb", suffix=".csv", delete=False) as tmp:
+        shutil.copyfileobj(file.file, tmp, length=1024 * 1024)
 
-        db.commit()
-        return {
-            "message": f"Successfully imported {imported_count} users",
-            "skipped": errors
-        }
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+    job = jobs.create("user_import", owner_id=current_user.id)
+    background_tasks.add_task(run_user_import, job, tmp.name)
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/users/bulk-import/{job.id}",
+    }
+
+
+@router.get("/bulk-import/{job_id}")
+def bulk_import_status(
+    job_id: str,
+    current_user: User = Depends(require_role("admin")),
+):
+    """Progress and result of a bulk import job (admin only)."""
+    job = jobs.get(job_id)
+    if not job or job.kind != "user_import":
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job.as_dict()
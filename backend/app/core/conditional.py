@@ -0,0 +1,136 @@
+"""Conditional GET for slow-changing collections.
+
+Every write to a tracked collection bumps its row in `collection_versions`
+inside the same transaction, so the counter is shared by all workers and can
+never run ahead of the data it describes. A list endpoint first reads the
+versions it depends on (one primary-key lookup), derives an ETag and
+Last-Modified from them and, when the client already holds that
+representation, answers 304 before running its own query or serializing
+anything:
+
+    validators = collection_validators(db, ("announcements", USER_NAMES), category)
+    if validators.matches(request):
+        return validators.not_modified()
+    ...
+    return validators.apply(FastJSONResponse(items))
+
+Anything else the body depends on (query parameters, the caller's id for
+per-user fields) goes into `variant`.
+"""
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.collection_version import CollectionVersion
+
+ANNOUNCEMENTS = "announcements"
+ATTENDANCE = "attendance"
+CALENDAR_EVENTS = "calendar_events"
+CLUBS = "clubs"
+COURSES = "courses"
+ENROLLMENTS = "enrollments"
+MAP_LOCATIONS = "map_locations"
+# Display names are denormalised into several payloads (poster_name, lead, ...);
+# bumped only when a user's name changes, not on every user write.
+USER_NAMES = "user_names"
+
+TRACKED_COLLECTIONS = (
+    ANNOUNCEMENTS, ATTENDANCE, CALENDAR_EVENTS, CLUBS, COURSES, ENROLLMENTS, MAP_LOCATIONS, USER_NAMES,
+)
+
+
+def attendance_course(course_id: int) -> str:
+    """One course's attendance; bumped together with ATTENDANCE."""
+    return f"attendance.course:{course_id}"
+
+
+_UPSERT_DIALECTS = {"sqlite": sqlite, "postgresql": postgresql}
+
+
+def _bump_statement(dialect_name: str, names: tuple[str, ...]):
+    dialect = _UPSERT_DIALECTS.get(dialect_name)
+    if dialect is None:
+        raise NotImplementedError(f"Collection versions need an upsert; unsupported dialect {dialect_name!r}")
+    now = datetime.now(timezone.utc)
+    stmt = dialect.insert(CollectionVersion).values([{"name": name, "version": 1, "updated_at": now} for name in names])
+    return stmt.on_conflict_do_update(
+        index_elements=[CollectionVersion.name],
+        set_={"version": CollectionVersion.version + 1, "updated_at": stmt.excluded.updated_at},
+    )
+
+
+def bump(db: Session, *names: str) -> None:
+    """Record a write to `names`. Call before the commit that persists the write."""
+    db.execute(_bump_statement(db.get_bind().dialect.name, names))
+
+
+async def bump_async(db: AsyncSession, *names: str) -> None:
+    await db.execute(_bump_statement(db.bind.dialect.name, names))
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: datetime | None
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def matches(self, request: Request) -> bool:
+        """True when the client's cached copy is current (If-None-Match, else If-Modified-Since)."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag.removeprefix("W/") in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.headers())
+
+    def apply(self, response: Response) -> Response:
+        response.headers.update(self.headers())
+        return response
+
+    def vary(self, *variant) -> "Validators":
+        """Validators for one variant of this representation, e.g. per viewer, without re-reading versions."""
+        return Validators(etag=_etag((self.etag, variant)), last_modified=self.last_modified)
+
+
+def _etag(state) -> str:
+    return f'W/"{hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()}"'
+
+
+def _validators(rows, names: tuple[str, ...], variant: tuple) -> Validators:
+    state = {row.name: (row.version, row.updated_at) for row in rows}
+    versions = tuple(state.get(name, (0, None))[0] for name in names)
+    stamps = [updated_at for _, updated_at in state.values() if updated_at is not None]
+    last_modified = max(stamps).replace(tzinfo=timezone.utc) if stamps else None
+    return Validators(etag=_etag((names, versions, variant)), last_modified=last_modified)
+
+
+def collection_validators(db: Session, names: tuple[str, ...], *variant) -> Validators:
+    rows = db.execute(select(CollectionVersion).where(CollectionVersion.name.in_(names))).scalars().all()
+    return _validators(rows, names, variant)
+
+
+async def collection_validators_async(db: AsyncSession, names: tuple[str, ...], *variant) -> Validators:
+    rows = (await db.execute(select(CollectionVersion).where(CollectionVersion.name.in_(names)))).scalars().all()
+    return _validators(rows, names, variant)
@@ -0,0 +1,175 @@
+"""Incrementally maintained totals for dashboards and module lists.
+
+`stat_counters` holds one running total per name:
+
+    grievances                          every grievance
+    grievances.status:<status>
+    grievances.assignee:<user id>
+    users, users.role:<role>
+    courses, internships
+
+Every write to a counted table adjusts the affected totals with an upsert in
+the same transaction, so a rolled-back write never leaves a counter behind
+and readers get their numbers from primary-key lookups instead of scanning
+the tables:
+
+    before = grievance_counters(grievance)
+    grievance.status = "resolved"
+    adjust(db, changes(before, grievance_counters(grievance)))
+    db.commit()
+
+Writes that bypass the API (seed.py, manual SQL) must be followed by
+`python reconcile_counters.py`, which rebuilds every total from the tables,
+including the per-row `forum_posts.comment_count`.
+"""
+from collections import Counter
+from collections.abc import Iterable, Mapping
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.course import Course
+from app.models.forum import ForumComment, ForumPost
+from app.models.grievance import Grievance
+from app.models.internship import Internship
+from app.models.stat_counter import StatCounter
+from app.models.user import User
+
+TOTAL_GRIEVANCES = "grievances"
+TOTAL_USERS = "users"
+TOTAL_COURSES = "courses"
+TOTAL_INTERNSHIPS = "internships"
+
+_UPSERT_DIALECTS = {"sqlite": sqlite, "postgresql": postgresql}
+
+
+def grievance_status(status: str) -> str:
+    return f"grievances.status:{status}"
+
+
+def grievance_assignee(user_id: int) -> str:
+    return f"grievances.assignee:{user_id}"
+
+
+def user_role(role: str) -> str:
+    return f"users.role:{role}"
+
+
+def grievance_counters(grievance: Grievance) -> list[str]:
+    """The counters a grievance row contributes to, in its current state."""
+    names = [TOTAL_GRIEVANCES, grievance_status(grievance.status)]
+    if grievance.assigned_to is not None:
+        names.append(grievance_assignee(grievance.assigned_to))
+    return names
+
+
+def user_counters(role: str) -> list[str]:
+    return [TOTAL_USERS, user_role(role)]
+
+
+def changes(before: Iterable[str], after: Iterable[str]) -> dict[str, int]:
+    """Deltas turning the counters of `before` into those of `after`; unchanged names cancel out."""
+    deltas = Counter(after)
+    deltas.subtract(before)
+    return {name: delta for name, delta in deltas.items() if delta}
+
+
+def added(names: Iterable[str]) -> dict[str, int]:
+    return changes((), names)
+
+
+def removed(names: Iterable[str]) -> dict[str, int]:
+    return changes(names, ())
+
+
+def _adjust_statement(dialect_name: str, deltas: Mapping[str, int]):
+    dialect = _UPSERT_DIALECTS.get(dialect_name)
+    if dialect is None:
+        raise NotImplementedError(f"Stat counters need an upsert; unsupported dialect {dialect_name!r}")
+    # Sorted, so concurrent transactions lock counter rows in the same order.
+    stmt = dialect.insert(StatCounter).values([{"name": name, "value": deltas[name]} for name in sorted(deltas)])
+    return stmt.on_conflict_do_update(
+        index_elements=[StatCounter.name],
+        set_={"value": StatCounter.value + stmt.excluded.value},
+    )
+
+
+def adjust(db: Session, deltas: Mapping[str, int]) -> None:
+    """Add `deltas` to their counters. Call before the commit that persists the counted write."""
+    if deltas:
+        db.execute(_adjust_statement(db.get_bind().dialect.name, deltas))
+
+
+async def adjust_async(db: AsyncSession, deltas: Mapping[str, int]) -> None:
+    if deltas:
+        await db.execute(_adjust_statement(db.bind.dialect.name, deltas))
+
+
+def _values(rows, names: tuple[str, ...]) -> dict[str, int]:
+    stored = dict(rows)
+    return {name: stored.get(name, 0) for name in names}
+
+
+async def read_async(db: AsyncSession, *names: str) -> dict[str, int]:
+    """Current value of each of `names`; counters never written read as 0."""
+    rows = (await db.execute(select(StatCounter.name, StatCounter.value).where(StatCounter.name.in_(names)))).all()
+    return _values(rows, names)
+
+
+def _actual_totals(db: Session) -> dict[str, int]:
+    totals: dict[str, int] = {}
+
+    def count(name: str, model) -> None:
+        totals[name] = db.scalar(select(func.count()).select_from(model))
+
+    def grouped(prefix: str, column, *criteria) -> None:
+        for key, n in db.execute(select(column, func.count()).where(*criteria).group_by(column)):
+            totals[f"{prefix}:{key}"] = n
+
+    count(TOTAL_GRIEVANCES, Grievance)
+    grouped("grievances.status", Grievance.status)
+    grouped("grievances.assignee", Grievance.assigned_to, Grievance.assigned_to.is_not(None))
+    count(TOTAL_USERS, User)
+    grouped("users.role", User.role)
+    count(TOTAL_COURSES, Course)
+    count(TOTAL_INTERNSHIPS, Internship)
+    return totals
+
+
+def reconcile(db: Session) -> dict[str, tuple[int, int]]:
+    """Rebuild every counter from the counted tables. The caller commits.
+
+    Returns {name: (stored, actual)} for the counters that had drifted. The
+    DELETE comes first so that, on SQLite, the recount runs under the write
+    lock and no concurrent write can slip between count and store.
+    """
+    stored = dict(db.execute(delete(StatCounter).returning(StatCounter.name, StatCounter.value)).all())
+    actual = _actual_totals(db)
+    if actual:
+        db.execute(insert(StatCounter), [{"name": name, "value": value} for name, value in actual.items()])
+    return {
+        name: (stored.get(name, 0), actual.get(name, 0))
+        for name in sorted(stored.keys() | actual.keys())
+        if stored.get(name, 0) != actual.get(name, 0)
+    }
+
+
+def resync_comment_counts(db: Session) -> int:
+    """Set every `forum_posts.comment_count` to its actual count. The caller commits.
+
+    Returns the number of posts whose count had drifted.
+    """
+    actual = (
+        select(func.count(ForumComment.id))
+        .where(ForumComment.post_id == ForumPost.id)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(ForumPost)
+        .where(ForumPost.comment_count != actual)
+        .values(comment_count=actual)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
@@ -1,20 +1,65 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.instrumentation import instrument_engine
+from app.core.sqlite_pragmas import configure_sqlite
 
 # Use check_same_thread=False for SQLite (required for FastAPI's async)
 connect_args = {}
 if settings.DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(settings.DATABASE_URL, connect_args=connect_args, echo=settings.DEBUG)
+engine = create_engine(settings.DATABASE_URL, connect_args=connect_args, echo=settings.SQL_ECHO)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _async_database_url(url: str) -> str:
+    """Map the sync DATABASE_URL onto the matching async driver."""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    scheme, sep, rest = url.partition(":")
+    if scheme in ("sqlite", "sqlite+pysqlite"):
+        return f"sqlite+aiosqlite:{rest}"
+    if scheme in ("postgresql", "postgresql+psycopg2"):
+        return f"postgresql+asyncpg:{rest}"
+    return url
+
+
+# Async engine for the event-loop routers. It shares the database with `engine`
+# but never blocks a threadpool slot while waiting on I/O. aiosqlite defaults to
+# NullPool (one connection thread per checkout), so pool explicitly.
+async_engine = create_async_engine(
+    _async_database_url(settings.DATABASE_URL),
+    echo=settings.SQL_ECHO,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.ASYNC_POOL_SIZE,
+    max_overflow=settings.ASYNC_MAX_OVERFLOW,
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+if engine.dialect.name == "sqlite":
+    configure_sqlite(engine)
+    configure_sqlite(async_engine.sync_engine)
+
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+
 class Base(DeclarativeBase):
-    pass
+    """Declarative base. Relationships are declared lazy="raise_on_sql": nothing is
+    loaded implicitly, and touching an unloaded relationship raises instead of
+    issuing a query. Each query states what it needs with loader options, e.g.
+
+        select(Task)                                                     # no join
+        select(Resource).options(joinedload(Resource.uploader).load_only(User.name))
+        select(Grievance).options(selectinload(Grievance.comments))
+    """
 
 
 def get_db():
@@ -24,3 +69,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """FastAPI dependency that provides an AsyncSession per request."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,43 +1,123 @@
+import time
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_db, get_async_db
 from app.core.security import decode_access_token
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Authenticated-principal cache. Verified tokens map to their user id until the
+# token expires; user ids map to a snapshot of the columns routers read from
+# current_user. Both skip work on the hot path: the JWT signature check and the
+# users-table lookup. Writes to a user call invalidate_principal().
+_PRINCIPAL_FIELDS = ("id", "email", "name", "role", "status", "department", "managed_modules", "created_at")
+_token_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_CACHE_TTL_SECONDS)
+_principal_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_CACHE_TTL_SECONDS)
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
-    """Decode JWT token and return the current user."""
-    credentials_exception = HTTPException(
+
+def invalidate_principal(user_id: int) -> None:
+    """Drop the cached principal for `user_id` after its row changes or is deleted."""
+    _principal_cache.pop(user_id)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _user_id_from_token(token: str) -> int:
+    """Decode the JWT and return the user id it was issued for."""
+    cached = _token_cache.get(token)
+    if cached is not None:
+        return cached
+
     payload = decode_access_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     user_id = payload.get("sub")
     if user_id is None:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    user_id = int(user_id)
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    _token_cache.set(token, user_id, ttl=expires_in)
+    return user_id
+
+
+def _cache_principal(user: User) -> User:
+    snapshot = {field: getattr(user, field) for field in _PRINCIPAL_FIELDS}
+    _principal_cache.set(user.id, snapshot)
+    return User(**snapshot)
+
+
+def _cached_principal(user_id: int) -> User | None:
+    """Rebuild a detached User from the cached snapshot, if there is one."""
+    snapshot = _principal_cache.get(user_id)
+    return User(**snapshot) if snapshot is not None else None
+
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """Decode JWT token and return the current user."""
+    user_id = _user_id_from_token(token)
+
+    principal = _cached_principal(user_id)
+    if principal is not None:
+        return principal
+
+    user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
-    return user
+    return _cache_principal(user)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """Async variant of get_current_user for routers running on the event loop."""
+    user_id = _user_id_from_token(token)
+
+    principal = _cached_principal(user_id)
+    if principal is not None:
+        return principal
+
+    user = await db.get(User, user_id)
+    if user is None:
+        raise _credentials_exception()
+
+    return _cache_principal(user)
+
+
+def _check_role(current_user: User, roles: tuple[str, ...]) -> User:
+    if current_user.role not in roles:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Access denied. Required role(s): {', '.join(roles)}",
+        )
+    return current_user
 
 
 def require_role(*roles: str):
     """Factory that returns a dependency checking if the user has one of the allowed roles."""
     def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if current_user.role not in roles:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required role(s): {', '.join(roles)}",
-            )
-        return current_user
+        return _check_role(current_user, roles)
+    return role_checker
+
+
+def require_role_async(*roles: str):
+    """Same as require_role, but resolves the user through the async session."""
+    async def role_checker(current_user: User = Depends(get_current_user_async)) -> User:
+        return _check_role(current_user, roles)
     return role_checker
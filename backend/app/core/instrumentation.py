@@ -0,0 +1,156 @@
+"""Request-scoped instrumentation: latency, status and SQL statement accounting.
+
+`RequestMetricsMiddleware` is a plain ASGI middleware (no BaseHTTPMiddleware task
+hop). It publishes a `RequestStats` object through a context variable; the
+engine hooks installed by `instrument_engine` add to whichever request is
+current, including from threadpool workers, which inherit the context.
+
+With QUERY_GUARD_MODE set to "warn" or "raise", statements are also tallied by
+shape (the parameterised SQL text). A shape executed QUERY_REPEAT_THRESHOLD or
+more times in one request is reported as a likely N+1 pattern.
+"""
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+
+from app.core import metrics
+from app.core.config import settings
+
+logger = logging.getLogger("app.requests")
+query_guard_logger = logging.getLogger("app.query_guard")
+
+QUERY_GUARD_MODES = {"off", "warn", "raise"}
+if settings.QUERY_GUARD_MODE not in QUERY_GUARD_MODES:
+    raise ValueError(f"Invalid QUERY_GUARD_MODE {settings.QUERY_GUARD_MODE!r}. Must be one of: {QUERY_GUARD_MODES}")
+
+
+class NPlusOneError(RuntimeError):
+    """Raised in QUERY_GUARD_MODE=raise when a request repeats a statement shape too often."""
+
+
+class RequestStats:
+    __slots__ = ("query_count", "query_time", "statements")
+
+    def __init__(self, track_statements: bool = False):
+        self.query_count = 0
+        self.query_time = 0.0
+        self.statements: dict[str, int] | None = {} if track_statements else None
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed at least `threshold` times, most frequent first."""
+        if not self.statements:
+            return []
+        repeated = [(sql, n) for sql, n in self.statements.items() if n >= threshold]
+        return sorted(repeated, key=lambda item: item[1], reverse=True)
+
+
+_current_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> RequestStats | None:
+    return _current_stats.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count and time every statement executed through `engine`."""
+
+    # The start time lives on the statement's execution context rather than on
+    # the connection: a statement that raises never reaches after_cursor_execute,
+    # and must not leave a stale start behind for the next one.
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_start
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.query_count += 1
+            stats.query_time += elapsed
+            if stats.statements is not None:
+                stats.statements[statement] = stats.statements.get(statement, 0) + 1
+
+
+class RequestMetricsMiddleware:
+    """Record per-route latency, status counts, in-flight requests and SQL usage."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        guard_mode = settings.QUERY_GUARD_MODE
+        stats = RequestStats(track_statements=guard_mode != "off")
+        token = _current_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if guard_mode != "off":
+                    # The handler has finished by the time headers go out (streaming
+                    # bodies aside), so the tally is complete here.
+                    repeated = stats.repeated_statements(settings.QUERY_REPEAT_THRESHOLD)
+                    headers = message.setdefault("headers", [])
+                    headers.append((b"x-query-count", str(stats.query_count).encode()))
+                    if repeated:
+                        headers.append((b"x-query-repeats", str(repeated[0][1]).encode()))
+                        _report_repeats(scope, stats, repeated, guard_mode)
+            await send(message)
+
+        metrics.http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            metrics.http_requests_in_flight.dec()
+            _current_stats.reset(token)
+
+            # Label by route template, not raw path, to keep label cardinality bounded.
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            metrics.http_requests_total.inc(method, route_path, str(status_code))
+            metrics.http_request_duration_seconds.observe(duration, method, route_path)
+            metrics.db_queries_per_request.observe(stats.query_count, route_path)
+            metrics.db_query_time_per_request.observe(stats.query_time, route_path)
+
+            if (
+                status_code >= 500
+                or duration * 1000 >= settings.SLOW_REQUEST_MS
+                or random.random() < settings.REQUEST_LOG_SAMPLE_RATE
+            ):
+                logger.info(
+                    "%s %s status=%s duration_ms=%.1f queries=%d query_ms=%.1f",
+                    method, scope["path"], status_code, duration * 1000,
+                    stats.query_count, stats.query_time * 1000,
+                )
+
+
+def _report_repeats(scope, stats: RequestStats, repeated: list[tuple[str, int]], mode: str) -> None:
+    route = getattr(scope.get("route"), "path", None) or scope["path"]
+    details = [{"count": n, "statement": " ".join(sql.split())[:300]} for sql, n in repeated]
+    if mode == "raise":
+        raise NPlusOneError(
+            f"{scope['method']} {route} executed {stats.query_count} statements; "
+            f"repeated shapes: {details}"
+        )
+    query_guard_logger.warning(
+        "Possible N+1 in %s %s: %d statements, %d repeated shape(s), worst repeated %d times",
+        scope["method"], route, stats.query_count, len(repeated), repeated[0][1],
+        extra={
+            "method": scope["method"],
+            "route": route,
+            "query_count": stats.query_count,
+            "repeated_statements": details,
+        },
+    )
@@ -0,0 +1,75 @@
+"""In-process registry for background jobs started from API requests.
+
+Jobs live in the memory of the worker that started them, so status polling
+must reach the same worker (sticky sessions, or a single worker for admin
+traffic). Only the most recent `max_jobs` are kept.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class Job:
+    kind: str
+    owner_id: int
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"  # queued, running, completed, failed
+    processed: int = 0
+    succeeded: int = 0
+    skipped: int = 0
+    errors: list[str] = field(default_factory=list)
+    detail: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+
+    def skip(self, reason: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(reason)
+
+    def finish(self, status: str, detail: str | None = None) -> None:
+        self.status = status
+        self.detail = detail
+        self.finished_at = datetime.now(timezone.utc)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "detail": self.detail,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobRegistry:
+    def __init__(self, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, kind: str, owner_id: int) -> Job:
+        job = Job(kind=kind, owner_id=owner_id)
+        with self._lock:
+            self._jobs[job.id] = job
+            while len(self._jobs) > self.max_jobs:
+                self._jobs.popitem(last=False)
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+
+jobs = JobRegistry()
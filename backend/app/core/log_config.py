@@ -0,0 +1,38 @@
+"""Application logging routed through a queue.
+
+Handlers that write to a stream take a lock and do blocking I/O. The `app` logger
+only enqueues records; a single listener thread formats and writes them, so a
+log call on the request path never waits on stderr.
+"""
+import logging
+import logging.handlers
+import queue
+
+from app.core.config import settings
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_logging() -> None:
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(settings.LOG_LEVEL)
+    app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    app_logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,101 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+Lists are ordered newest first by a tuple of NOT NULL columns ending in the
+primary key, e.g. (created_at, id). A page fetches `limit` rows strictly after
+the last row of the previous page, so each page costs the same as the first
+(no OFFSET scan) and rows inserted meanwhile never shift or repeat items.
+
+The body stays a plain JSON array. The cursor for the next page is returned
+in the X-Next-Cursor header, with a matching Link: rel="next"; both are absent
+on the last page. Cursors are opaque to clients.
+
+    keyset = Keyset(Grievance.created_at, Grievance.id)
+    rows = keyset.apply(query, page).all()
+    rows, next_cursor = keyset.page(rows, page)
+    link_next(response, request, next_cursor)
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from fastapi import HTTPException, Query, Request, Response
+from sqlalchemy import and_, literal, or_
+
+from app.core.config import settings
+
+
+@dataclass(frozen=True)
+class PageParams:
+    limit: int
+    cursor: str | None = None
+
+
+def page_params(
+    cursor: str | None = Query(None, description="X-Next-Cursor value from the previous page"),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+) -> PageParams:
+    """Dependency reading ?cursor=&limit= for a paginated list endpoint."""
+    return PageParams(limit=limit, cursor=cursor)
+
+
+def invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _load(column, value):
+    python_type = column.type.python_type
+    if python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    return python_type(value)
+
+
+class Keyset:
+    """A descending sort order over `columns`; the last one must be unique (the primary key)."""
+
+    def __init__(self, *columns):
+        self.columns = columns
+
+    def encode(self, row) -> str:
+        values = [getattr(row, column.key) for column in self.columns]
+        raw = json.dumps([v.isoformat() if isinstance(v, (datetime, date)) else v for v in values])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError(cursor)
+            return [_load(column, value) for column, value in zip(self.columns, values)]
+        except (ValueError, TypeError):
+            raise invalid_cursor()
+
+    def _after(self, values: list):
+        """Rows sorting after `values` in descending order, led by an indexable range on the first column."""
+        # Typed binds: SQLAlchemy refuses `<` against a bare True/False.
+        values = [literal(value, column.type) for column, value in zip(self.columns, values)]
+        condition = self.columns[-1] < values[-1]
+        for column, value in zip(reversed(self.columns[:-1]), reversed(values[:-1])):
+            condition = or_(column < value, and_(column == value, condition))
+        return and_(self.columns[0] <= values[0], condition)
+
+    def apply(self, query, page: PageParams):
+        """Order, filter and limit a Select or ORM Query; one extra row tells whether a next page exists."""
+        if page.cursor:
+            query = query.where(self._after(self.decode(page.cursor)))
+        return query.order_by(*(column.desc() for column in self.columns)).limit(page.limit + 1)
+
+    def page(self, rows, page: PageParams) -> tuple[list, str | None]:
+        rows = list(rows)
+        if len(rows) <= page.limit:
+            return rows, None
+        rows = rows[:page.limit]
+        return rows, self.encode(rows[-1])
+
+
+def link_next(response: Response, request: Request, next_cursor: str | None) -> None:
+    if next_cursor is None:
+        return
+    response.headers["X-Next-Cursor"] = next_cursor
+    response.headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
@@ -0,0 +1,50 @@
+"""Fast JSON path for large list endpoints.
+
+Routers normally build response schemas by hand and return them, after which
+FastAPI validates every item a second time against `response_model` and
+encodes the result with json.dumps. On lists of thousands of rows that work
+dominates the request.
+
+Endpoints on the fast path instead project ORM rows into plain dicts shaped
+like their response schema and return a FastJSONResponse. FastAPI passes a
+Response through untouched, and pydantic-core encodes the whole list in one
+call. `response_model` stays on the route, so the OpenAPI schema is unchanged.
+
+Nothing is validated on this path: only use it where the ORM columns already
+have the types the schema declares. `python -m benchmarks.serialization`
+measures both paths.
+"""
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core (handles datetimes, dates and models natively)."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def _schema_fields(schema: type[BaseModel]) -> tuple[tuple[str, Any], ...]:
+    return tuple(
+        (name, field.get_default(call_default_factory=True))
+        for name, field in schema.model_fields.items()
+    )
+
+
+def project(obj: Any, schema: type[BaseModel], **values: Any) -> dict[str, Any]:
+    """Shape `obj` like `schema` without validating it.
+
+    Fields given in `values` win; the rest are read from `obj` by name, falling
+    back to the schema default when `obj` has no such attribute. Keys come out
+    in schema order, as response_model would produce them.
+    """
+    return {
+        name: values[name] if name in values else getattr(obj, name, default)
+        for name, default in _schema_fields(schema)
+    }
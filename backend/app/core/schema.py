@@ -0,0 +1,164 @@
+"""Schema versioning on top of Alembic.
+
+Workers no longer call `create_all` on boot. Instead they read the single row
+in `alembic_version` and compare it with SCHEMA_REVISION, the head revision this
+code was written against. Only on a mismatch is Alembic imported and, when
+DB_AUTO_MIGRATE is on, the database upgraded.
+
+Databases created by the old create_all() startup path have no
+`alembic_version`. They are adopted at BASELINE_REVISION, but only after their
+tables are compared with that revision. create_all() never altered an existing
+table, so such a database can lack columns added to a model later, or keep an
+old NULL-able column. Both are repaired before the stamp. Any other difference
+stops the upgrade instead of stamping a schema that does not match.
+
+Bump SCHEMA_REVISION whenever a migration is added under alembic/versions.
+"""
+import logging
+from itertools import groupby
+from pathlib import Path
+
+from sqlalchemy import Column, Engine, MetaData, create_engine, func, inspect, select, text
+from sqlalchemy.pool import NullPool, StaticPool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_REVISION = "0007"
+BASELINE_REVISION = "0001"
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def import_all_models() -> None:
+    """Import every model module so Base.metadata describes the full schema."""
+    from app.models import (  # noqa: F401
+        academic_event, announcement, attendance, audit_log, caravan_mercenary, clubs,
+        collection_version, course, forum, grievance, incident, internship, location,
+        lost_found, resource, stat_counter, task, user,
+    )
+
+
+def stored_revision(engine: Engine) -> str | None:
+    with engine.connect() as conn:
+        if not inspect(conn).has_table("alembic_version"):
+            return None
+        return conn.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+
+def _alembic_config():
+    from alembic.config import Config
+
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def _baseline_metadata() -> MetaData:
+    """The schema at BASELINE_REVISION, reflected from a scratch in-memory database."""
+    from alembic import command
+
+    scratch = create_engine("sqlite://", poolclass=StaticPool)
+    config = _alembic_config()
+    with scratch.begin() as conn:
+        config.attributes["connection"] = conn
+        command.upgrade(config, BASELINE_REVISION)
+    metadata = MetaData()
+    metadata.reflect(scratch)
+    metadata.remove(metadata.tables["alembic_version"])
+    return metadata
+
+
+def _legacy_drift(engine: Engine, baseline: MetaData) -> tuple[list[Column], list[Column], list[str]]:
+    """How a pre-Alembic database differs from the baseline, by table and column.
+
+    Returns (columns to add, columns to make NOT NULL, differences that cannot be repaired).
+    """
+    missing, nullable, blockers = [], [], []
+    live = inspect(engine)
+    with engine.connect() as conn:
+        for table in baseline.sorted_tables:
+            if not live.has_table(table.name):
+                blockers.append(f"table {table.name} is missing")
+                continue
+            live_columns = {column["name"]: column for column in live.get_columns(table.name)}
+            for column in table.columns:
+                found = live_columns.get(column.name)
+                if found is None:
+                    if column.nullable:
+                        missing.append(column)
+                    else:
+                        blockers.append(f"NOT NULL column {table.name}.{column.name} is missing")
+                elif found["nullable"] and not column.nullable:
+                    nulls = conn.scalar(
+                        select(func.count()).select_from(text(table.name)).where(text(f"{column.name} IS NULL"))
+                    )
+                    if nulls:
+                        blockers.append(f"{table.name}.{column.name} must be NOT NULL but {nulls} rows are NULL")
+                    else:
+                        nullable.append(column)
+    return missing, nullable, blockers
+
+
+def _repair_legacy_schema(engine: Engine, missing: list[Column], nullable: list[Column]) -> None:
+    from alembic.migration import MigrationContext
+    from alembic.operations import Operations
+
+    # A fresh engine, without the app's connect hooks: on SQLite, making a column
+    # NOT NULL rebuilds the table, which must not run with foreign_keys=ON.
+    repair_engine = create_engine(engine.url, poolclass=NullPool)
+    with repair_engine.begin() as conn:
+        op = Operations(MigrationContext.configure(conn))
+        for column in missing:
+            logger.warning("Adding column %s.%s missing from the pre-migration database", column.table.name, column.name)
+            op.add_column(column.table.name, Column(column.name, column.type, nullable=True))
+        for table_name, columns in groupby(nullable, key=lambda column: column.table.name):
+            with op.batch_alter_table(table_name) as batch:
+                for column in columns:
+                    logger.warning("Making %s.%s NOT NULL as in the baseline", table_name, column.name)
+                    batch.alter_column(column.name, existing_type=column.type, nullable=False)
+    repair_engine.dispose()
+
+
+def _adopt_legacy_database(engine: Engine, config) -> None:
+    """Repair a create_all() database to the baseline schema and stamp it, or refuse."""
+    from alembic import command
+
+    missing, nullable, blockers = _legacy_drift(engine, _baseline_metadata())
+    if blockers:
+        raise RuntimeError(
+            f"Pre-migration database does not match baseline revision {BASELINE_REVISION}: "
+            + "; ".join(blockers)
+        )
+    if missing or nullable:
+        _repair_legacy_schema(engine, missing, nullable)
+    logger.info("Stamping pre-migration database at baseline revision %s", BASELINE_REVISION)
+    command.stamp(config, BASELINE_REVISION)
+
+
+def upgrade_schema(engine: Engine) -> None:
+    """Bring the database to the head revision, adopting pre-Alembic databases at the baseline."""
+    from alembic import command
+
+    config = _alembic_config()
+    if stored_revision(engine) is None and inspect(engine).has_table("users"):
+        _adopt_legacy_database(engine, config)
+    command.upgrade(config, "head")
+
+
+def ensure_schema(engine: Engine) -> None:
+    """Startup check: one query when the schema is current, migrate or fail otherwise."""
+    revision = stored_revision(engine)
+    if revision == SCHEMA_REVISION:
+        return
+
+    if not settings.DB_AUTO_MIGRATE:
+        raise RuntimeError(
+            f"Database schema revision is {revision!r} but this build expects {SCHEMA_REVISION!r}. "
+            "Run `alembic upgrade head` from the backend directory."
+        )
+
+    logger.info("Database schema revision %r != %r, running migrations", revision, SCHEMA_REVISION)
+    upgrade_schema(engine)
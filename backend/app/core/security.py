@@ -1,3 +1,8 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -6,8 +11,17 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# Password hashing. Pinning min/max rounds to the configured cost makes
+# verify_and_update() flag hashes made at any other cost for a rehash.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 def hash_password(password: str) -> str:
@@ -18,6 +32,80 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _verify_and_update(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+# --- Hashing pool ---
+# bcrypt is deliberately slow. Running it inline or on the shared threadpool
+# lets a login storm starve every other endpoint, so it gets its own bounded
+# process pool. At most PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_SIZE jobs
+# may be running or waiting; beyond that callers get PasswordHashingBusy.
+
+class PasswordHashingBusy(Exception):
+    """Raised when the hashing pool's queue is full."""
+
+
+_hash_pool: ProcessPoolExecutor | None = None
+_hash_slots: asyncio.Semaphore | None = None
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        # spawn, not fork: forking a worker that already runs threads is unsafe
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _hash_pool
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _hash_pool
+    # Concurrent jobs all see the same broken pool; only the first replaces it.
+    if _hash_pool is pool:
+        logger.warning("Password hashing pool is broken (a worker died); starting a new one")
+        pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
+async def _run_hash_job(fn, *args):
+    global _hash_slots
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return await asyncio.to_thread(fn, *args)
+    if _hash_slots is None:
+        _hash_slots = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_QUEUE_SIZE)
+    if _hash_slots.locked():
+        raise PasswordHashingBusy()
+    loop = asyncio.get_running_loop()
+    async with _hash_slots:
+        pool = _get_hash_pool()
+        try:
+            return await loop.run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            # A worker was killed (OOM, signal) and took the pool down with it. Retry once on a new pool.
+            _discard_broken_pool(pool)
+            return await loop.run_in_executor(_get_hash_pool(), fn, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hash_job(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify off the event loop. Returns (valid, new_hash); new_hash is set when the stored cost is outdated."""
+    return await _run_hash_job(_verify_and_update, plain_password, hashed_password)
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool, _hash_slots
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+    _hash_slots = None
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     if "sub" in to_encode:
@@ -32,8 +120,8 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         return payload
     except JWTError as e:
-        print(f"[AUTH DEBUG] JWT Decode Error: {str(e)}")
+        logger.debug("JWT decode error: %s", e)
         return None
-    except Exception as e:
-        print(f"[AUTH DEBUG] Unexpected Error during Decode: {str(e)}")
+    except Exception:
+        logger.exception("Unexpected error while decoding JWT")
         return None
@@ -0,0 +1,121 @@
+"""Per-connection SQLite tuning.
+
+Every connection SQLAlchemy opens against a SQLite database gets the pragmas
+resolved here. A profile supplies the defaults and any SQLITE_* setting that is
+set explicitly overrides the profile value.
+"""
+import logging
+
+from sqlalchemy import Engine, event, text
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROFILES: dict[str, dict[str, str | int]] = {
+    # Mixed traffic: the default for a single-box deployment.
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "mmap_size": 128 * 1024 * 1024,
+        "cache_size": -16000,  # negative = KiB
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+        "wal_autocheckpoint": 1000,
+    },
+    # Dashboards and list endpoints dominate: map more of the file, cache more pages.
+    "read_heavy": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "mmap_size": 512 * 1024 * 1024,
+        "cache_size": -64000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+        "wal_autocheckpoint": 1000,
+    },
+    # Write bursts (registration, attendance): wait longer for the write lock
+    # and checkpoint less often so writers are not stalled by the checkpointer.
+    "write_heavy": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 15000,
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -32000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+        "wal_autocheckpoint": 4000,
+    },
+}
+
+_ALLOWED_VALUES = {
+    "journal_mode": {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"},
+    "synchronous": {"OFF", "NORMAL", "FULL", "EXTRA"},
+    "temp_store": {"DEFAULT", "FILE", "MEMORY"},
+    "foreign_keys": {"ON", "OFF"},
+}
+
+# journal_mode is persistent and takes a lock to change, so it goes first and
+# is only issued when it differs from what the file already uses.
+_ORDER = ("journal_mode", "busy_timeout", "synchronous", "mmap_size", "cache_size", "temp_store", "foreign_keys", "wal_autocheckpoint")
+
+
+def resolve_pragmas() -> dict[str, str | int]:
+    """Return the effective pragma values for the configured profile and overrides."""
+    if settings.SQLITE_PROFILE not in PROFILES:
+        raise ValueError(f"Unknown SQLITE_PROFILE {settings.SQLITE_PROFILE!r}. Must be one of: {set(PROFILES)}")
+
+    pragmas = dict(PROFILES[settings.SQLITE_PROFILE])
+    overrides = {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "foreign_keys": None if settings.SQLITE_FOREIGN_KEYS is None else ("ON" if settings.SQLITE_FOREIGN_KEYS else "OFF"),
+    }
+    for name, value in overrides.items():
+        if value is not None:
+            pragmas[name] = value.upper() if isinstance(value, str) else value
+
+    for name, allowed in _ALLOWED_VALUES.items():
+        if pragmas[name] not in allowed:
+            raise ValueError(f"Invalid SQLite {name} {pragmas[name]!r}. Must be one of: {allowed}")
+    return pragmas
+
+
+def configure_sqlite(engine: Engine) -> None:
+    """Register a connect hook that applies the resolved pragmas to every new connection."""
+    pragmas = resolve_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA journal_mode")
+            current_mode = str(cursor.fetchone()[0]).upper()
+            for name in _ORDER:
+                if name == "journal_mode" and current_mode == pragmas[name]:
+                    continue
+                cursor.execute(f"PRAGMA {name} = {pragmas[name]}")
+        finally:
+            cursor.close()
+
+
+def pragma_report(engine: Engine) -> dict[str, str | int]:
+    """Read back the pragmas as SQLite actually applied them on a live connection."""
+    with engine.connect() as conn:
+        return {name: conn.execute(text(f"PRAGMA {name}")).scalar() for name in _ORDER}
+
+
+def log_pragma_report(engine: Engine) -> None:
+    effective = pragma_report(engine)
+    requested = resolve_pragmas()
+    logger.info("SQLite profile %r effective pragmas: %s", settings.SQLITE_PROFILE, effective)
+    if str(effective["journal_mode"]).upper() != requested["journal_mode"]:
+        # e.g. WAL is refused for in-memory databases and some network filesystems
+        logger.warning(
+            "SQLite journal_mode is %s, requested %s", effective["journal_mode"], requested["journal_mode"],
+        )
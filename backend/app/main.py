@@ -1,31 +1,57 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 import os
 
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import SessionLocal, engine, async_engine
+from app.core.instrumentation import RequestMetricsMiddleware
+from app.core.log_config import setup_logging, shutdown_logging
+from app.core.metrics import registry
+from app.core.schema import ensure_schema
+from app.core.security import PasswordHashingBusy, shutdown_hash_pool
+from app.core.sqlite_pragmas import log_pragma_report
+from app.services.forum_votes import run_flusher, vote_buffer
 from app.api import (
     auth, grievances, courses, internships, users, dashboard,
     attendance, resources, calendar, tasks, lost_found, announcements,
-    commons, clubs, emergency, map,
+    forum, commons, clubs, emergency, map,
 )
 
-# Import all models so SQLAlchemy knows about them for create_all
-from app.models import user, grievance, course, internship  # noqa: F401
-from app.models import attendance as attendance_model  # noqa: F401
-from app.models import resource, academic_event, task  # noqa: F401
-from app.models import lost_found as lost_found_model  # noqa: F401
-from app.models import announcement, audit_log  # noqa: F401
-from app.models import caravan_mercenary, clubs as clubs_model, incident, location # noqa: F401
-
-# Create all tables
-Base.metadata.create_all(bind=engine)
-
 # Create uploads directory
 os.makedirs("uploads", exist_ok=True)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    # Schema is managed by Alembic (alembic/versions); this is a single version lookup
+    # when the database is current.
+    ensure_schema(engine)
+    if engine.dialect.name == "sqlite":
+        log_pragma_report(engine)
+    vote_flusher = None
+    if settings.FORUM_VOTE_FLUSH_SECONDS > 0:
+        vote_flusher = asyncio.create_task(
+            run_flusher(vote_buffer, SessionLocal, settings.FORUM_VOTE_FLUSH_SECONDS)
+        )
+    yield
+    if vote_flusher is not None:
+        vote_flusher.cancel()  # flushes what is still pending before it exits
+        with suppress(asyncio.CancelledError):
+            await vote_flusher
+    shutdown_hash_pool()
+    await async_engine.dispose()
+    engine.dispose()
+    shutdown_logging()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.APP_NAME,
     description="Unified Campus Governance Platform — One Identity. One Platform. One Campus.",
     version="2.0.0",
@@ -33,9 +59,6 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
-from fastapi import Request
-import time
-
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -43,15 +66,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Link"],
 )
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    duration = time.time() - start_time
-    print(f"DEBUG: {request.method} {request.url.path} - Status: {response.status_code} - In: {duration:.4f}s")
-    return response
+if settings.METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many sign-in requests right now. Please retry in a few seconds."},
+        headers={"Retry-After": "2"},
+    )
 
 # Static files for uploads
 app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
@@ -75,7 +103,7 @@ app.include_router(tasks.router)
 # Additional functionality
 app.include_router(lost_found.router)
 app.include_router(announcements.router)
-# app.include_router(forum.router)
+app.include_router(forum.router)
 app.include_router(commons.router)
 app.include_router(clubs.router)
 app.include_router(emergency.router)
@@ -95,3 +123,9 @@ def root():
 @app.get("/health", tags=["Health"])
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+def metrics():
+    """Prometheus text exposition of the in-process metrics registry."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -19,5 +19,5 @@ class AcademicEvent(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    creator = relationship("User", lazy="joined")
-    course = relationship("Course", lazy="joined")
+    creator = relationship("User", lazy="raise_on_sql")
+    course = relationship("Course", lazy="raise_on_sql")
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Boolean
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class Announcement(Base):
     __tablename__ = "announcements"
+    # Keyset pagination sort orders (app.core.pagination)
+    __table_args__ = (
+        Index("ix_announcements_pinned_created_at_id", "pinned", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -18,4 +22,4 @@ class Announcement(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    poster = relationship("User", lazy="joined")
+    poster = relationship("User", lazy="raise_on_sql")
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone, date
 
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Date, Boolean
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Date, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,11 @@ from app.core.database import Base
 
 class Attendance(Base):
     __tablename__ = "attendance"
+    __table_args__ = (
+        # One mark per student, course and day; also serves per-student lookups.
+        Index("ix_attendance_student_id_course_id_date", "student_id", "course_id", "date", unique=True),
+        Index("ix_attendance_course_id_date", "course_id", "date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     student_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
@@ -17,5 +22,5 @@ class Attendance(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    student = relationship("User", lazy="joined")
-    course = relationship("Course", lazy="joined")
+    student = relationship("User", lazy="raise_on_sql")
+    course = relationship("Course", lazy="raise_on_sql")
@@ -18,4 +18,4 @@ class AuditLog(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    user = relationship("User", lazy="joined")
+    user = relationship("User", lazy="raise_on_sql")
@@ -22,7 +22,7 @@ class CaravanPool(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    poster = relationship("User", foreign_keys=[posted_by], lazy="joined")
+    poster = relationship("User", foreign_keys=[posted_by], lazy="raise_on_sql")
 
 
 class MercenaryGig(Base):
@@ -42,5 +42,5 @@ class MercenaryGig(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    poster = relationship("User", foreign_keys=[posted_by], lazy="joined")
-    worker = relationship("User", foreign_keys=[assigned_to], lazy="joined")
+    poster = relationship("User", foreign_keys=[posted_by], lazy="raise_on_sql")
+    worker = relationship("User", foreign_keys=[assigned_to], lazy="raise_on_sql")
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -18,12 +18,15 @@ class Club(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    lead = relationship("User", lazy="joined")
-    members = relationship("ClubMember", back_populates="club", lazy="selectin")
+    lead = relationship("User", lazy="raise_on_sql")
+    members = relationship("ClubMember", back_populates="club", lazy="raise_on_sql")
 
 
 class ClubMember(Base):
     __tablename__ = "club_members"
+    __table_args__ = (
+        Index("ix_club_members_club_id_user_id", "club_id", "user_id", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     club_id: Mapped[int] = mapped_column(Integer, ForeignKey("clubs.id"), nullable=False)
@@ -32,12 +35,15 @@ class ClubMember(Base):
     joined_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    club = relationship("Club", back_populates="members")
-    user = relationship("User", lazy="joined")
+    club = relationship("Club", back_populates="members", lazy="raise_on_sql")
+    user = relationship("User", lazy="raise_on_sql")
 
 
 class ClubEvent(Base):
     __tablename__ = "club_events"
+    __table_args__ = (
+        Index("ix_club_events_club_id_event_date", "club_id", "event_date"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     club_id: Mapped[int] = mapped_column(Integer, ForeignKey("clubs.id"), nullable=False)
@@ -50,6 +56,9 @@ class ClubEvent(Base):
 
 class ClubAnnouncement(Base):
     __tablename__ = "club_announcements"
+    __table_args__ = (
+        Index("ix_club_announcements_club_id_created_at", "club_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     club_id: Mapped[int] = mapped_column(Integer, ForeignKey("clubs.id"), nullable=False)
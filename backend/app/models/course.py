@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,9 @@ from app.core.database import Base
 
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        Index("ix_courses_faculty_id", "faculty_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -20,11 +23,16 @@ class Course(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    faculty = relationship("User", lazy="joined")
+    faculty = relationship("User", lazy="raise_on_sql")
+    enrollments = relationship("Enrollment", back_populates="course", lazy="raise_on_sql")
 
 
 class Enrollment(Base):
     __tablename__ = "enrollments"
+    __table_args__ = (
+        Index("ix_enrollments_student_id_course_id", "student_id", "course_id", unique=True),
+        Index("ix_enrollments_course_id", "course_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     student_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
@@ -32,5 +40,5 @@ class Enrollment(Base):
     enrolled_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    student = relationship("User", lazy="joined")
-    course = relationship("Course", backref="enrollments", lazy="joined")
+    student = relationship("User", lazy="raise_on_sql")
+    course = relationship("Course", back_populates="enrollments", lazy="raise_on_sql")
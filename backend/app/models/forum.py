@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Text, DateTime, Integer, SmallInteger, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -9,6 +9,9 @@ from app.core.database import Base
 
 class ForumComment(Base):
     __tablename__ = "forum_comments"
+    __table_args__ = (
+        Index("ix_forum_comments_post_id_created_at", "post_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     post_id: Mapped[int] = mapped_column(Integer, ForeignKey("forum_posts.id"), nullable=False)
@@ -20,12 +23,15 @@ class ForumComment(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    author: Mapped["User"] = relationship("User", lazy="joined")
-    post: Mapped["ForumPost"] = relationship("ForumPost", back_populates="comments")
+    author: Mapped["User"] = relationship("User", lazy="raise_on_sql")
+    post: Mapped["ForumPost"] = relationship("ForumPost", back_populates="comments", lazy="raise_on_sql")
 
 
 class ForumPost(Base):
     __tablename__ = "forum_posts"
+    __table_args__ = (
+        Index("ix_forum_posts_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -33,10 +39,24 @@ class ForumPost(Base):
     category: Mapped[str] = mapped_column(String(30), default="general")  # academics, campus_life, events, tech_support, general
     image_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     author_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
+    # Applied in batches by app.services.forum_votes; forum_votes has the individual votes.
     upvotes: Mapped[int] = mapped_column(Integer, default=0)
     downvotes: Mapped[int] = mapped_column(Integer, default=0)
+    # Maintained by add_comment / delete_comment; resynced by reconcile_counters.py
+    comment_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    author: Mapped["User"] = relationship("User", lazy="joined")
-    comments: Mapped[list["ForumComment"]] = relationship("ForumComment", back_populates="post", lazy="selectin", cascade="all, delete-orphan")
+    author: Mapped["User"] = relationship("User", lazy="raise_on_sql")
+    # Threads are read through app.services.forum_threads rather than this collection.
+    comments: Mapped[list["ForumComment"]] = relationship("ForumComment", back_populates="post", lazy="raise_on_sql", cascade="all, delete-orphan")
+
+
+class ForumVote(Base):
+    """One user's vote on a post; the primary key allows a single vote per user."""
+    __tablename__ = "forum_votes"
+
+    post_id: Mapped[int] = mapped_column(Integer, ForeignKey("forum_posts.id"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), primary_key=True)
+    value: Mapped[int] = mapped_column(SmallInteger, nullable=False)  # 1 up, -1 down
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
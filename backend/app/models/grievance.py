@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,13 @@ from app.core.database import Base
 
 class Grievance(Base):
     __tablename__ = "grievances"
+    # Keyset pagination sort orders (app.core.pagination)
+    __table_args__ = (
+        Index("ix_grievances_created_at_id", "created_at", "id"),
+        Index("ix_grievances_submitted_by_created_at_id", "submitted_by", "created_at", "id"),
+        Index("ix_grievances_assigned_to_created_at_id", "assigned_to", "created_at", "id"),
+        Index("ix_grievances_status_created_at_id", "status", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -24,12 +31,21 @@ class Grievance(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    submitter = relationship("User", foreign_keys=[submitted_by], lazy="joined")
-    assignee = relationship("User", foreign_keys=[assigned_to], lazy="joined")
+    submitter = relationship("User", foreign_keys=[submitted_by], lazy="raise_on_sql")
+    assignee = relationship("User", foreign_keys=[assigned_to], lazy="raise_on_sql")
+    # The list counts comments, the detail selectin-loads them, and
+    # GET /{id}/comments pages through them.
+    comments = relationship(
+        "GrievanceComment", back_populates="grievance", lazy="raise_on_sql",
+        order_by="GrievanceComment.created_at", cascade="all, delete-orphan",
+    )
 
 
 class GrievanceComment(Base):
     __tablename__ = "grievance_comments"
+    __table_args__ = (
+        Index("ix_grievance_comments_grievance_id_created_at", "grievance_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     grievance_id: Mapped[int] = mapped_column(Integer, ForeignKey("grievances.id"), nullable=False)
@@ -38,5 +54,5 @@ class GrievanceComment(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    user = relationship("User", lazy="joined")
-    grievance = relationship("Grievance", backref="comments", lazy="joined")
+    user = relationship("User", lazy="raise_on_sql")
+    grievance = relationship("Grievance", back_populates="comments", lazy="raise_on_sql")
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Float
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class Incident(Base):
     __tablename__ = "incidents"
+    # Keyset pagination sort orders (app.core.pagination)
+    __table_args__ = (
+        Index("ix_incidents_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
@@ -20,4 +24,4 @@ class Incident(Base):
     resolution_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Relationships
-    user = relationship("User", lazy="joined")
+    user = relationship("User", lazy="raise_on_sql")
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone, date
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Date
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class Internship(Base):
     __tablename__ = "internships"
+    __table_args__ = (
+        Index("ix_internships_created_at_id", "created_at", "id"),
+        Index("ix_internships_posted_by", "posted_by"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -23,11 +27,16 @@ class Internship(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    poster = relationship("User", lazy="joined")
+    poster = relationship("User", lazy="raise_on_sql")
+    applications = relationship("Application", back_populates="internship", lazy="raise_on_sql")
 
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_internship_id_student_id", "internship_id", "student_id", unique=True),
+        Index("ix_applications_student_id", "student_id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     student_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
@@ -38,5 +47,5 @@ class Application(Base):
     applied_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    student = relationship("User", lazy="joined")
-    internship = relationship("Internship", backref="applications", lazy="joined")
+    student = relationship("User", lazy="raise_on_sql")
+    internship = relationship("Internship", back_populates="applications", lazy="raise_on_sql")
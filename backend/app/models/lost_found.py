@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class LostFoundItem(Base):
     __tablename__ = "lost_found_items"
+    # Keyset pagination sort orders (app.core.pagination)
+    __table_args__ = (
+        Index("ix_lost_found_items_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -22,5 +26,5 @@ class LostFoundItem(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    poster = relationship("User", foreign_keys=[posted_by], lazy="joined")
-    claimer = relationship("User", foreign_keys=[claimed_by], lazy="joined")
+    poster = relationship("User", foreign_keys=[posted_by], lazy="raise_on_sql")
+    claimer = relationship("User", foreign_keys=[claimed_by], lazy="raise_on_sql")
@@ -0,0 +1,11 @@
+from sqlalchemy import String, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from app.core.database import Base
+
+
+class StatCounter(Base):
+    """A named running total, adjusted in the same transaction as the rows it counts (see app.core.counters)."""
+    __tablename__ = "stat_counters"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone, date
 
-from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Date
+from sqlalchemy import String, Text, DateTime, Integer, ForeignKey, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    # Keyset pagination sort orders (app.core.pagination)
+    __table_args__ = (
+        Index("ix_tasks_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -20,4 +24,4 @@ class Task(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
-    user = relationship("User", lazy="joined")
+    user = relationship("User", lazy="raise_on_sql")
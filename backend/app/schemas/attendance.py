@@ -19,3 +19,67 @@ class AttendanceResponse(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class AttendanceTotals(BaseModel):
+    total_classes: int
+    present: int
+    absent: int
+    late: int
+    percentage: float
+
+
+class CourseAttendanceSummary(AttendanceTotals):
+    course_id: int
+    course_name: str | None = None
+    course_code: str | None = None
+
+
+class StudentAttendance(AttendanceTotals):
+    student_id: int
+    student_name: str | None = None
+    at_risk: bool = False
+
+
+class CourseAttendanceReport(BaseModel):
+    course_id: int
+    course_code: str
+    course_name: str
+    threshold: float
+    students: list[StudentAttendance]
+
+
+class AtRiskAttendance(AttendanceTotals):
+    student_id: int
+    student_name: str | None = None
+    course_id: int
+    course_code: str
+    course_name: str
+
+
+class RosterMark(BaseModel):
+    student_id: int
+    status: str = "present"  # present, absent, late
+
+
+class RosterAttendance(BaseModel):
+    date: date
+    marks: list[RosterMark]
+
+
+class RosterAttendanceResult(BaseModel):
+    course_id: int
+    date: date
+    marked: int
+
+
+class AttendanceMatrix(BaseModel):
+    """Columnar grid: marks[i][j] is the code of student_ids[i] on dates[j]."""
+    course_id: int
+    course_code: str
+    course_name: str
+    codes: dict[str, str]
+    dates: list[date]
+    student_ids: list[int]
+    student_names: list[str]
+    marks: list[str]
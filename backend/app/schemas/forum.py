@@ -24,6 +24,8 @@ class ForumCommentResponse(BaseModel):
     upvotes: int
     downvotes: int
     created_at: datetime
+    reply_count: int = 0  # direct replies, including those not shown in `replies`
+    replies: list["ForumCommentResponse"] = []
 
     model_config = {"from_attributes": True}
 
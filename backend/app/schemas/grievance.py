@@ -52,3 +52,25 @@ class GrievanceResponse(BaseModel):
     comments: list[GrievanceCommentResponse] = []
 
     model_config = {"from_attributes": True}
+
+
+class GrievanceSummary(BaseModel):
+    """List view of a grievance: the comment timeline is counted, not included."""
+    id: int
+    title: str
+    description: str
+    category: str
+    priority: str
+    status: str
+    location: str | None = None
+    image_url: str | None = None
+    is_anonymous: bool = False
+    submitted_by: int
+    submitter_name: str | None = None
+    assigned_to: int | None
+    assignee_name: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    comment_count: int = 0
+
+    model_config = {"from_attributes": True}
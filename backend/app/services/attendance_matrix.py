@@ -0,0 +1,138 @@
+"""Students × dates attendance grid for one course.
+
+Only (student_id, date, status) tuples are read, through the
+(course_id, date) index, and packed into a byte array with one ASCII code per
+cell, row-major by student:
+
+    P present   A absent   L late   ? any other status   - no mark
+
+A student's row therefore decodes straight to a string, with no object per
+cell. Rows are the enrolled students by name; columns are the dates on which
+anyone in the course was marked.
+
+The grid is emitted columnar: parallel `student_ids`, `student_names` and
+`marks` arrays, where each mark string has one code per entry of `dates`. It
+can also be emitted as CSV with one row per student. Both encoders yield
+chunks of rows, so a large course can be streamed without building the body
+in memory.
+"""
+import csv
+import io
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+
+from pydantic_core import to_json
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.course import Enrollment
+from app.models.user import User
+
+CODES = {"present": "P", "absent": "A", "late": "L"}
+OTHER = "?"
+UNMARKED = "-"
+CODE_NAMES = {**{code: status for status, code in CODES.items()}, OTHER: "other", UNMARKED: "unmarked"}
+
+_CODE_BYTES = {status: ord(code) for status, code in CODES.items()}
+_CSV_CELLS = {code: ("" if code == UNMARKED else status) for code, status in CODE_NAMES.items()}
+
+
+@dataclass
+class AttendanceMatrix:
+    dates: list[date]
+    student_ids: list[int]
+    student_names: list[str]
+    cells: array  # unsigned bytes, len(student_ids) * len(dates)
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    def row(self, index: int) -> str:
+        width = len(self.dates)
+        return self.cells[index * width:(index + 1) * width].tobytes().decode("ascii")
+
+    def chunks(self, size: int) -> Iterator[range]:
+        for start in range(0, len(self), size):
+            yield range(start, min(start + size, len(self)))
+
+
+def build(db: Session, course_id: int, date_from: date | None = None, date_to: date | None = None) -> AttendanceMatrix:
+    window = [Attendance.course_id == course_id]
+    if date_from is not None:
+        window.append(Attendance.date >= date_from)
+    if date_to is not None:
+        window.append(Attendance.date <= date_to)
+
+    students = db.execute(
+        select(Enrollment.student_id, User.name)
+        .join(User, User.id == Enrollment.student_id)
+        .where(Enrollment.course_id == course_id)
+        .order_by(User.name, Enrollment.student_id)
+    ).all()
+    dates = list(db.scalars(select(Attendance.date).where(*window).distinct().order_by(Attendance.date)))
+
+    width = len(dates)
+    row_of = {student_id: index for index, (student_id, _) in enumerate(students)}
+    column_of = {day: index for index, day in enumerate(dates)}
+    cells = array("B", UNMARKED.encode() * (len(students) * width))
+    marks = db.execute(
+        select(Attendance.student_id, Attendance.date, Attendance.status)
+        .where(*window)
+        .execution_options(yield_per=5000)
+    )
+    for student_id, day, status in marks:
+        row = row_of.get(student_id)
+        if row is None:  # marked, but no longer enrolled
+            continue
+        cells[row * width + column_of[day]] = _CODE_BYTES.get(status, ord(OTHER))
+
+    return AttendanceMatrix(
+        dates=dates,
+        student_ids=[student_id for student_id, _ in students],
+        student_names=[name for _, name in students],
+        cells=cells,
+    )
+
+
+def _json_array(batches: Iterable[list]) -> Iterator[bytes]:
+    yield b"["
+    first = True
+    for batch in batches:
+        if batch:
+            if not first:
+                yield b","
+            yield to_json(batch)[1:-1]
+            first = False
+    yield b"]"
+
+
+def json_chunks(matrix: AttendanceMatrix, header: dict, rows_per_chunk: int) -> Iterator[bytes]:
+    """The matrix as one JSON object: `header`'s fields, then the columnar grid."""
+    yield to_json({**header, "codes": CODE_NAMES, "dates": matrix.dates})[:-1]
+    yield b',"student_ids":'
+    yield from _json_array(matrix.student_ids[rows.start:rows.stop] for rows in matrix.chunks(rows_per_chunk))
+    yield b',"student_names":'
+    yield from _json_array(matrix.student_names[rows.start:rows.stop] for rows in matrix.chunks(rows_per_chunk))
+    yield b',"marks":'
+    yield from _json_array([matrix.row(i) for i in rows] for rows in matrix.chunks(rows_per_chunk))
+    yield b"}"
+
+
+def csv_chunks(matrix: AttendanceMatrix, rows_per_chunk: int) -> Iterator[bytes]:
+    """The matrix as CSV: student_id, student_name, then one status column per date (empty: no mark)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["student_id", "student_name", *(day.isoformat() for day in matrix.dates)])
+    for rows in matrix.chunks(rows_per_chunk):
+        for i in rows:
+            writer.writerow([
+                matrix.student_ids[i], matrix.student_names[i], *(_CSV_CELLS[code] for code in matrix.row(i)),
+            ])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
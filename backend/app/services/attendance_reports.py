@@ -0,0 +1,131 @@
+"""Attendance aggregates, each computed by one grouped query.
+
+    student_summary   a student's totals per enrolled course
+    course_report     every enrolled student's totals in one course
+    below_threshold   a page of (student, course) pairs under the attendance threshold
+
+Totals count a student's own attendance rows: `percentage` is present marks
+over all marks, so "late" counts against it, as it always has.
+"""
+from collections.abc import Iterable
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import Session
+
+from app.core.pagination import Keyset, PageParams
+from app.models.attendance import Attendance
+from app.models.course import Course, Enrollment
+from app.models.user import User
+
+
+# Follows the unique (student_id, course_id, date) index, so groups come out in
+# index order and a page stops reading once it has found `limit` pairs.
+_at_risk_keyset = Keyset(Attendance.student_id, Attendance.course_id)
+
+
+def _tallies(status) -> tuple:
+    """total_classes, present, absent, late over the rows of a group."""
+    return (
+        func.count(status).label("total_classes"),
+        func.count(case((status == "present", 1))).label("present"),
+        func.count(case((status == "absent", 1))).label("absent"),
+        func.count(case((status == "late", 1))).label("late"),
+    )
+
+
+def percentage(present: int, total: int) -> float:
+    return round(present / total * 100, 1) if total > 0 else 0
+
+
+def _below(present, total, threshold: float):
+    """present / total < threshold percent, compared exactly (`percentage` is rounded for display)."""
+    return present * 100 < threshold * total
+
+
+def _with_percentage(row) -> dict:
+    values = row._asdict()
+    values["percentage"] = percentage(values["present"], values["total_classes"])
+    return values
+
+
+def _marks_of_enrolled():
+    return and_(Attendance.student_id == Enrollment.student_id, Attendance.course_id == Enrollment.course_id)
+
+
+def student_summary(db: Session, student_id: int) -> list[dict]:
+    rows = db.execute(
+        select(
+            Enrollment.course_id,
+            Course.name.label("course_name"),
+            Course.code.label("course_code"),
+            *_tallies(Attendance.status),
+        )
+        .join(Course, Course.id == Enrollment.course_id)
+        .outerjoin(Attendance, _marks_of_enrolled())
+        .where(Enrollment.student_id == student_id)
+        .group_by(Enrollment.course_id, Course.name, Course.code)
+        .order_by(Enrollment.course_id)
+    )
+    return [_with_percentage(row) for row in rows]
+
+
+def course_report(db: Session, course_id: int) -> list[dict]:
+    """Enrolled students of a course by name, with their totals."""
+    rows = db.execute(
+        select(
+            Enrollment.student_id,
+            User.name.label("student_name"),
+            *_tallies(Attendance.status),
+        )
+        .join(User, User.id == Enrollment.student_id)
+        .outerjoin(Attendance, _marks_of_enrolled())
+        .where(Enrollment.course_id == course_id)
+        .group_by(Enrollment.student_id, User.name)
+        .order_by(User.name, Enrollment.student_id)
+    )
+    return [_with_percentage(row) for row in rows]
+
+
+def flag_at_risk(students: Iterable[dict], threshold: float) -> list[dict]:
+    """Copies of `course_report` rows with `at_risk` set for those under `threshold` percent."""
+    return [{**student, "at_risk": _below(student["present"], student["total_classes"], threshold)} for student in students]
+
+
+def below_threshold(
+    db: Session, threshold: float, page: PageParams, faculty_id: int | None = None,
+) -> tuple[list[dict], str | None]:
+    """A page of enrolled (student, course) pairs under `threshold` percent, and the next cursor.
+
+    Pairs are ordered by student id, then course id, both descending (the
+    keyset order). Only `faculty_id`'s courses are included, when given. Marks left by students
+    who have since unenrolled are not counted, as in `course_report`.
+    """
+    tallies = (
+        select(Attendance.student_id, Attendance.course_id, *_tallies(Attendance.status))
+        .join(Enrollment, _marks_of_enrolled())
+    )
+    if faculty_id is not None:
+        tallies = tallies.where(Attendance.course_id.in_(select(Course.id).where(Course.faculty_id == faculty_id)))
+    tallies = _at_risk_keyset.apply(
+        tallies.group_by(Attendance.student_id, Attendance.course_id)
+        .having(_below(func.count(case((Attendance.status == "present", 1))), func.count(Attendance.status), threshold)),
+        page,
+    ).subquery()
+    rows = db.execute(
+        select(
+            tallies.c.student_id,
+            User.name.label("student_name"),
+            tallies.c.course_id,
+            Course.code.label("course_code"),
+            Course.name.label("course_name"),
+            tallies.c.total_classes,
+            tallies.c.present,
+            tallies.c.absent,
+            tallies.c.late,
+        )
+        .join(User, User.id == tallies.c.student_id)
+        .join(Course, Course.id == tallies.c.course_id)
+        .order_by(tallies.c.student_id.desc(), tallies.c.course_id.desc())
+    )
+    rows, next_cursor = _at_risk_keyset.page(rows, page)
+    return [_with_percentage(row) for row in rows], next_cursor
@@ -0,0 +1,61 @@
+"""Marking a whole class roster for one day.
+
+The roster is checked against the course's enrollments with one set-based
+query, then written as a single upsert executed for every mark:
+
+    INSERT INTO attendance (...) VALUES (...)
+    ON CONFLICT (student_id, course_id, date) DO UPDATE SET status = excluded.status
+
+The conflict target is the unique index on attendance, so marking the same
+day again changes the status in place instead of adding a row, and a student
+who already marked their own attendance is simply overwritten. The caller
+commits, so the roster goes in as one transaction.
+"""
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.course import Enrollment
+
+VALID_STATUSES = ("present", "absent", "late")
+
+_UPSERT_DIALECTS = {"sqlite": sqlite, "postgresql": postgresql}
+
+
+def not_enrolled(db: Session, course_id: int, student_ids: Iterable[int]) -> list[int]:
+    """The ids among `student_ids` that are not enrolled in the course, sorted."""
+    student_ids = set(student_ids)
+    enrolled = set(db.scalars(
+        select(Enrollment.student_id).where(
+            Enrollment.course_id == course_id, Enrollment.student_id.in_(student_ids),
+        )
+    ))
+    return sorted(student_ids - enrolled)
+
+
+def _upsert_statement(dialect_name: str):
+    dialect = _UPSERT_DIALECTS.get(dialect_name)
+    if dialect is None:
+        raise NotImplementedError(f"Roster attendance needs an upsert; unsupported dialect {dialect_name!r}")
+    table = Attendance.__table__
+    stmt = dialect.insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.student_id, table.c.course_id, table.c.date],
+        set_={"status": stmt.excluded.status},
+    )
+
+
+def mark_roster(db: Session, course_id: int, day: date, marks: Mapping[int, str]) -> None:
+    """Write {student_id: status} for `day` in `db`'s transaction."""
+    if not marks:
+        return
+    now = datetime.now(timezone.utc)
+    # Sorted, so concurrent rosters lock attendance rows in the same order.
+    db.execute(_upsert_statement(db.get_bind().dialect.name), [
+        {"student_id": student_id, "course_id": course_id, "date": day, "status": status, "created_at": now}
+        for student_id, status in sorted(marks.items())
+    ])
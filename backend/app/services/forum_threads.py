@@ -0,0 +1,77 @@
+"""Nested comment threads for forum posts.
+
+A post's comments are read with one indexed query in chronological order and
+grouped by parent in a single pass, so every sibling list comes out sorted.
+Pages are then cut per level: `limit` siblings after a cursor, each carrying
+at most `replies` of its own replies, down to `depth` levels. Every node
+reports `reply_count`, so the client knows when to fetch the rest of a level
+with the level's cursor.
+
+Cost is linear in the number of comments on the post, however deep the
+threads are.
+"""
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from app.core.responses import project
+from app.schemas.forum import ForumCommentResponse
+
+
+class CommentThreads:
+    """Comments of one post indexed by parent. `rows` must be in chronological order."""
+
+    def __init__(self, rows: Iterable[Any]):
+        rows = list(rows)
+        ids = {row.id for row in rows}
+        self.children: dict[int | None, list[Any]] = defaultdict(list)
+        self.position: dict[int, tuple[int | None, int]] = {}
+        for row in rows:
+            # A reply whose parent is gone (or on another post) is shown as a top-level comment.
+            parent_id = row.parent_id if row.parent_id in ids else None
+            siblings = self.children[parent_id]
+            self.position[row.id] = (parent_id, len(siblings))
+            siblings.append(row)
+
+    def __contains__(self, comment_id: int) -> bool:
+        return comment_id in self.position
+
+    def __getitem__(self, comment_id: int) -> Any:
+        parent_id, index = self.position[comment_id]
+        return self.children[parent_id][index]
+
+    def page(
+        self, parent_id: int | None, after: int | None, limit: int, replies: int, depth: int,
+    ) -> tuple[list[dict], int | None]:
+        """Children of `parent_id` (None: top level) following sibling `after`, and the next cursor.
+
+        Raises ValueError when `after` is not a child of `parent_id`.
+        """
+        siblings = self.children.get(parent_id, [])
+        start = 0
+        if after is not None:
+            if self.position.get(after, (object(), 0))[0] != parent_id:
+                raise ValueError(after)
+            start = self.position[after][1] + 1
+        chunk = siblings[start:start + limit]
+        next_after = chunk[-1].id if chunk and start + limit < len(siblings) else None
+        return [self._node(row, replies, depth - 1) for row in chunk], next_after
+
+    def _node(self, row: Any, replies: int, depth: int) -> dict:
+        children = self.children.get(row.id, [])
+        shown = children[:replies] if depth > 0 else []
+        return project(
+            row,
+            ForumCommentResponse,
+            reply_count=len(children),
+            replies=[self._node(child, replies, depth - 1) for child in shown],
+        )
+
+    def subtree(self, comment_id: int) -> list[int]:
+        """`comment_id` and all of its descendants."""
+        ids, stack = [], [comment_id]
+        while stack:
+            current = stack.pop()
+            ids.append(current)
+            stack.extend(child.id for child in self.children.get(current, ()))
+        return ids
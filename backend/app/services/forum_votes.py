@@ -0,0 +1,120 @@
+"""Batched updates of the vote totals on forum posts.
+
+Each vote is stored per user in `forum_votes` (one row per user and post), so
+a vote is recorded once however often it is sent. The totals on
+`forum_posts` are what readers see. A popular post gets votes from many
+users at once, and updating its row on every vote would make them all wait
+on the same lock. Instead, each worker collects the changes in a
+VoteBuffer and `run_flusher` applies them every FORUM_VOTE_FLUSH_SECONDS,
+with one relative UPDATE per post:
+
+    UPDATE forum_posts SET upvotes = upvotes + :up, downvotes = downvotes + :down WHERE id = :id
+
+Because the UPDATE is relative, workers never overwrite each other's totals.
+Totals lag behind the votes by up to one interval; `VoteBuffer.totals` adds
+a worker's pending changes to what is stored. Shutdown flushes what is
+pending. A worker that is killed without shutting down loses that interval's
+changes to the totals; the votes themselves are already committed.
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Mapping
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.models.forum import ForumPost
+
+logger = logging.getLogger(__name__)
+
+_apply_statement = (
+    update(ForumPost.__table__)
+    .where(ForumPost.__table__.c.id == bindparam("post_id"))
+    .values(
+        upvotes=ForumPost.__table__.c.upvotes + bindparam("up"),
+        downvotes=ForumPost.__table__.c.downvotes + bindparam("down"),
+    )
+)
+
+
+def apply_votes(db: Session, deltas: Mapping[int, tuple[int, int]]) -> None:
+    """Add {post_id: (up, down)} to the post totals in `db`'s transaction."""
+    if deltas:
+        # Sorted, so concurrent flushes lock post rows in the same order.
+        db.execute(_apply_statement, [
+            {"post_id": post_id, "up": up, "down": down} for post_id, (up, down) in sorted(deltas.items())
+        ])
+
+
+class VoteBuffer:
+    """Per-worker vote deltas waiting to be written, by post id."""
+
+    def __init__(self):
+        self._pending: defaultdict[int, list[int]] = defaultdict(lambda: [0, 0])
+        self._lock = threading.Lock()
+        # Held by a flush from taking its batch until the batch is committed.
+        self._flushing = threading.Lock()
+
+    def add(self, post_id: int, up: int, down: int) -> None:
+        with self._lock:
+            pending = self._pending[post_id]
+            pending[0] += up
+            pending[1] += down
+
+    def pending(self, post_id: int) -> tuple[int, int]:
+        with self._lock:
+            up, down = self._pending.get(post_id, (0, 0))
+            return up, down
+
+    def totals(self, db: Session, post_id: int) -> tuple[int, int] | None:
+        """The post's stored (upvotes, downvotes) plus what is pending here, or None if there is no such post.
+
+        Read while no flush is in progress, so each vote is counted once: either
+        in the stored totals or in the buffer. `db` must not be in a transaction
+        begun before the call, or the stored totals may predate the last flush.
+        """
+        with self._flushing:
+            stored = db.execute(
+                select(ForumPost.upvotes, ForumPost.downvotes).where(ForumPost.id == post_id)
+            ).first()
+            up, down = self.pending(post_id)
+        if stored is None:
+            return None
+        return stored.upvotes + up, stored.downvotes + down
+
+    def flush(self, session_factory: Callable[[], Session]) -> int:
+        """Write out everything pending in one transaction. Returns the number of posts updated."""
+        with self._flushing:
+            with self._lock:
+                batch, self._pending = self._pending, defaultdict(lambda: [0, 0])
+            deltas = {post_id: (up, down) for post_id, (up, down) in batch.items() if up or down}
+            if not deltas:
+                return 0
+            try:
+                with session_factory() as db:
+                    apply_votes(db, deltas)
+                    db.commit()
+            except Exception:
+                # Put the batch back: the next flush retries it together with newer votes.
+                for post_id, (up, down) in deltas.items():
+                    self.add(post_id, up, down)
+                raise
+            return len(deltas)
+
+
+vote_buffer = VoteBuffer()
+
+
+async def run_flusher(buffer: VoteBuffer, session_factory: Callable[[], Session], interval: float) -> None:
+    """Flush `buffer` every `interval` seconds until cancelled, then once more."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(buffer.flush, session_factory)
+            except Exception:
+                logger.exception("Flushing forum votes failed; retrying with the next batch")
+    finally:
+        await asyncio.to_thread(buffer.flush, session_factory)
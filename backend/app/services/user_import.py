@@ -0,0 +1,106 @@
+"""Streaming CSV user import.
+
+The CSV is parsed row by row and handled in chunks of USER_IMPORT_CHUNK_SIZE:
+one set-based query finds the emails that already exist, then the new users go
+in as a single multi-row INSERT. Each chunk is committed on its own, so a large
+roster never holds the write lock for long and progress is visible while the
+job runs. The default password is hashed once per import.
+"""
+import csv
+import logging
+import os
+from datetime import datetime, timezone
+from itertools import islice
+
+from sqlalchemy import insert, select
+
+from app.core.config import settings
+from app.core.counters import added, adjust, user_counters
+from app.core.database import SessionLocal
+from app.core.jobs import Job
+from app.core.security import hash_password
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IMPORT_PASSWORD = "Aegis@123"
+VALID_ROLES = {"student", "faculty", "authority", "admin"}
+
+
+def _chunks(reader, size: int):
+    while chunk := list(islice(reader, size)):
+        yield chunk
+
+
+def _import_chunk(db, rows: list[dict], default_hash: str, seen: set[str], job: Job) -> int:
+    """Insert the new users among `rows` in `db`'s transaction. Returns how many were inserted."""
+    candidates = []
+    for row in rows:
+        job.processed += 1
+        email = (row.get("email") or "").strip().lower()
+        name = (row.get("name") or "").strip()
+        role = (row.get("role") or "student").strip().lower()
+        dept = (row.get("department") or "").strip()
+
+        if not email or not name:
+            job.skip(f"Skipped row with missing email/name: {row}")
+            continue
+        if email in seen:
+            job.skip(f"User {email} appears more than once in the file")
+            continue
+        seen.add(email)
+        candidates.append({
+            "email": email,
+            "name": name,
+            "role": role if role in VALID_ROLES else "student",
+            "department": dept or None,
+        })
+
+    if not candidates:
+        return 0
+
+    existing = set(db.scalars(
+        select(User.email).where(User.email.in_([c["email"] for c in candidates]))
+    ))
+    now = datetime.now(timezone.utc)
+    new_rows = []
+    for c in candidates:
+        if c["email"] in existing:
+            job.skip(f"User {c['email']} already exists")
+            continue
+        new_rows.append({
+            **c,
+            "hashed_password": default_hash,
+            "status": "active",  # Admin imports are active by default
+            "created_at": now,
+        })
+
+    if new_rows:
+        db.execute(insert(User).values(new_rows))
+        adjust(db, added(name for row in new_rows for name in user_counters(row["role"])))
+    return len(new_rows)
+
+
+def run_user_import(job: Job, path: str) -> None:
+    """Import users from the CSV at `path`, recording progress on `job`. Removes the file afterwards."""
+    job.status = "running"
+    try:
+        default_hash = hash_password(DEFAULT_IMPORT_PASSWORD)
+        seen: set[str] = set()
+        with open(path, newline="", encoding="utf-8-sig") as fh, SessionLocal() as db:
+            reader = csv.DictReader(fh)
+            for chunk in _chunks(reader, settings.USER_IMPORT_CHUNK_SIZE):
+                try:
+                    inserted = _import_chunk(db, chunk, default_hash, seen, job)
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                # Counted only once committed, so a failed import reports what was kept.
+                job.succeeded += inserted
+        job.finish("completed", f"Successfully imported {job.succeeded} users")
+    except Exception as e:
+        logger.exception("User import %s failed", job.id)
+        job.finish("failed", f"Import failed after {job.succeeded} users: {e}")
+    finally:
+        os.remove(path)
@@ -0,0 +1,169 @@
+"""Fail when a hot query falls back to a full table scan.
+
+Drives every scenario in benchmarks/scenarios.py against the generated
+database (as benchmarks.run does), captures the SQL each request executes,
+plus the lookups behind the write endpoints in PROBES, and runs EXPLAIN QUERY
+PLAN on every distinct statement. A plan step that scans a table without an
+index fails the check, unless the table is listed in FULL_SCAN_OK.
+
+    cd backend
+    python -m benchmarks.query_plans                 # exit status 1 on a full scan
+    python -m benchmarks.query_plans --verbose       # print every plan
+
+SQLite only: the plan format is SQLite's.
+"""
+import argparse
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.run import DATA_DIR, DEFAULT_PROFILE, DEFAULT_SEED, build_database, configure_environment
+
+# Tables an endpoint reads in full by design, bounded by campus size rather
+# than by activity. No index helps an unfiltered read of a whole table.
+FULL_SCAN_OK = {
+    "academic_events",      # calendar: whole term
+    "campus_locations",     # map: a few dozen rows; search is a substring LIKE
+    "collection_versions",  # one row per tracked collection
+    "clubs",
+    "courses",              # catalog
+    # Unpaginated commons boards: remove once they page like the other lists.
+    "caravan_pools",
+    "mercenary_gigs",
+}
+
+# "SCAN grievances" (or "SCAN TABLE grievances" before SQLite 3.36), optionally
+# aliased; scans "USING INDEX" / "USING COVERING INDEX" do not match.
+_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+
+
+@dataclass
+class Captured:
+    source: str
+    statement: str
+    parameters: tuple
+
+
+def _probes():
+    """Lookups the write endpoints run before inserting or updating, by endpoint."""
+    from sqlalchemy import select
+
+    from app.models.attendance import Attendance
+    from app.models.clubs import ClubMember
+    from app.models.course import Enrollment
+    from app.models.grievance import GrievanceComment
+    from app.models.internship import Application
+
+    return {
+        "POST /api/attendance/": select(Attendance).where(
+            Attendance.student_id == 5, Attendance.course_id == 1, Attendance.date == "2025-01-06",
+        ),
+        "POST /api/attendance/courses/{id}/roster": select(Enrollment.student_id).where(
+            Enrollment.course_id == 1, Enrollment.student_id.in_([5, 6, 7]),
+        ),
+        "POST /api/courses/enroll": select(Enrollment).where(Enrollment.student_id == 5, Enrollment.course_id == 1),
+        "POST /api/internships/apply": select(Application).where(
+            Application.student_id == 5, Application.internship_id == 1,
+        ),
+        "POST /api/clubs/{id}/join": select(ClubMember).where(ClubMember.club_id == 1, ClubMember.user_id == 5),
+        "GET /api/grievances/{id}": select(GrievanceComment).where(GrievanceComment.grievance_id == 1),
+    }
+
+
+def capture(opts: argparse.Namespace) -> list[Captured]:
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from app.core.database import async_engine, engine
+    from app.core.security import create_access_token
+    from app.main import app
+    from benchmarks.scenarios import DEMO_USERS, SCENARIOS
+
+    captured: dict[str, Captured] = {}
+    source = "startup"
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and statement not in captured:
+            captured[statement] = Captured(source, statement, tuple(parameters or ()))
+
+    for target in (engine, async_engine.sync_engine):
+        event.listen(target, "before_cursor_execute", _record)
+
+    tokens = {role: create_access_token({"sub": uid}) for role, uid in DEMO_USERS.items()}
+    with TestClient(app) as client:
+        for scenario in SCENARIOS:
+            if opts.only and opts.only not in scenario.name:
+                continue
+            source = scenario.name
+            headers = {"Authorization": f"Bearer {tokens[scenario.role]}"}
+            client.get(scenario.path, params=scenario.params, headers=headers)
+
+    with engine.connect() as conn:
+        for name, stmt in _probes().items():
+            if opts.only and opts.only not in name:
+                continue
+            source = name
+            conn.execute(stmt).all()
+
+    for target in (engine, async_engine.sync_engine):
+        event.remove(target, "before_cursor_execute", _record)
+    return [c for c in captured.values() if c.source != "startup"]
+
+
+def explain(conn, captured: Captured) -> list[str]:
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {captured.statement}", captured.parameters).all()
+    return [row[-1] for row in rows]
+
+
+def full_scans(plan: list[str], tables: set[str]) -> list[str]:
+    scanned = []
+    for detail in plan:
+        match = _FULL_SCAN.match(detail)
+        if match and match.group(1) in tables and match.group(1) not in FULL_SCAN_OK:
+            scanned.append(match.group(1))
+    return scanned
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check the query plans of the benchmark scenarios for full scans.")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, help=f"seed.py volume profile (default: {DEFAULT_PROFILE})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed.py random seed")
+    parser.add_argument("--db", type=Path, help="database file (default: benchmarks/.data/<profile>-<seed>.db)")
+    parser.add_argument("--rebuild", action="store_true", help="regenerate the database even if it exists")
+    parser.add_argument("--only", help="check scenarios and probes whose name contains this substring")
+    parser.add_argument("--verbose", action="store_true", help="print the plan of every statement")
+    opts = parser.parse_args(argv)
+
+    db_path = (opts.db or DATA_DIR / f"{opts.profile}-{opts.seed}.db").resolve()
+    configure_environment(db_path)
+    build_database(opts, db_path)
+
+    from app.core.database import Base, engine
+
+    statements = capture(opts)
+    tables = set(Base.metadata.tables)
+    failures = []
+    with engine.connect() as conn:
+        for captured in statements:
+            plan = explain(conn, captured)
+            scanned = full_scans(plan, tables)
+            if scanned:
+                failures.append((captured, plan, scanned))
+            if opts.verbose or scanned:
+                status = "FAIL" if scanned else "ok"
+                print(f"[{status}] {captured.source}: {' '.join(captured.statement.split())[:160]}")
+                for detail in plan:
+                    print(f"         {detail}")
+
+    print(f"\n[PLANS] {len(statements)} distinct statements checked")
+    if failures:
+        for captured, _, scanned in failures:
+            print(f"[FAIL] {captured.source}: full scan of {', '.join(sorted(set(scanned)))}")
+        return 1
+    print("[PLANS] No full scans outside FULL_SCAN_OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Endpoint benchmark with latency and query budgets.
+
+Builds (once) a large synthetic SQLite database with seed.py, starts the app
+in-process with TestClient, drives every scenario in benchmarks/scenarios.py
+and reports p50/p95 latency, throughput, response size and SQL statements per
+request (from the X-Query-Count header). Results are compared with the
+checked-in baseline.json:
+
+  * a scenario issuing more statements than its baseline fails the run;
+  * a p95 slower than baseline x --latency-tolerance is flagged, and fails
+    the run with --fail-on-latency (timings depend on the machine).
+
+    cd backend
+    python -m benchmarks.run                        # compare against baseline
+    python -m benchmarks.run --only grievances      # subset
+    python -m benchmarks.run --update-baseline      # accept current numbers
+
+Run with --update-baseline in the same commit as an intentional change in
+query counts, so the diff to baseline.json is reviewed with the code.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = BENCH_DIR.parent
+DATA_DIR = BENCH_DIR / ".data"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+DEFAULT_PROFILE = "production"
+DEFAULT_SEED = 42
+DEFAULT_ITERATIONS = 20
+WARMUP = 1
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark every API router against a generated database.")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, help=f"seed.py volume profile (default: {DEFAULT_PROFILE})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed.py random seed")
+    parser.add_argument("--db", type=Path, help="database file (default: benchmarks/.data/<profile>-<seed>.db)")
+    parser.add_argument("--rebuild", action="store_true", help="regenerate the database even if it exists")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="timed requests per scenario")
+    parser.add_argument("--only", help="run scenarios whose name contains this substring")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--latency-tolerance", type=float, default=2.0, help="allowed p95 / baseline p95 ratio")
+    parser.add_argument("--fail-on-latency", action="store_true", help="treat latency regressions as failures")
+    parser.add_argument("--json", type=Path, help="also write the raw results here")
+    return parser.parse_args(argv)
+
+
+def configure_environment(db_path: Path) -> None:
+    """Must run before anything under app/ is imported: settings are read at import time."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["QUERY_GUARD_MODE"] = "warn"  # emits X-Query-Count
+    os.environ["METRICS_ENABLED"] = "true"
+    os.environ["REQUEST_LOG_SAMPLE_RATE"] = "0"
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+def build_database(opts: argparse.Namespace, db_path: Path) -> None:
+    if db_path.exists() and not opts.rebuild:
+        print(f"[BENCH] Using existing database {db_path}")
+        return
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    print(f"[BENCH] Generating {opts.profile} database at {db_path}")
+    import seed
+    seed.main(["--profile", opts.profile, "--seed", str(opts.seed)])
+
+
+def _percentile(samples: list[float], pct: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def run_scenario(client, scenario, headers: dict, iterations: int) -> dict:
+    if scenario.revalidate:
+        primed = client.get(scenario.path, params=scenario.params, headers=headers)
+        headers = {**headers, "If-None-Match": primed.headers["etag"]}
+    for _ in range(WARMUP):
+        client.get(scenario.path, params=scenario.params, headers=headers)
+
+    timings, queries, size, status = [], set(), 0, None
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        response = client.get(scenario.path, params=scenario.params, headers=headers)
+        timings.append(time.perf_counter() - t0)
+        status = response.status_code
+        queries.add(int(response.headers.get("x-query-count", -1)))
+        size = len(response.content)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "status": status,
+        # min: an auth-cache expiry mid-run adds a lookup to single requests
+        "queries": min(queries),
+        "p50_ms": round(_percentile(timings, 50) * 1000, 2),
+        "p95_ms": round(_percentile(timings, 95) * 1000, 2),
+        "rps": round(iterations / elapsed, 1),
+        "bytes": size,
+    }
+
+
+def compare(results: dict, baseline: dict, opts: argparse.Namespace) -> tuple[list[str], list[str]]:
+    """Return (failures, warnings) for `results` against the baseline scenarios."""
+    failures, warnings = [], []
+    for name, result in results.items():
+        if not (200 <= result["status"] < 300 or result["status"] == 304):
+            failures.append(f"{name}: HTTP {result['status']}")
+            continue
+        base = baseline.get(name)
+        if base is None:
+            warnings.append(f"{name}: not in baseline")
+            continue
+        if result["queries"] > base["queries"]:
+            failures.append(f"{name}: {result['queries']} SQL statements per request, baseline {base['queries']}")
+        if result["p95_ms"] > base["p95_ms"] * opts.latency_tolerance and result["p95_ms"] - base["p95_ms"] > 5:
+            message = f"{name}: p95 {result['p95_ms']}ms vs baseline {base['p95_ms']}ms"
+            (failures if opts.fail_on_latency else warnings).append(message)
+    return failures, warnings
+
+
+def print_table(results: dict, baseline: dict) -> None:
+    print(f"\n{'scenario':<34} {'status':>6} {'queries':>11} {'p50 ms':>9} {'p95 ms':>9} {'req/s':>8} {'bytes':>10}")
+    for name, r in results.items():
+        base = baseline.get(name)
+        queries = f"{r['queries']}" + (f" ({base['queries']})" if base and base["queries"] != r["queries"] else "")
+        print(f"{name:<34} {r['status']:>6} {queries:>11} {r['p50_ms']:>9} {r['p95_ms']:>9} {r['rps']:>8} {r['bytes']:>10}")
+
+
+def main(argv=None) -> int:
+    opts = parse_args(argv)
+    db_path = (opts.db or DATA_DIR / f"{opts.profile}-{opts.seed}.db").resolve()
+    configure_environment(db_path)
+    build_database(opts, db_path)
+
+    from fastapi.testclient import TestClient
+
+    from app.core.security import create_access_token
+    from app.main import app
+    from benchmarks.scenarios import DEMO_USERS, SCENARIOS
+
+    scenarios = [s for s in SCENARIOS if not opts.only or opts.only in s.name]
+    tokens = {role: create_access_token({"sub": uid}) for role, uid in DEMO_USERS.items()}
+    baseline_doc = json.loads(opts.baseline.read_text()) if opts.baseline.exists() else {}
+    baseline = baseline_doc.get("scenarios", {})
+
+    results = {}
+    with TestClient(app) as client:
+        for scenario in scenarios:
+            headers = {"Authorization": f"Bearer {tokens[scenario.role]}"}
+            iterations = min(scenario.iterations or opts.iterations, opts.iterations)
+            results[scenario.name] = run_scenario(client, scenario, headers, iterations)
+            r = results[scenario.name]
+            print(f"  {scenario.name:<34} {r['queries']:>4} queries  p50 {r['p50_ms']:>9}ms")
+
+    print_table(results, baseline)
+    if opts.json:
+        opts.json.write_text(json.dumps(results, indent=2) + "\n")
+
+    if opts.update_baseline:
+        if opts.only:
+            results = {**baseline, **results}
+        opts.baseline.write_text(json.dumps(
+            {"profile": opts.profile, "seed": opts.seed, "scenarios": dict(sorted(results.items()))}, indent=2,
+        ) + "\n")
+        print(f"\n[BENCH] Baseline written to {opts.baseline}")
+        return 0
+
+    if baseline_doc and (baseline_doc.get("profile"), baseline_doc.get("seed")) != (opts.profile, opts.seed):
+        print(f"\n[BENCH] Note: baseline was recorded with profile={baseline_doc['profile']} seed={baseline_doc['seed']}")
+
+    failures, warnings = compare(results, baseline, opts)
+    for message in warnings:
+        print(f"[WARN] {message}")
+    for message in failures:
+        print(f"[FAIL] {message}")
+    if failures:
+        print(f"\n[BENCH] {len(failures)} budget failure(s)")
+        return 1
+    print("\n[BENCH] All scenarios within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
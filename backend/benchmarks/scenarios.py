@@ -0,0 +1,67 @@
+"""The requests the benchmark drives, one or more per router in app/api.
+
+Scenarios act as the fixed demo accounts from seed.py, which exist in every
+generated database. Heavy endpoints get fewer iterations so a full run stays
+in the low minutes.
+"""
+from dataclasses import dataclass, field
+
+# Demo account ids (see seed.seed_demo)
+DEMO_USERS = {"admin": 1, "authority": 2, "faculty": 3, "student": 5}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    path: str
+    role: str = "student"
+    params: dict = field(default_factory=dict)
+    iterations: int | None = None
+    # Replay the ETag from a priming request, measuring the 304 path.
+    revalidate: bool = False
+
+
+SCENARIOS = [
+    Scenario("auth.me", "/api/auth/me"),
+    Scenario("announcements.list", "/api/announcements/"),
+    Scenario("announcements.list.304", "/api/announcements/", revalidate=True),
+    Scenario("attendance.list", "/api/attendance/"),
+    Scenario("attendance.summary", "/api/attendance/summary"),
+    Scenario("attendance.course_report", "/api/attendance/courses/1/report", role="faculty"),
+    Scenario("attendance.course_report.304", "/api/attendance/courses/1/report", role="faculty", revalidate=True),
+    Scenario("attendance.matrix", "/api/attendance/courses/1/matrix", role="faculty"),
+    Scenario("attendance.matrix.csv", "/api/attendance/courses/1/matrix", role="faculty", params={"format": "csv"}),
+    Scenario("attendance.at_risk", "/api/attendance/at-risk", role="admin", iterations=3),
+    Scenario("calendar.events", "/api/calendar/events"),
+    Scenario("calendar.events.304", "/api/calendar/events", revalidate=True),
+    Scenario("clubs.list", "/api/clubs/"),
+    Scenario("clubs.list.304", "/api/clubs/", revalidate=True),
+    Scenario("clubs.detail", "/api/clubs/1"),
+    Scenario("commons.caravan", "/api/commons/caravan"),
+    Scenario("commons.mercenary", "/api/commons/mercenary"),
+    Scenario("courses.list", "/api/courses/"),
+    Scenario("courses.list.304", "/api/courses/", revalidate=True),
+    Scenario("courses.my_enrollments", "/api/courses/my-enrollments"),
+    Scenario("dashboard.stats.student", "/api/dashboard/stats"),
+    Scenario("dashboard.stats.admin", "/api/dashboard/stats", role="admin"),
+    Scenario("emergency.incidents", "/api/emergency/incidents", role="admin"),
+    Scenario("grievances.list.student", "/api/grievances/"),
+    Scenario("grievances.list.authority", "/api/grievances/", role="authority", iterations=3),
+    Scenario("grievances.list.admin", "/api/grievances/", role="admin", iterations=3),
+    Scenario("grievances.list.admin.pending", "/api/grievances/", role="admin", params={"status": "pending"}, iterations=3),
+    Scenario("grievances.detail", "/api/grievances/1", role="admin"),
+    Scenario("grievances.comments", "/api/grievances/1/comments", role="admin"),
+    Scenario("forum.posts", "/api/forum/posts"),
+    Scenario("forum.post", "/api/forum/posts/1"),
+    Scenario("internships.list", "/api/internships/"),
+    Scenario("internships.list.open", "/api/internships/", params={"deadline_after": "2025-06-01", "min_stipend": 20000}),
+    Scenario("internships.my_applications", "/api/internships/my-applications"),
+    Scenario("internships.applications", "/api/internships/1/applications", role="faculty"),
+    Scenario("lost_found.list", "/api/lost-found/"),
+    Scenario("map.locations", "/api/map/locations"),
+    Scenario("map.locations.304", "/api/map/locations", revalidate=True),
+    Scenario("map.search", "/api/map/search", params={"q": "Hostel"}),
+    Scenario("resources.list", "/api/resources/"),
+    Scenario("tasks.list", "/api/tasks/"),
+    Scenario("users.list", "/api/users/", role="admin", iterations=3),
+]
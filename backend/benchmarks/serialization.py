@@ -0,0 +1,145 @@
+"""Serialization cost per 1,000 rows: response_model path vs the fast JSON path.
+
+Builds in-memory ORM rows (no database) and times, for a few list schemas:
+
+  * validated - build response schemas by hand as the routers used to, let
+    FastAPI validate them again against response_model, encode with json.dumps;
+  * fast      - app.core.responses.project() into dicts, FastJSONResponse.
+
+    cd backend
+    python -m benchmarks.serialization [--rows 1000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from starlette.responses import JSONResponse
+
+from app.api.grievances import _to_summary
+from app.core.responses import FastJSONResponse, project
+from app.core.schema import import_all_models
+from app.models.course import Course
+from app.models.grievance import Grievance, GrievanceComment
+from app.models.user import User
+from app.schemas.course import CourseResponse
+from app.schemas.grievance import GrievanceSummary
+from app.schemas.user import UserResponse
+
+import_all_models()
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _users(n: int) -> list[User]:
+    return [
+        User(
+            id=i, email=f"user{i}@iitmandi.ac.in", name=f"User {i}", hashed_password="x", role="student",
+            status="active", department="Computer Science", managed_modules=None, created_at=NOW - timedelta(days=i),
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def _grievances(n: int) -> list[Grievance]:
+    staff = User(id=0, email="staff@iitmandi.ac.in", name="Staff", role="authority")
+    rows = []
+    for i, submitter in enumerate(_users(n), start=1):
+        g = Grievance(
+            id=i, title=f"Grievance {i}", description="Wi-Fi in Block C keeps dropping.", category="infrastructure",
+            priority="high", status="in_review", location="Hostel Block C", image_url=None, is_anonymous=i % 10 == 0,
+            submitted_by=submitter.id, assigned_to=staff.id, created_at=NOW, updated_at=NOW,
+        )
+        g.submitter, g.assignee = submitter, staff
+        g.comments = [
+            GrievanceComment(id=i * 2 + k, grievance_id=i, user_id=staff.id, user=staff, content="Noted.", created_at=NOW)
+            for k in range(2)
+        ]
+        rows.append(g)
+    return rows
+
+
+def _grievance_summary(g: Grievance) -> GrievanceSummary:
+    return GrievanceSummary(
+        id=g.id, title=g.title, description=g.description, category=g.category, priority=g.priority,
+        status=g.status, location=g.location, image_url=g.image_url, is_anonymous=g.is_anonymous,
+        submitted_by=g.submitted_by, submitter_name="Anonymous" if g.is_anonymous else g.submitter.name,
+        assigned_to=g.assigned_to, assignee_name=g.assignee.name, created_at=g.created_at,
+        updated_at=g.updated_at, comment_count=len(g.comments),
+    )
+
+
+def _courses(n: int) -> list[Course]:
+    faculty = User(id=0, email="faculty@iitmandi.ac.in", name="Dr. Faculty", role="faculty")
+    rows = []
+    for i in range(1, n + 1):
+        c = Course(
+            id=i, name=f"Course {i}", code=f"CS{i:04d}", description=None, semester="2025-Spring", credits=4,
+            course_type="major", faculty_id=faculty.id, created_at=NOW,
+        )
+        c.faculty = faculty
+        rows.append(c)
+    return rows
+
+
+def _course_response(c: Course) -> CourseResponse:
+    return CourseResponse(
+        id=c.id, name=c.name, code=c.code, description=c.description, semester=c.semester, credits=c.credits,
+        course_type=c.course_type, faculty_id=c.faculty_id, faculty_name=c.faculty.name,
+        created_at=c.created_at, enrollment_count=42, is_enrolled=False,
+    )
+
+
+def _course_dict(c: Course) -> dict:
+    return project(c, CourseResponse, faculty_name=c.faculty.name, enrollment_count=42, is_enrolled=False)
+
+
+CASES = {
+    "grievances": (_grievances, GrievanceSummary, _grievance_summary, lambda g: _to_summary(g, len(g.comments))),
+    "courses": (_courses, CourseResponse, _course_response, _course_dict),
+    "users": (_users, UserResponse, UserResponse.model_validate, lambda u: project(u, UserResponse)),
+}
+
+
+def _validated(field, build, rows) -> bytes:
+    content = asyncio.run(serialize_response(field=field, response_content=[build(r) for r in rows]))
+    return JSONResponse(content).body
+
+
+def _fast(build, rows) -> bytes:
+    return FastJSONResponse([build(r) for r in rows]).body
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    opts = parser.parse_args(argv)
+
+    print(f"{'schema':<12} {'validated ms':>13} {'fast ms':>9} {'speedup':>8}   (per {opts.rows} rows, median of {opts.repeat})")
+    for name, (make_rows, schema, slow_build, fast_build) in CASES.items():
+        rows = make_rows(opts.rows)
+        field = create_model_field(name=f"Response_{name}", type_=list[schema], mode="serialization")
+        slow = _time(lambda: _validated(field, slow_build, rows), opts.repeat)
+        fast = _time(lambda: _fast(fast_build, rows), opts.repeat)
+        print(f"{name:<12} {slow * 1000:>13.2f} {fast * 1000:>9.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
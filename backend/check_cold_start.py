@@ -0,0 +1,63 @@
+"""Measure worker cold start against a time budget.
+
+Each run starts a fresh interpreter and times what `uvicorn app.main:app` does
+before it can serve: importing app.main and running the app's startup hooks
+(schema version check, pragma report). Exits with status 1 when the median
+run exceeds the budget.
+
+    python check_cold_start.py --runs 5 --budget-ms 1500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import asyncio, json, time
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+
+async def boot():
+    async with app.main.app.router.lifespan_context(app.main.app):
+        return time.perf_counter()
+
+t2 = asyncio.run(boot())
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "startup_ms": (t2 - t1) * 1000}))
+"""
+
+
+def measure_once() -> dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    args = parser.parse_args()
+
+    measure_once()  # first run pays for .pyc compilation and, on a new database, migrations
+    runs = [measure_once() for _ in range(args.runs)]
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    startup_ms = statistics.median(r["startup_ms"] for r in runs)
+    total_ms = statistics.median(r["import_ms"] + r["startup_ms"] for r in runs)
+
+    print(f"import app.main : {import_ms:8.1f} ms (median of {args.runs})")
+    print(f"startup hooks   : {startup_ms:8.1f} ms")
+    print(f"cold start      : {total_ms:8.1f} ms  (budget {args.budget_ms:.0f} ms)")
+    if total_ms > args.budget_ms:
+        print("FAIL: cold start exceeds budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Rebuild stat_counters from the tables they count.
+
+Counters are adjusted by the API in the same transaction as each write, so
+they only drift when rows are written some other way (seed.py, manual SQL, a
+restored backup). This recounts everything and reports what had drifted.
+
+    python reconcile_counters.py            # rebuild
+    python reconcile_counters.py --check    # report drift only; exit 1 if any
+"""
+import argparse
+import sys
+
+from app.core.counters import reconcile, resync_comment_counts
+from app.core.database import SessionLocal
+from app.core.schema import import_all_models
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="roll back instead of storing the recount")
+    args = parser.parse_args()
+
+    import_all_models()
+    with SessionLocal() as db:
+        drift = reconcile(db)
+        posts = resync_comment_counts(db)
+        if args.check:
+            db.rollback()
+        else:
+            db.commit()
+
+    for name, (stored, actual) in drift.items():
+        print(f"  {name:<40} stored {stored:>8}  actual {actual:>8}")
+    action = "found" if args.check else "corrected"
+    print(f"[COUNTERS] {len(drift)} drifted counter(s) {action}")
+    print(f"[COUNTERS] {posts} forum post comment count(s) {action}")
+    return 1 if args.check and (drift or posts) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
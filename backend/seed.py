@@ -1,10 +1,35 @@
-"""Seed the database with demo data for all 7 Pillars."""
-import sys
+"""Seed the database with demo data for all 7 Pillars.
+
+With no arguments this writes the small demo dataset that TESTING.md walks
+through. Volume flags add a synthetic campus on top of it for load testing:
+
+    python seed.py --profile production      # ~20k users, ~300k attendance rows, 50k grievances
+    python seed.py --profile large           # ~1M rows in total
+    python seed.py --users 5000 --attendance-days 30 --seed 7
+
+Synthetic rows come from a random.Random seeded with --seed, so the same flags
+always produce the same data (dates are relative to today). Ids are assigned up
+front so foreign keys need no round trips, and rows are streamed into multi-row
+Core INSERTs inside a single transaction. Every synthetic account uses the demo
+password, password123.
+"""
+import argparse
 import os
+import random
+import sys
+import time
+from bisect import bisect
+from datetime import datetime, timezone, date, timedelta
+from itertools import accumulate, islice
+
 sys.path.insert(0, os.path.dirname(__file__))
 
-from datetime import datetime, timezone, date, timedelta
-from app.core.database import SessionLocal, engine, Base
+from sqlalchemy import func, select, text
+
+from app.core.conditional import TRACKED_COLLECTIONS, bump
+from app.core.counters import reconcile, resync_comment_counts
+from app.core.database import Base, SessionLocal, engine
+from app.core.schema import upgrade_schema
 from app.core.security import hash_password
 
 # Import ALL models
@@ -23,281 +48,952 @@ from app.models.caravan_mercenary import CaravanPool, MercenaryGig
 from app.models.clubs import Club, ClubMember, ClubEvent, ClubAnnouncement
 from app.models.location import CampusLocation
 from app.models.incident import Incident
+from app.models.audit_log import AuditLog
+from app.models.collection_version import CollectionVersion
 
-Base.metadata.create_all(bind=engine)
-db = SessionLocal()
-
-# Clear all
-for model in [ClubAnnouncement, ClubEvent, Incident, CampusLocation, ClubMember, Club, MercenaryGig, CaravanPool, ForumComment, ForumPost, Announcement, LostFoundItem, Task, AcademicEvent, Resource, Attendance, Application, Enrollment, GrievanceComment, Grievance, Internship, Course, User]:
-    db.query(model).delete()
-db.commit()
-
-print("[SEED] Seeding AEGIS Platform...")
-
-# ── USERS ──
-pwd = hash_password("password123")
-users = [
-    User(id=1, email="admin@iitmandi.ac.in", name="Dr. Arjun Mehta", hashed_password=pwd, role="admin", department="Administration"),
-    User(id=2, email="authority@iitmandi.ac.in", name="Prof. Sunita Sharma", hashed_password=pwd, role="authority", department="Dean of Students"),
-    User(id=3, email="faculty1@iitmandi.ac.in", name="Dr. Rajesh Kumar", hashed_password=pwd, role="faculty", department="Computer Science"),
-    User(id=4, email="faculty2@iitmandi.ac.in", name="Dr. Priya Nair", hashed_password=pwd, role="faculty", department="Electrical Engineering"),
-    User(id=5, email="student1@iitmandi.ac.in", name="Aarav Patel", hashed_password=pwd, role="student", department="Computer Science"),
-    User(id=6, email="student2@iitmandi.ac.in", name="Diya Gupta", hashed_password=pwd, role="student", department="Electrical Engineering"),
-    User(id=7, email="student3@iitmandi.ac.in", name="Kabir Singh", hashed_password=pwd, role="student", department="Mechanical Engineering"),
-    User(id=8, email="authority2@iitmandi.ac.in", name="Prof. Vikram Joshi", hashed_password=pwd, role="authority", department="Hostel Warden"),
-]
-for u in users:
-    db.add(u)
-db.commit()
-print("  [OK] 8 users created")
-
-# ── COURSES (Pillar III) ──
-courses = [
-    Course(id=1, name="Data Structures & Algorithms", code="CS201", description="Fundamental data structures, sorting algorithms, and complexity analysis.", semester="2025-Spring", credits=4, course_type="major", faculty_id=3),
-    Course(id=2, name="Machine Learning", code="CS301", description="Supervised and unsupervised learning, neural networks, and model evaluation.", semester="2025-Spring", credits=4, course_type="major", faculty_id=3),
-    Course(id=3, name="Digital Signal Processing", code="EE301", description="Fourier analysis, filter design, and signal processing applications.", semester="2025-Spring", credits=3, course_type="major", faculty_id=4),
-    Course(id=4, name="Linear Algebra", code="MA201", description="Vector spaces, eigenvalues, and matrix decomposition.", semester="2025-Spring", credits=3, course_type="minor", faculty_id=3),
-    Course(id=5, name="Technical Writing", code="HS101", description="Academic writing, report formatting, and research presentation.", semester="2025-Spring", credits=2, course_type="elective", faculty_id=4),
-    Course(id=6, name="Computer Networks Lab", code="CS202L", description="Hands-on networking experiments with TCP/IP, routing, and socket programming.", semester="2025-Spring", credits=1, course_type="lab", faculty_id=3),
-]
-for c in courses:
-    db.add(c)
-db.commit()
-print("  [OK] 6 courses created")
-
-# ── ENROLLMENTS ──
-enrollments = [
-    Enrollment(student_id=5, course_id=1), Enrollment(student_id=5, course_id=2),
-    Enrollment(student_id=5, course_id=4), Enrollment(student_id=5, course_id=6),
-    Enrollment(student_id=6, course_id=1), Enrollment(student_id=6, course_id=3),
-    Enrollment(student_id=6, course_id=5),
-    Enrollment(student_id=7, course_id=1), Enrollment(student_id=7, course_id=4),
-]
-for e in enrollments:
-    db.add(e)
-db.commit()
-print("  [OK] 9 enrollments created")
-
-# ── GRIEVANCES (Pillar II) ──
-today = datetime.now(timezone.utc)
-grievances = [
-    Grievance(id=1, title="Wi-Fi connectivity issues in Hostel Block C", description="The Wi-Fi in Block C has been extremely unreliable for the past 2 weeks. Students are unable to attend online classes or submit assignments on time.", category="infrastructure", priority="high", status="in_review", location="Hostel Block C", submitted_by=5, assigned_to=2),
-    Grievance(id=2, title="Mess food quality deterioration", description="The quality of food served in the North Mess has significantly declined. Multiple students have reported hygiene issues.", category="food", priority="urgent", status="pending", location="North Mess", is_anonymous=True, submitted_by=6),
-    Grievance(id=3, title="Library closing early on weekends", description="The library closes at 6 PM on weekends whereas it should be open till 10 PM as per the academic policy.", category="academic", priority="medium", status="resolved", location="Central Library", submitted_by=7, assigned_to=2),
-    Grievance(id=4, title="Broken AC in Lecture Hall 3", description="The air conditioning in LH-3 has not been working for over a month. The temperature during afternoon classes becomes unbearable.", category="infrastructure", priority="high", status="in_progress", location="Lecture Hall 3", submitted_by=5),
-    Grievance(id=5, title="Insufficient parking near academic blocks", description="There is a severe shortage of parking spots near the academic buildings, causing students to park far away and arrive late to classes.", category="infrastructure", priority="low", status="pending", location="Academic Block Parking", submitted_by=6),
-]
-for g in grievances:
-    db.add(g)
-db.commit()
-
-# Grievance comments
-comments = [
-    GrievanceComment(grievance_id=1, user_id=2, content="We have notified the IT department. A technician will visit Block C tomorrow."),
-    GrievanceComment(grievance_id=1, user_id=5, content="Thank you for the update. The issue seems to be with the router on the 3rd floor specifically."),
-    GrievanceComment(grievance_id=3, user_id=2, content="Library hours have been extended to 10 PM on weekends effective immediately."),
-    GrievanceComment(grievance_id=3, user_id=7, content="Thank you! This is very helpful for exam preparation."),
-    GrievanceComment(grievance_id=4, user_id=1, content="Maintenance has been scheduled for next week. Temporary fans will be placed in LH-3."),
-]
-for c in comments:
-    db.add(c)
-db.commit()
-print("  [OK] 5 grievances + 5 comments created")
-
-# ── INTERNSHIPS (Pillar IV) ──
-internships = [
-    Internship(id=1, title="ML Research Intern", company="IIT Mandi - AI Lab", description="Work on cutting-edge NLP research. Build transformer models for low-resource Indian languages.", location="IIT Mandi Campus", stipend=15000, role_type="research", required_skills="Python, PyTorch, NLP, Transformers", duration="3 months", deadline=date.today() + timedelta(days=30), posted_by=3),
-    Internship(id=2, title="Full Stack Developer Intern", company="TechCorp India", description="Build scalable web applications using React and Node.js for enterprise clients.", location="Bangalore", stipend=25000, role_type="internship", required_skills="React, Node.js, PostgreSQL, TypeScript", duration="6 months", deadline=date.today() + timedelta(days=45), posted_by=3),
-    Internship(id=3, title="Embedded Systems Research", company="IIT Mandi - Robotics Lab", description="Design and implement control systems for autonomous drones.", location="IIT Mandi Campus", stipend=12000, role_type="research", required_skills="C/C++, MATLAB, Arduino, ROS", duration="4 months", deadline=date.today() + timedelta(days=20), posted_by=4),
-    Internship(id=4, title="Data Analyst Intern", company="Analytics Pro", description="Analyze large datasets, create dashboards, and derive actionable business insights.", location="Remote", stipend=20000, role_type="internship", required_skills="Python, SQL, Tableau, Statistics", duration="3 months", deadline=date.today() + timedelta(days=60), posted_by=4),
-]
-for i in internships:
-    db.add(i)
-db.commit()
-
-applications = [
-    Application(student_id=5, internship_id=1, status="shortlisted"),
-    Application(student_id=5, internship_id=2, status="submitted"),
-    Application(student_id=6, internship_id=1, status="submitted"),
-    Application(student_id=7, internship_id=3, status="accepted"),
-]
-for a in applications:
-    db.add(a)
-db.commit()
-print("  [OK] 4 internships + 4 applications created")
-
-# ── ATTENDANCE (Pillar III) ──
-att_dates = [date.today() - timedelta(days=i) for i in range(10)]
-for d in att_dates:
-    if d.weekday() < 5:  # weekdays only
-        db.add(Attendance(student_id=5, course_id=1, date=d, status="present" if d.day % 3 != 0 else "absent"))
-        db.add(Attendance(student_id=5, course_id=2, date=d, status="present"))
-db.commit()
-print("  [OK] Attendance records created")
-
-# ── RESOURCES (Pillar III - Vault of Knowledge) ──
-resources = [
-    Resource(title="DSA Midsem Paper 2024", file_url="/uploads/dsa_midsem_2024.pdf", course_code="CS201", year="2024", exam_type="midsem", resource_type="pyq", tags="sorting,trees,graphs", uploaded_by=5),
-    Resource(title="DSA Endsem Paper 2024", file_url="/uploads/dsa_endsem_2024.pdf", course_code="CS201", year="2024", exam_type="endsem", resource_type="pyq", tags="dp,greedy,advanced", uploaded_by=6),
-    Resource(title="ML Lecture Notes - Week 1-4", file_url="/uploads/ml_notes_w1_4.pdf", course_code="CS301", year="2025", exam_type="notes", resource_type="notes", tags="regression,classification,svm", uploaded_by=5),
-    Resource(title="Linear Algebra Summary", file_url="/uploads/la_summary.pdf", course_code="MA201", year="2025", resource_type="notes", tags="eigenvalues,matrices,vector-spaces", uploaded_by=7),
-    Resource(title="DSP Quiz 1 Paper 2023", file_url="/uploads/dsp_quiz1_2023.pdf", course_code="EE301", year="2023", exam_type="quiz", resource_type="pyq", tags="fourier,laplace", uploaded_by=6),
-]
-for r in resources:
-    db.add(r)
-db.commit()
-print("  [OK] 5 resources created")
-
-# ── ACADEMIC EVENTS (Pillar III - Chronos Calendar) ──
-events = [
-    AcademicEvent(title="DSA Midsem Exam", event_date=date.today() + timedelta(days=14), event_type="exam", course_id=1, created_by=3),
-    AcademicEvent(title="ML Assignment 3 Due", event_date=date.today() + timedelta(days=7), event_type="assignment", course_id=2, created_by=3),
-    AcademicEvent(title="Republic Day Holiday", event_date=date(2026, 1, 26), event_type="holiday", created_by=1),
-    AcademicEvent(title="Semester End", event_date=date.today() + timedelta(days=60), event_type="deadline", created_by=1),
-    AcademicEvent(title="DSP Lab Quiz", event_date=date.today() + timedelta(days=5), event_type="exam", course_id=3, created_by=4),
-    AcademicEvent(title="Technical Festival - Exodia", event_date=date.today() + timedelta(days=21), event_type="event", created_by=1, description="Annual technical festival with workshops, hackathons, and competitions."),
-]
-for e in events:
-    db.add(e)
-db.commit()
-print("  [OK] 6 academic events created")
-
-# ── TASKS (Pillar IV - Scholar's Ledger) ──
-tasks = [
-    Task(title="Complete DSA Assignment 4", description="Implement AVL trees and Red-Black trees.", due_date=date.today() + timedelta(days=3), category="assignment", status="in_progress", priority="high", user_id=5),
-    Task(title="ML Project Proposal", description="Write the project proposal for sentiment analysis model.", due_date=date.today() + timedelta(days=10), category="project", status="todo", priority="medium", user_id=5),
-    Task(title="Prepare for Midsems", description="Review chapters 1-6 for DSA midsem.", due_date=date.today() + timedelta(days=14), category="exam_prep", status="todo", priority="high", user_id=5),
-    Task(title="Update Resume", description="Add recent project and internship experience.", due_date=date.today() + timedelta(days=5), category="personal", status="done", priority="low", user_id=5),
-    Task(title="DSP Lab Report", due_date=date.today() + timedelta(days=2), category="assignment", status="in_progress", priority="high", user_id=6),
+DEMO_PASSWORD = "password123"
+BATCH_SIZE = 5000
+
+# Named volume presets; explicit flags override individual values.
+PROFILES = {
+    "demo": {},
+    "production": {"users": 20000, "courses": 400, "enrollments_per_student": 4, "attendance_days": 4, "grievances": 50000},
+    "large": {"users": 30000, "courses": 600, "enrollments_per_student": 5, "attendance_days": 4, "grievances": 80000},
+}
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Aditya", "Ananya", "Arjun", "Diya", "Ishaan", "Kabir", "Kavya", "Meera", "Neha", "Nikhil",
+    "Pooja", "Pranav", "Priya", "Rahul", "Riya", "Rohan", "Saanvi", "Sahil", "Shreya", "Siddharth", "Sneha",
+    "Tanvi", "Varun", "Vihaan", "Vikram", "Yash", "Zoya", "Harsh", "Isha", "Karan", "Lakshmi", "Manav", "Nandini",
 ]
-for t in tasks:
-    db.add(t)
-db.commit()
-print("  [OK] 5 tasks created")
-
-# ── LOST & FOUND (Pillar V) ──
-lost_found = [
-    LostFoundItem(title="Blue Water Bottle", description="Found near South Mess entrance. Has an IIT Mandi sticker.", location="South Mess", category="other", item_type="found", posted_by=5),
-    LostFoundItem(title="Scientific Calculator (Casio fx-991EX)", description="Lost somewhere between LH-1 and Library. Silver colored.", location="Academic Block", category="electronics", item_type="lost", posted_by=6),
-    LostFoundItem(title="Student ID Card", description="Found ID card of a B.Tech 2023 batch student near parking.", location="Main Parking", category="id_cards", item_type="found", posted_by=7),
-    LostFoundItem(title="Black Hoodie", description="Left in LH-3 after evening class on Monday.", location="Lecture Hall 3", category="clothing", item_type="lost", posted_by=5),
+LAST_NAMES = [
+    "Sharma", "Verma", "Patel", "Gupta", "Singh", "Kumar", "Nair", "Iyer", "Reddy", "Mehta", "Joshi", "Chopra",
+    "Bose", "Das", "Rao", "Pillai", "Thakur", "Chauhan", "Banerjee", "Kapoor", "Malhotra", "Mishra", "Agarwal",
 ]
-for lf in lost_found:
-    db.add(lf)
-db.commit()
-print("  [OK] 4 lost & found items created")
-
-# ── ANNOUNCEMENTS (Pillar VII) ──
-announcements = [
-    Announcement(title="Mid-Semester Exam Schedule Released", content="The mid-semester examination schedule for Spring 2025 has been released. Please check the academic calendar for details. Exams will begin from March 10th.", category="academic", pinned=True, posted_by=1),
-    Announcement(title="Campus Recruitment Drive - Week 3", content="TechCorp and Analytics Pro will be visiting campus for recruitment. Eligible students should register on the placement portal by Feb 20th.", category="events", posted_by=2),
-    Announcement(title="Library Renovation Notice", content="The central library will undergo renovation from March 1-5. During this period, the reading room in Block A will be available as an alternative.", category="administrative", posted_by=1),
-    Announcement(title="Annual Sports Meet Registration", content="Register for the Annual Sports Meet 2025. Events include cricket, football, badminton, athletics, and chess. Last date: Feb 25th.", category="events", posted_by=2),
-    Announcement(title="Emergency: Water Supply Disruption", content="Water supply to Hostel Blocks A-D will be disrupted on Feb 16 from 10 AM to 4 PM due to maintenance work. Please store water in advance.", category="emergency", pinned=True, posted_by=1),
+# (department, course code prefix, share of users)
+DEPARTMENTS = [
+    ("Computer Science", "CS", 28), ("Electrical Engineering", "EE", 20), ("Mechanical Engineering", "ME", 16),
+    ("Civil Engineering", "CE", 10), ("Mathematics", "MA", 8), ("Physics", "PH", 6),
+    ("Humanities", "HS", 6), ("Bioengineering", "BE", 6),
 ]
-for a in announcements:
-    db.add(a)
-db.commit()
-print("  [OK] 5 announcements created")
-
-# ── FORUM (Pillar VI - Hall of Echoes) ──
-posts = [
-    ForumPost(id=1, title="Best resources for learning ML?", content="I'm starting CS301 next semester. What are the best resources (books, courses, YouTube channels) to prepare beforehand? Any tips from seniors who've taken this course?", category="academics", author_id=6, upvotes=12, downvotes=1),
-    ForumPost(id=2, title="Campus WiFi keeps disconnecting", content="Is anyone else experiencing constant WiFi drops in Block B? It's been happening since last week and it's really affecting my work. Should we file a collective grievance?", category="tech_support", author_id=5, upvotes=25, downvotes=0),
-    ForumPost(id=3, title="Organize a hackathon this semester?", content="Would anyone be interested in organizing an inter-hostel hackathon? We could do a 24-hour event with prizes from the tech club budget. Looking for co-organizers!", category="events", author_id=7, upvotes=18, downvotes=2),
-    ForumPost(id=4, title="Tips for surviving first winter in Mandi", content="First year here and the cold is no joke! Any tips for staying warm? Best places to buy winter gear locally?", category="campus_life", author_id=6, upvotes=8, downvotes=0),
+STAFF_DEPARTMENTS = ["Administration", "Dean of Students", "Hostel Warden", "Academic Affairs", "Estate Office"]
+MODULES = ["grievances", "announcements", "lost_found", "clubs", "internships", "caravan", "incidents"]
+COURSE_TOPICS = [
+    "Data Structures", "Algorithms", "Machine Learning", "Operating Systems", "Computer Networks", "Databases",
+    "Signals and Systems", "Control Systems", "Thermodynamics", "Fluid Mechanics", "Structural Analysis",
+    "Linear Algebra", "Probability", "Quantum Mechanics", "Technical Writing", "Economics", "Biomechanics",
+    "Digital Design", "Compilers", "Robotics", "Power Electronics", "Heat Transfer", "Numerical Methods",
 ]
-for p in posts:
-    db.add(p)
-db.commit()
-
-forum_comments = [
-    ForumComment(post_id=1, author_id=5, content="Andrew Ng's ML course on Coursera is a must. Also check out 3Blue1Brown for the math intuition.", upvotes=8),
-    ForumComment(post_id=1, author_id=7, content="The course textbook (ISLR) is actually quite good. Don't skip the exercises!", upvotes=5),
-    ForumComment(post_id=2, author_id=7, content="Same issue in Block C! I've already filed a grievance. You can track it on the platform.", upvotes=15),
-    ForumComment(post_id=2, author_id=6, content="IT department said they're upgrading routers next week. Fingers crossed!", upvotes=10),
-    ForumComment(post_id=3, author_id=5, content="I'm in! Have experience organizing events. DM me.", upvotes=6),
-    ForumComment(post_id=4, author_id=5, content="Get a good room heater and thermal innerwear. The market in town has decent options.", upvotes=4),
+CAMPUS_SPOTS = [
+    "Hostel Block A", "Hostel Block B", "Hostel Block C", "North Mess", "South Mess", "Central Library",
+    "Lecture Hall 1", "Lecture Hall 3", "A10 Block", "Academic Block Parking", "Sports Complex", "Medical Center",
 ]
-for fc in forum_comments:
-    db.add(fc)
-db.commit()
-print("  [OK] 4 forum posts + 6 comments created")
-
-# ── THE COMMONS (Pillar V) - Caravan & Mercenary ──
-caravans = [
-    CaravanPool(destination="Mandi Bus Stand", travel_date=datetime.now(timezone.utc) + timedelta(hours=5), available_seats=3, estimated_cost=400, posted_by=5),
-    CaravanPool(destination="Kullu Airport", travel_date=datetime.now(timezone.utc) + timedelta(days=2), available_seats=2, estimated_cost=2500, posted_by=6),
+GRIEVANCE_TOPICS = {
+    "infrastructure": ["Wi-Fi outage", "Broken AC", "Water leakage", "Power cuts", "Lift not working"],
+    "hostel": ["Room allocation issue", "Noise after hours", "Laundry machines broken", "Pest problem"],
+    "food": ["Food quality", "Hygiene concerns", "Mess timings", "Menu repetition"],
+    "academic": ["Grading dispute", "Timetable clash", "Library hours", "Course registration error"],
+    "administrative": ["Delayed certificate", "ID card reissue", "Fee receipt missing"],
+    "financial": ["Scholarship delay", "Refund pending", "Incorrect fee charged"],
+    "other": ["Stray dogs near hostel", "Transport schedule", "Lost parcel at gate"],
+}
+COMPANIES = [
+    "IIT Mandi - AI Lab", "IIT Mandi - Robotics Lab", "TechCorp India", "Analytics Pro", "CloudNine Systems",
+    "GreenGrid Energy", "FinEdge", "MedScan Labs", "Himalayan Startups", "OpenSilicon",
 ]
-for c in caravans: db.add(c)
+SKILLS = ["Python", "C++", "React", "SQL", "PyTorch", "MATLAB", "ROS", "Go", "Tableau", "Docker", "Verilog"]
+DESTINATIONS = ["Mandi Bus Stand", "Kullu Airport", "Chandigarh", "Delhi ISBT", "Manali", "Bilaspur"]
 
-mercenaries = [
-    MercenaryGig(title="UI/UX Design for Hackathon", description="Need a clean dashboard mockup for our project.", category="design", budget="₹1000", posted_by=5),
-    MercenaryGig(title="Python Debugging Help", description="Fixing a circular import in a FastAPI project.", category="coding", budget="Treat at North Mess", posted_by=6),
-]
-for m in mercenaries: db.add(m)
-db.commit()
-print("  [OK] 2 caravans + 2 mercenary gigs created")
-
-# ── THE SPIRIT (Pillar VII) - Clubs ──
-clubs = [
-    Club(id=1, name="Kamand Coding Club", description="The official coding club of IIT Mandi. We organize hackathons and workshops.", category="technical", lead_id=3),
-    Club(id=2, name="Music Society", description="For the lovers of rhythm and melody.", category="cultural", lead_id=3),
-]
-for c in clubs: db.add(c)
-db.commit()
+GRIEVANCE_CATEGORIES = ["infrastructure", "hostel", "food", "academic", "administrative", "financial", "other"]
+GRIEVANCE_CATEGORY_WEIGHTS = [30, 20, 15, 15, 8, 5, 7]
+PRIORITIES = ["low", "medium", "high", "urgent"]
+PRIORITY_WEIGHTS = [25, 45, 22, 8]
 
-memberships = [
-    ClubMember(club_id=1, user_id=5, role="coordinator"),
-    ClubMember(club_id=1, user_id=6, role="member"),
-    ClubMember(club_id=2, user_id=7, role="member"),
-]
-for m in memberships: db.add(m)
-db.commit()
-print("  [OK] 2 clubs + 3 memberships created")
-
-# ── Guild Events & Dispatches ──
-club_events = [
-    ClubEvent(club_id=1, title="Competitive Programming Sprints", description="Join us for a 3-hour intense coding session.", event_date=datetime(2026, 2, 25, 18, 0), location="A10 Block"),
-    ClubEvent(club_id=2, title="Drama Night Rehearsals", description="Preparation for the upcoming spring fest.", event_date=datetime(2026, 2, 28, 20, 0), location="Auditorium"),
-]
-for e in club_events: db.add(e)
 
-club_ann = [
-    ClubAnnouncement(club_id=1, title="Recruitment Phase 1 Results", content="Check the portal for the list of shortlisted candidates for the Core team."),
-    ClubAnnouncement(club_id=2, title="New Equipment Acquired", content="We have successfully procured a new sound system for all upcoming performances."),
-]
-for a in club_ann: db.add(a)
-
-db.commit()
-print("  [OK] Club events and dispatches seeded")
-
-# ── CONNECTION (Pillar VI) - Pathfinder's Map ──
-locations = [
-    CampusLocation(name="North Campus Library", description="Main central library for UG/PG students.", category="Facility", latitude=30, longitude=40),
-    CampusLocation(name="A10 Block", description="CSE and EE Department building.", category="Academic", latitude=45, longitude=50),
-    CampusLocation(name="B1 Mess", description="North campus central dining hall.", category="Mess", latitude=35, longitude=30),
-    CampusLocation(name="Cedar Mess", description="South campus mess hall.", category="Mess", latitude=70, longitude=65),
-    CampusLocation(name="Medical Center", description="24/7 emergency medical services.", category="Medic", latitude=50, longitude=45),
-    CampusLocation(name="D2 Hostel", description="Student accommodation with valley view.", category="Hostel", latitude=60, longitude=75),
-]
-for l in locations: db.add(l)
-db.commit()
-print("  [OK] 6 campus locations created")
-
-# ── Hall of Echoes (Forum) Initial Posts ──
-forum_posts = [
-    ForumPost(title="Best place for night snacks in Kamand?", content="North campus is great, but South campus mess has those parathas. Thoughts?", category="campus_life", author_id=5, upvotes=12),
-    ForumPost(title="Linear Algebra survival guide", content="Prof is fast. Anyone want to form a study group for the mid-sem?", category="academics", author_id=6, upvotes=8),
-]
-for p in forum_posts: db.add(p)
-db.commit()
-print("  [OK] 2 forum posts created")
-
-db.close()
-print("\n[DONE] AEGIS Platform seeded successfully!")
-print("\nTest Credentials (password: password123):")
-print("  Admin:     admin@iitmandi.ac.in")
-print("  Authority:  authority@iitmandi.ac.in")
-print("  Faculty:    faculty1@iitmandi.ac.in")
-print("  Student:    student1@iitmandi.ac.in")
+def _insert(conn, model, rows) -> int:
+    """Stream `rows` into `model`'s table in multi-row batches. Returns the row count."""
+    stmt = model.__table__.insert()
+    rows = iter(rows)
+    total = 0
+    while batch := list(islice(rows, BATCH_SIZE)):
+        conn.execute(stmt, batch)
+        total += len(batch)
+    return total
+
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    """Small-lambda Poisson draw (Knuth); used for per-parent child counts."""
+    if lam <= 0:
+        return 0
+    limit, k, p = pow(2.718281828459045, -lam), 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+class WeightedPicker:
+    """Repeated weighted choice over a fixed population, O(log n) per draw."""
+
+    def __init__(self, rng: random.Random, population: list, weights: list[float]):
+        self.rng = rng
+        self.population = population
+        self.cum = list(accumulate(weights))
+        self.total = self.cum[-1]
+
+    def pick(self):
+        return self.population[bisect(self.cum, self.rng.random() * self.total)]
+
+    def sample(self, k: int) -> list:
+        """Up to `k` distinct members, favouring heavy ones."""
+        k = min(k, len(self.population))
+        chosen: dict = {}
+        for _ in range(k * 4):
+            if len(chosen) == k:
+                break
+            chosen[self.pick()] = None
+        return list(chosen)
+
+
+class SyntheticCampus:
+    """Generates a campus of `opts.users` accounts and their activity across every model."""
+
+    def __init__(self, conn, opts: argparse.Namespace, password_hash: str):
+        self.conn = conn
+        self.opts = opts
+        self.rng = random.Random(opts.seed)
+        self.password_hash = password_hash
+        self.now = datetime.now(timezone.utc)
+        self.today = self.now.date()
+        self.counts: dict[str, int] = {}
+
+    # ── helpers ──
+    def _first_id(self, model) -> int:
+        return self.conn.execute(select(func.coalesce(func.max(model.id), 0))).scalar() + 1
+
+    def _ago(self, mean_days: float, cap_days: float = 730) -> datetime:
+        """A timestamp in the past, exponentially skewed towards recent activity."""
+        days = min(self.rng.expovariate(1 / mean_days), cap_days)
+        return self.now - timedelta(days=days)
+
+    def _person(self) -> tuple[str, str]:
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def _record(self, name: str, count: int) -> None:
+        self.counts[name] = self.counts.get(name, 0) + count
+        print(f"  [OK] {count:>8} {name}")
+
+    # ── Pillar I: people ──
+    def users(self) -> None:
+        rng, n = self.rng, self.opts.users
+        n_admin, n_authority, n_faculty = max(1, n // 2000), max(2, n // 400), max(5, n // 25)
+        n_student = max(1, n - n_admin - n_authority - n_faculty)
+        next_id = self._first_id(User)
+        dept_picker = WeightedPicker(rng, DEPARTMENTS, [d[2] for d in DEPARTMENTS])
+
+        self.admins, self.authorities, self.faculty, self.students = [], [], [], []
+        self.user_department: dict[int, str] = {}
+
+        def rows():
+            nonlocal next_id
+            for role, count, bucket in (
+                ("admin", n_admin, self.admins), ("authority", n_authority, self.authorities),
+                ("faculty", n_faculty, self.faculty), ("student", n_student, self.students),
+            ):
+                for _ in range(count):
+                    uid, next_id = next_id, next_id + 1
+                    bucket.append(uid)
+                    first, last = self._person()
+                    if role == "student":
+                        department = dept_picker.pick()[0]
+                        batch_year = rng.randint(self.today.year - 4, self.today.year)
+                        email = f"b{batch_year % 100}{uid:06d}@students.iitmandi.ac.in"
+                        name = f"{first} {last}"
+                        created_at = datetime(batch_year, 7, 20, tzinfo=timezone.utc) + timedelta(days=rng.random() * 30)
+                        status = "pending" if rng.random() < 0.03 else "active"
+                    else:
+                        department = dept_picker.pick()[0] if role == "faculty" else rng.choice(STAFF_DEPARTMENTS)
+                        email = f"{first.lower()}.{last.lower()}.{uid}@iitmandi.ac.in"
+                        name = f"Dr. {first} {last}" if role == "faculty" else f"Prof. {first} {last}"
+                        created_at = self._ago(600, 3650)
+                        status = "active"
+                    self.user_department[uid] = department
+                    yield {
+                        "id": uid, "email": email, "name": name, "hashed_password": self.password_hash,
+                        "role": role, "status": status, "department": department,
+                        "managed_modules": ",".join(rng.sample(MODULES, rng.randint(1, 3))) if role == "authority" else None,
+                        "created_at": created_at,
+                    }
+
+        self._record("users", _insert(self.conn, User, rows()))
+        # A few students do most of the posting and complaining.
+        self.active_students = WeightedPicker(rng, self.students, [rng.paretovariate(1.5) for _ in self.students])
+        self.staff = self.admins + self.authorities
+
+    # ── Pillar III: academics ──
+    def courses(self) -> None:
+        rng = self.rng
+        next_id = self._first_id(Course)
+        seq = {prefix: 500 for _, prefix, _ in DEPARTMENTS}
+        semesters = [f"{self.today.year}-Spring", f"{self.today.year - 1}-Autumn", f"{self.today.year - 1}-Spring"]
+        self.course_ids, self.course_faculty, self.course_codes = [], {}, []
+        rows = []
+        for _ in range(self.opts.courses):
+            _, prefix, _ = rng.choice(DEPARTMENTS)
+            seq[prefix] += 1
+            course_type = rng.choices(["major", "minor", "elective", "lab", "project"], [45, 15, 20, 15, 5])[0]
+            faculty_id = rng.choice(self.faculty)
+            code = f"{prefix}{seq[prefix]}{'L' if course_type == 'lab' else ''}"
+            rows.append({
+                "id": next_id, "name": f"{rng.choice(COURSE_TOPICS)} {rng.choice(['I', 'II', 'III'])}", "code": code,
+                "description": None, "semester": rng.choices(semesters, [70, 20, 10])[0],
+                "credits": 1 if course_type == "lab" else rng.choice([2, 3, 3, 4, 4]),
+                "course_type": course_type, "faculty_id": faculty_id, "created_at": self._ago(200),
+            })
+            self.course_ids.append(next_id)
+            self.course_faculty[next_id] = faculty_id
+            self.course_codes.append(code)
+            next_id += 1
+        self._record("courses", _insert(self.conn, Course, rows))
+
+    def enrollments(self) -> None:
+        rng = self.rng
+        # Zipf-like popularity: a handful of core courses are very large.
+        ranked = self.course_ids[:]
+        rng.shuffle(ranked)
+        popularity = WeightedPicker(rng, ranked, [1 / (rank + 1) ** 0.8 for rank in range(len(ranked))])
+        self.enrollment_pairs: list[tuple[int, int]] = []
+
+        def rows():
+            mean = self.opts.enrollments_per_student
+            for sid in self.students:
+                k = max(1, round(rng.gauss(mean, 1)))
+                for cid in popularity.sample(k):
+                    self.enrollment_pairs.append((sid, cid))
+                    yield {"student_id": sid, "course_id": cid, "enrolled_at": self._ago(60, 150)}
+
+        self._record("enrollments", _insert(self.conn, Enrollment, rows()))
+
+    def attendance(self) -> None:
+        rng, days = self.rng, self.opts.attendance_days
+        if days <= 0:
+            return
+        # Each course meets on its own weekdays; record its last `days` sessions.
+        sessions: dict[int, list[tuple[date, datetime]]] = {}
+        for cid in self.course_ids:
+            weekdays = set(rng.sample(range(5), rng.choice([2, 3, 3, 4])))
+            dates, d = [], self.today
+            while len(dates) < days:
+                if d.weekday() in weekdays:
+                    dates.append((d, datetime(d.year, d.month, d.day, 9 + rng.randint(0, 7), tzinfo=timezone.utc)))
+                d -= timedelta(days=1)
+            sessions[cid] = dates
+        # Per-student attendance rate, centred around 83% with a tail below 75%.
+        rate = {sid: rng.betavariate(10, 2) for sid in self.students}
+
+        def rows():
+            rand = rng.random
+            for sid, cid in self.enrollment_pairs:
+                p = rate[sid]
+                for d, created_at in sessions[cid]:
+                    r = rand()
+                    status = "present" if r < p else ("late" if r < p + 0.04 else "absent")
+                    yield {"student_id": sid, "course_id": cid, "date": d, "status": status, "created_at": created_at}
+
+        self._record("attendance", _insert(self.conn, Attendance, rows()))
+
+    def resources_and_events(self) -> None:
+        rng = self.rng
+        n_resources = self.opts.users // 20
+
+        def resources():
+            for _ in range(n_resources):
+                resource_type = rng.choices(["pyq", "notes", "assignment", "other"], [50, 35, 10, 5])[0]
+                code = rng.choice(self.course_codes)
+                exam_type = rng.choice(["midsem", "endsem", "quiz"]) if resource_type == "pyq" else "notes"
+                year = str(rng.randint(self.today.year - 6, self.today.year))
+                yield {
+                    "title": f"{code} {exam_type.title()} {year}", "description": None,
+                    "file_url": f"/uploads/{code.lower()}_{exam_type}_{year}_{rng.randrange(10**6):06d}.pdf",
+                    "course_code": code, "year": year, "exam_type": exam_type, "resource_type": resource_type,
+                    "tags": ",".join(rng.sample(COURSE_TOPICS, 2)).lower(),
+                    "uploaded_by": self.active_students.pick(), "created_at": self._ago(180),
+                }
+
+        def events():
+            kinds = ["exam", "assignment", "deadline", "exam"]
+            for cid, code in zip(self.course_ids, self.course_codes):
+                for kind in kinds:
+                    yield {
+                        "title": f"{kind.title()} - {code}", "description": None,
+                        "event_date": self.today + timedelta(days=rng.randint(-60, 90)), "event_type": kind,
+                        "course_id": cid, "created_by": self.course_faculty[cid], "created_at": self._ago(30),
+                    }
+            for _ in range(max(5, self.opts.users // 1000)):
+                yield {
+                    "title": rng.choice(["Holiday", "Convocation", "Fest", "Registration Deadline"]), "description": None,
+                    "event_date": self.today + timedelta(days=rng.randint(-120, 180)),
+                    "event_type": rng.choice(["holiday", "event", "deadline"]),
+                    "course_id": None, "created_by": rng.choice(self.admins), "created_at": self._ago(60),
+                }
+
+        self._record("resources", _insert(self.conn, Resource, resources()))
+        self._record("academic events", _insert(self.conn, AcademicEvent, events()))
+
+    # ── Pillar II: grievances ──
+    def grievances(self) -> None:
+        rng = self.rng
+        next_id = self._first_id(Grievance)
+        grievance_meta: list[tuple[int, int, int | None, datetime, str]] = []
+
+        def rows():
+            nonlocal next_id
+            categories = rng.choices(GRIEVANCE_CATEGORIES, GRIEVANCE_CATEGORY_WEIGHTS, k=self.opts.grievances)
+            for category in categories:
+                gid, next_id = next_id, next_id + 1
+                created_at = self._ago(120)
+                age_days = (self.now - created_at).days
+                # Older grievances are more likely to be closed.
+                if rng.random() < min(0.75, age_days / 120):
+                    status = "resolved" if rng.random() < 0.9 else "rejected"
+                else:
+                    status = rng.choices(["pending", "in_review", "in_progress"], [50, 30, 20])[0]
+                assigned_to = rng.choice(self.authorities) if status != "pending" or rng.random() < 0.1 else None
+                submitted_by = self.active_students.pick()
+                location = rng.choice(CAMPUS_SPOTS)
+                topic = rng.choice(GRIEVANCE_TOPICS[category])
+                grievance_meta.append((gid, submitted_by, assigned_to, created_at, status))
+                yield {
+                    "id": gid, "title": f"{topic} - {location}",
+                    "description": f"{topic} reported at {location}. Please look into this at the earliest.",
+                    "category": category, "priority": rng.choices(PRIORITIES, PRIORITY_WEIGHTS)[0], "status": status,
+                    "location": location, "image_url": None, "is_anonymous": rng.random() < 0.08,
+                    "submitted_by": submitted_by, "assigned_to": assigned_to, "created_at": created_at,
+                    "updated_at": created_at + timedelta(days=rng.random() * age_days) if status != "pending" else created_at,
+                }
+
+        def comments():
+            lam = self.opts.comments_per_grievance
+            for gid, submitted_by, assigned_to, created_at, status in grievance_meta:
+                at = created_at
+                for i in range(_poisson(rng, lam * (0.3 if status == "pending" else 1.3))):
+                    staff = assigned_to or rng.choice(self.authorities)
+                    at += timedelta(hours=rng.expovariate(1 / 30))
+                    yield {
+                        "grievance_id": gid, "user_id": staff if i % 2 == 0 else submitted_by,
+                        "content": "Update: the concerned team has been notified." if i % 2 == 0 else "Thanks, following up.",
+                        "created_at": min(at, self.now),
+                    }
+
+        self._record("grievances", _insert(self.conn, Grievance, rows()))
+        self._record("grievance comments", _insert(self.conn, GrievanceComment, comments()))
+
+    # ── Pillar IV: career and planning ──
+    def internships(self) -> None:
+        rng = self.rng
+        next_id = self._first_id(Internship)
+        internship_ids = list(range(next_id, next_id + self.opts.internships))
+
+        def rows():
+            for iid in internship_ids:
+                role_type = rng.choices(["internship", "research", "fulltime"], [60, 30, 10])[0]
+                yield {
+                    "id": iid, "title": f"{rng.choice(SKILLS)} {role_type.title()} Position", "company": rng.choice(COMPANIES),
+                    "description": None, "location": rng.choice(["IIT Mandi Campus", "Bangalore", "Remote", "Delhi", "Pune"]),
+                    "stipend": rng.randrange(5000, 60000, 1000), "role_type": role_type,
+                    "required_skills": ", ".join(rng.sample(SKILLS, 3)), "duration": f"{rng.choice([2, 3, 4, 6])} months",
+                    "deadline": self.today + timedelta(days=rng.randint(-60, 90)),
+                    "posted_by": rng.choice(self.faculty), "created_at": self._ago(90),
+                }
+
+        def applications():
+            popularity = WeightedPicker(rng, internship_ids, [rng.paretovariate(1.2) for _ in internship_ids])
+            statuses = ["submitted", "under_review", "shortlisted", "accepted", "rejected"]
+            for sid in self.students:
+                if rng.random() > 0.6:
+                    continue
+                for iid in popularity.sample(1 + _poisson(rng, self.opts.applications_per_student - 1)):
+                    yield {
+                        "student_id": sid, "internship_id": iid,
+                        "status": rng.choices(statuses, [45, 20, 15, 5, 15])[0],
+                        "resume_url": None, "faculty_feedback": None, "applied_at": self._ago(45),
+                    }
+
+        if not internship_ids:
+            return
+        self._record("internships", _insert(self.conn, Internship, rows()))
+        self._record("applications", _insert(self.conn, Application, applications()))
+
+    def tasks(self) -> None:
+        rng = self.rng
+
+        def rows():
+            for uid in self.students:
+                for _ in range(_poisson(rng, 3)):
+                    status = rng.choices(["todo", "in_progress", "done"], [40, 25, 35])[0]
+                    yield {
+                        "title": f"{rng.choice(['Finish', 'Review', 'Submit', 'Prepare'])} {rng.choice(COURSE_TOPICS)}",
+                        "description": None, "due_date": self.today + timedelta(days=rng.randint(-20, 40)),
+                        "category": rng.choice(["assignment", "project", "personal", "exam_prep"]), "status": status,
+                        "priority": rng.choices(["low", "medium", "high"], [30, 45, 25])[0],
+                        "user_id": uid, "created_at": self._ago(30),
+                    }
+
+        self._record("tasks", _insert(self.conn, Task, rows()))
+
+    # ── Pillar V: the commons ──
+    def commons(self) -> None:
+        rng, n = self.rng, self.opts.users
+
+        def lost_found():
+            for _ in range(n // 50):
+                status = rng.choices(["open", "claimed", "closed"], [50, 35, 15])[0]
+                yield {
+                    "title": rng.choice(["Water Bottle", "Calculator", "ID Card", "Hoodie", "Earphones", "Umbrella"]),
+                    "description": None, "image_url": None, "location": rng.choice(CAMPUS_SPOTS),
+                    "category": rng.choice(["electronics", "books", "id_cards", "clothing", "other"]),
+                    "item_type": rng.choice(["lost", "found"]), "status": status,
+                    "posted_by": self.active_students.pick(),
+                    "claimed_by": rng.choice(self.students) if status == "claimed" else None,
+                    "created_at": self._ago(45),
+                }
+
+        def caravans():
+            for _ in range(n // 100):
+                travel_date = self.now + timedelta(hours=rng.uniform(-24 * 30, 24 * 14))
+                yield {
+                    "destination": rng.choice(DESTINATIONS), "origin": "IIT Mandi Campus", "travel_date": travel_date,
+                    "available_seats": rng.randint(0, 4), "estimated_cost": float(rng.randrange(200, 4000, 50)),
+                    "contact_info": None, "description": None,
+                    "status": "completed" if travel_date < self.now else rng.choice(["open", "open", "full"]),
+                    "posted_by": self.active_students.pick(), "created_at": travel_date - timedelta(days=rng.uniform(1, 10)),
+                }
+
+        def gigs():
+            for _ in range(n // 100):
+                status = rng.choices(["open", "assigned", "completed"], [50, 20, 30])[0]
+                yield {
+                    "title": f"{rng.choice(['Help with', 'Need', 'Looking for'])} {rng.choice(SKILLS)}", "description": "Details in DM.",
+                    "category": rng.choice(["tutoring", "design", "coding", "photography", "other"]),
+                    "budget": f"₹{rng.randrange(200, 3000, 100)}", "required_skills": rng.choice(SKILLS), "status": status,
+                    "posted_by": self.active_students.pick(),
+                    "assigned_to": rng.choice(self.students) if status != "open" else None,
+                    "rating": rng.randint(3, 5) if status == "completed" else None, "review_content": None,
+                    "created_at": self._ago(60),
+                }
+
+        self._record("lost & found items", _insert(self.conn, LostFoundItem, lost_found()))
+        self._record("caravans", _insert(self.conn, CaravanPool, caravans()))
+        self._record("mercenary gigs", _insert(self.conn, MercenaryGig, gigs()))
+
+    # ── Pillar VI: connection ──
+    def forum(self) -> None:
+        rng = self.rng
+        next_post = self._first_id(ForumPost)
+        next_comment = self._first_id(ForumComment)
+        post_meta: list[tuple[int, datetime, int]] = []
+
+        def posts():
+            nonlocal next_post
+            for _ in range(self.opts.forum_posts):
+                pid, next_post = next_post, next_post + 1
+                upvotes = min(int(rng.paretovariate(1.2)) - 1, 500)
+                created_at = self._ago(90)
+                post_meta.append((pid, created_at, upvotes))
+                yield {
+                    "id": pid, "title": f"Anyone else dealing with {rng.choice(GRIEVANCE_TOPICS[rng.choice(GRIEVANCE_CATEGORIES)]).lower()}?",
+                    "content": "Curious what others think. Any tips?",
+                    "category": rng.choices(["academics", "campus_life", "events", "tech_support", "general"], [30, 30, 15, 10, 15])[0],
+                    "image_url": None, "author_id": self.active_students.pick(),
+                    "upvotes": upvotes, "downvotes": int(upvotes * rng.random() * 0.2), "created_at": created_at,
+                }
+
+        def comments():
+            nonlocal next_comment
+            lam = self.opts.comments_per_post
+            for pid, created_at, upvotes in post_meta:
+                ids: list[int] = []
+                # Popular threads draw more replies.
+                for _ in range(_poisson(rng, lam * min(4.0, 0.5 + upvotes / 20))):
+                    cid, next_comment = next_comment, next_comment + 1
+                    parent = rng.choice(ids) if ids and rng.random() < 0.3 else None
+                    ids.append(cid)
+                    created_at += timedelta(minutes=rng.expovariate(1 / 90))
+                    yield {
+                        "id": cid, "post_id": pid, "parent_id": parent, "author_id": self.active_students.pick(),
+                        "content": rng.choice(["+1", "Same here.", "Try the library reading room.", "DM me, I can help."]),
+                        "upvotes": int(rng.paretovariate(2)) - 1, "downvotes": 0, "created_at": min(created_at, self.now),
+                    }
+
+        self._record("forum posts", _insert(self.conn, ForumPost, posts()))
+        self._record("forum comments", _insert(self.conn, ForumComment, comments()))
+
+    def locations(self) -> None:
+        rng = self.rng
+        rows = [
+            {
+                "name": f"{rng.choice(CAMPUS_SPOTS)} Annex {i + 1}", "description": None,
+                "category": rng.choice(["Academic", "Facility", "Hostel", "Mess", "Medic"]),
+                "latitude": round(rng.uniform(5, 95), 2), "longitude": round(rng.uniform(5, 95), 2), "image_url": None,
+            }
+            for i in range(max(10, self.opts.users // 1000))
+        ]
+        self._record("campus locations", _insert(self.conn, CampusLocation, rows))
+
+    # ── Pillar VII: the spirit ──
+    def clubs(self) -> None:
+        rng = self.rng
+        next_id = self._first_id(Club)
+        club_ids = list(range(next_id, next_id + max(5, self.opts.users // 500)))
+        members_pool = self.students + self.faculty
+
+        clubs = [
+            {
+                "id": club_id, "name": f"{rng.choice(COURSE_TOPICS)} {rng.choice(['Club', 'Society', 'Collective'])}",
+                "description": "Open to all students.", "category": rng.choice(["technical", "cultural", "sports", "social"]),
+                "logo_url": None, "lead_id": rng.choice(self.faculty), "created_at": self._ago(400, 3000),
+            }
+            for club_id in club_ids
+        ]
+
+        def members():
+            for club_id in club_ids:
+                size = min(len(members_pool), int(10 * rng.paretovariate(1.3)))
+                for i, uid in enumerate(rng.sample(members_pool, size)):
+                    role = "coordinator" if i == 0 else ("core" if i < 4 else "member")
+                    yield {"club_id": club_id, "user_id": uid, "role": role, "joined_at": self._ago(200)}
+
+        def events():
+            for club_id in club_ids:
+                for _ in range(6):
+                    yield {
+                        "club_id": club_id, "title": rng.choice(["Workshop", "Meetup", "Showcase", "Tryouts"]),
+                        "description": "All are welcome.", "event_date": self.now + timedelta(days=rng.uniform(-60, 60)),
+                        "location": rng.choice(CAMPUS_SPOTS), "created_at": self._ago(60),
+                    }
+
+        def dispatches():
+            for club_id in club_ids:
+                for _ in range(4):
+                    yield {
+                        "club_id": club_id, "title": rng.choice(["Recruitment open", "Results announced", "Meeting moved"]),
+                        "content": "See the notice board for details.", "created_at": self._ago(60),
+                    }
+
+        self._record("clubs", _insert(self.conn, Club, clubs))
+        self._record("club members", _insert(self.conn, ClubMember, members()))
+        self._record("club events", _insert(self.conn, ClubEvent, events()))
+        self._record("club announcements", _insert(self.conn, ClubAnnouncement, dispatches()))
+
+    def announcements(self) -> None:
+        rng = self.rng
+
+        def rows():
+            for _ in range(max(20, self.opts.users // 40)):
+                category = rng.choices(["academic", "events", "administrative", "emergency", "general"], [30, 25, 20, 5, 20])[0]
+                yield {
+                    "title": f"{category.title()} notice", "content": "Please read the attached circular for details.",
+                    "category": category, "pinned": rng.random() < 0.03, "posted_by": rng.choice(self.staff),
+                    "created_at": self._ago(90),
+                }
+
+        self._record("announcements", _insert(self.conn, Announcement, rows()))
+
+    def incidents_and_audit(self) -> None:
+        rng, n = self.rng, self.opts.users
+
+        def incidents():
+            for _ in range(n // 200):
+                created_at = self._ago(120)
+                status = rng.choices(["active", "investigating", "resolved", "false_alarm"], [3, 7, 70, 20])[0]
+                closed = status in ("resolved", "false_alarm")
+                yield {
+                    "user_id": rng.choice(self.students), "description": "Emergency SOS Triggered",
+                    "latitude": round(rng.uniform(31.77, 31.79), 5), "longitude": round(rng.uniform(76.98, 77.0), 5),
+                    "status": status, "created_at": created_at,
+                    "resolved_at": created_at + timedelta(minutes=rng.uniform(5, 180)) if closed else None,
+                    "resolution_notes": "Handled by security." if closed else None,
+                }
+
+        def audit_logs():
+            actions = [("grievance.update", "grievance"), ("user.approve", "user"), ("announcement.create", "announcement")]
+            for _ in range(n // 4):
+                action, target_type = rng.choice(actions)
+                yield {
+                    "user_id": rng.choice(self.staff), "action": action, "target_type": target_type,
+                    "target_id": rng.randint(1, n), "details": None, "created_at": self._ago(120),
+                }
+
+        self._record("incidents", _insert(self.conn, Incident, incidents()))
+        self._record("audit logs", _insert(self.conn, AuditLog, audit_logs()))
+
+    def generate(self) -> dict[str, int]:
+        self.users()
+        self.courses()
+        self.enrollments()
+        self.attendance()
+        self.resources_and_events()
+        self.grievances()
+        self.internships()
+        self.tasks()
+        self.commons()
+        self.forum()
+        self.locations()
+        self.clubs()
+        self.announcements()
+        self.incidents_and_audit()
+        return self.counts
+
+
+def clear_all() -> None:
+    """Empty every table, children before parents.
+
+    Collection versions are kept and bumped after seeding instead, so ETags
+    handed out before the reseed can never match the new data.
+    """
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            if table is not CollectionVersion.__table__:
+                conn.execute(table.delete())
+
+
+def seed_demo(db, pwd: str) -> None:
+    """The fixed demo dataset used throughout TESTING.md."""
+
+    # ── USERS ──
+    users = [
+        User(id=1, email="admin@iitmandi.ac.in", name="Dr. Arjun Mehta", hashed_password=pwd, role="admin", department="Administration"),
+        User(id=2, email="authority@iitmandi.ac.in", name="Prof. Sunita Sharma", hashed_password=pwd, role="authority", department="Dean of Students"),
+        User(id=3, email="faculty1@iitmandi.ac.in", name="Dr. Rajesh Kumar", hashed_password=pwd, role="faculty", department="Computer Science"),
+        User(id=4, email="faculty2@iitmandi.ac.in", name="Dr. Priya Nair", hashed_password=pwd, role="faculty", department="Electrical Engineering"),
+        User(id=5, email="student1@iitmandi.ac.in", name="Aarav Patel", hashed_password=pwd, role="student", department="Computer Science"),
+        User(id=6, email="student2@iitmandi.ac.in", name="Diya Gupta", hashed_password=pwd, role="student", department="Electrical Engineering"),
+        User(id=7, email="student3@iitmandi.ac.in", name="Kabir Singh", hashed_password=pwd, role="student", department="Mechanical Engineering"),
+        User(id=8, email="authority2@iitmandi.ac.in", name="Prof. Vikram Joshi", hashed_password=pwd, role="authority", department="Hostel Warden"),
+    ]
+    for u in users:
+        db.add(u)
+    db.commit()
+    print("  [OK] 8 users created")
+
+    # ── COURSES (Pillar III) ──
+    courses = [
+        Course(id=1, name="Data Structures & Algorithms", code="CS201", description="Fundamental data structures, sorting algorithms, and complexity analysis.", semester="2025-Spring", credits=4, course_type="major", faculty_id=3),
+        Course(id=2, name="Machine Learning", code="CS301", description="Supervised and unsupervised learning, neural networks, and model evaluation.", semester="2025-Spring", credits=4, course_type="major", faculty_id=3),
+        Course(id=3, name="Digital Signal Processing", code="EE301", description="Fourier analysis, filter design, and signal processing applications.", semester="2025-Spring", credits=3, course_type="major", faculty_id=4),
+        Course(id=4, name="Linear Algebra", code="MA201", description="Vector spaces, eigenvalues, and matrix decomposition.", semester="2025-Spring", credits=3, course_type="minor", faculty_id=3),
+        Course(id=5, name="Technical Writing", code="HS101", description="Academic writing, report formatting, and research presentation.", semester="2025-Spring", credits=2, course_type="elective", faculty_id=4),
+        Course(id=6, name="Computer Networks Lab", code="CS202L", description="Hands-on networking experiments with TCP/IP, routing, and socket programming.", semester="2025-Spring", credits=1, course_type="lab", faculty_id=3),
+    ]
+    for c in courses:
+        db.add(c)
+    db.commit()
+    print("  [OK] 6 courses created")
+
+    # ── ENROLLMENTS ──
+    enrollments = [
+        Enrollment(student_id=5, course_id=1), Enrollment(student_id=5, course_id=2),
+        Enrollment(student_id=5, course_id=4), Enrollment(student_id=5, course_id=6),
+        Enrollment(student_id=6, course_id=1), Enrollment(student_id=6, course_id=3),
+        Enrollment(student_id=6, course_id=5),
+        Enrollment(student_id=7, course_id=1), Enrollment(student_id=7, course_id=4),
+    ]
+    for e in enrollments:
+        db.add(e)
+    db.commit()
+    print("  [OK] 9 enrollments created")
+
+    # ── GRIEVANCES (Pillar II) ──
+    grievances = [
+        Grievance(id=1, title="Wi-Fi connectivity issues in Hostel Block C", description="The Wi-Fi in Block C has been extremely unreliable for the past 2 weeks. Students are unable to attend online classes or submit assignments on time.", category="infrastructure", priority="high", status="in_review", location="Hostel Block C", submitted_by=5, assigned_to=2),
+        Grievance(id=2, title="Mess food quality deterioration", description="The quality of food served in the North Mess has significantly declined. Multiple students have reported hygiene issues.", category="food", priority="urgent", status="pending", location="North Mess", is_anonymous=True, submitted_by=6),
+        Grievance(id=3, title="Library closing early on weekends", description="The library closes at 6 PM on weekends whereas it should be open till 10 PM as per the academic policy.", category="academic", priority="medium", status="resolved", location="Central Library", submitted_by=7, assigned_to=2),
+        Grievance(id=4, title="Broken AC in Lecture Hall 3", description="The air conditioning in LH-3 has not been working for over a month. The temperature during afternoon classes becomes unbearable.", category="infrastructure", priority="high", status="in_progress", location="Lecture Hall 3", submitted_by=5),
+        Grievance(id=5, title="Insufficient parking near academic blocks", description="There is a severe shortage of parking spots near the academic buildings, causing students to park far away and arrive late to classes.", category="infrastructure", priority="low", status="pending", location="Academic Block Parking", submitted_by=6),
+    ]
+    for g in grievances:
+        db.add(g)
+    db.commit()
+
+    # Grievance comments
+    comments = [
+        GrievanceComment(grievance_id=1, user_id=2, content="We have notified the IT department. A technician will visit Block C tomorrow."),
+        GrievanceComment(grievance_id=1, user_id=5, content="Thank you for the update. The issue seems to be with the router on the 3rd floor specifically."),
+        GrievanceComment(grievance_id=3, user_id=2, content="Library hours have been extended to 10 PM on weekends effective immediately."),
+        GrievanceComment(grievance_id=3, user_id=7, content="Thank you! This is very helpful for exam preparation."),
+        GrievanceComment(grievance_id=4, user_id=1, content="Maintenance has been scheduled for next week. Temporary fans will be placed in LH-3."),
+    ]
+    for c in comments:
+        db.add(c)
+    db.commit()
+    print("  [OK] 5 grievances + 5 comments created")
+
+    # ── INTERNSHIPS (Pillar IV) ──
+    internships = [
+        Internship(id=1, title="ML Research Intern", company="IIT Mandi - AI Lab", description="Work on cutting-edge NLP research. Build transformer models for low-resource Indian languages.", location="IIT Mandi Campus", stipend=15000, role_type="research", required_skills="Python, PyTorch, NLP, Transformers", duration="3 months", deadline=date.today() + timedelta(days=30), posted_by=3),
+        Internship(id=2, title="Full Stack Developer Intern", company="TechCorp India", description="Build scalable web applications using React and Node.js for enterprise clients.", location="Bangalore", stipend=25000, role_type="internship", required_skills="React, Node.js, PostgreSQL, TypeScript", duration="6 months", deadline=date.today() + timedelta(days=45), posted_by=3),
+        Internship(id=3, title="Embedded Systems Research", company="IIT Mandi - Robotics Lab", description="Design and implement control systems for autonomous drones.", location="IIT Mandi Campus", stipend=12000, role_type="research", required_skills="C/C++, MATLAB, Arduino, ROS", duration="4 months", deadline=date.today() + timedelta(days=20), posted_by=4),
+        Internship(id=4, title="Data Analyst Intern", company="Analytics Pro", description="Analyze large datasets, create dashboards, and derive actionable business insights.", location="Remote", stipend=20000, role_type="internship", required_skills="Python, SQL, Tableau, Statistics", duration="3 months", deadline=date.today() + timedelta(days=60), posted_by=4),
+    ]
+    for i in internships:
+        db.add(i)
+    db.commit()
+
+    applications = [
+        Application(student_id=5, internship_id=1, status="shortlisted"),
+        Application(student_id=5, internship_id=2, status="submitted"),
+        Application(student_id=6, internship_id=1, status="submitted"),
+        Application(student_id=7, internship_id=3, status="accepted"),
+    ]
+    for a in applications:
+        db.add(a)
+    db.commit()
+    print("  [OK] 4 internships + 4 applications created")
+
+    # ── ATTENDANCE (Pillar III) ──
+    att_dates = [date.today() - timedelta(days=i) for i in range(10)]
+    for d in att_dates:
+        if d.weekday() < 5:  # weekdays only
+            db.add(Attendance(student_id=5, course_id=1, date=d, status="present" if d.day % 3 != 0 else "absent"))
+            db.add(Attendance(student_id=5, course_id=2, date=d, status="present"))
+    db.commit()
+    print("  [OK] Attendance records created")
+
+    # ── RESOURCES (Pillar III - Vault of Knowledge) ──
+    resources = [
+        Resource(title="DSA Midsem Paper 2024", file_url="/uploads/dsa_midsem_2024.pdf", course_code="CS201", year="2024", exam_type="midsem", resource_type="pyq", tags="sorting,trees,graphs", uploaded_by=5),
+        Resource(title="DSA Endsem Paper 2024", file_url="/uploads/dsa_endsem_2024.pdf", course_code="CS201", year="2024", exam_type="endsem", resource_type="pyq", tags="dp,greedy,advanced", uploaded_by=6),
+        Resource(title="ML Lecture Notes - Week 1-4", file_url="/uploads/ml_notes_w1_4.pdf", course_code="CS301", year="2025", exam_type="notes", resource_type="notes", tags="regression,classification,svm", uploaded_by=5),
+        Resource(title="Linear Algebra Summary", file_url="/uploads/la_summary.pdf", course_code="MA201", year="2025", resource_type="notes", tags="eigenvalues,matrices,vector-spaces", uploaded_by=7),
+        Resource(title="DSP Quiz 1 Paper 2023", file_url="/uploads/dsp_quiz1_2023.pdf", course_code="EE301", year="2023", exam_type="quiz", resource_type="pyq", tags="fourier,laplace", uploaded_by=6),
+    ]
+    for r in resources:
+        db.add(r)
+    db.commit()
+    print("  [OK] 5 resources created")
+
+    # ── ACADEMIC EVENTS (Pillar III - Chronos Calendar) ──
+    events = [
+        AcademicEvent(title="DSA Midsem Exam", event_date=date.today() + timedelta(days=14), event_type="exam", course_id=1, created_by=3),
+        AcademicEvent(title="ML Assignment 3 Due", event_date=date.today() + timedelta(days=7), event_type="assignment", course_id=2, created_by=3),
+        AcademicEvent(title="Republic Day Holiday", event_date=date(2026, 1, 26), event_type="holiday", created_by=1),
+        AcademicEvent(title="Semester End", event_date=date.today() + timedelta(days=60), event_type="deadline", created_by=1),
+        AcademicEvent(title="DSP Lab Quiz", event_date=date.today() + timedelta(days=5), event_type="exam", course_id=3, created_by=4),
+        AcademicEvent(title="Technical Festival - Exodia", event_date=date.today() + timedelta(days=21), event_type="event", created_by=1, description="Annual technical festival with workshops, hackathons, and competitions."),
+    ]
+    for e in events:
+        db.add(e)
+    db.commit()
+    print("  [OK] 6 academic events created")
+
+    # ── TASKS (Pillar IV - Scholar's Ledger) ──
+    tasks = [
+        Task(title="Complete DSA Assignment 4", description="Implement AVL trees and Red-Black trees.", due_date=date.today() + timedelta(days=3), category="assignment", status="in_progress", priority="high", user_id=5),
+        Task(title="ML Project Proposal", description="Write the project proposal for sentiment analysis model.", due_date=date.today() + timedelta(days=10), category="project", status="todo", priority="medium", user_id=5),
+        Task(title="Prepare for Midsems", description="Review chapters 1-6 for DSA midsem.", due_date=date.today() + timedelta(days=14), category="exam_prep", status="todo", priority="high", user_id=5),
+        Task(title="Update Resume", description="Add recent project and internship experience.", due_date=date.today() + timedelta(days=5), category="personal", status="done", priority="low", user_id=5),
+        Task(title="DSP Lab Report", due_date=date.today() + timedelta(days=2), category="assignment", status="in_progress", priority="high", user_id=6),
+    ]
+    for t in tasks:
+        db.add(t)
+    db.commit()
+    print("  [OK] 5 tasks created")
+
+    # ── LOST & FOUND (Pillar V) ──
+    lost_found = [
+        LostFoundItem(title="Blue Water Bottle", description="Found near South Mess entrance. Has an IIT Mandi sticker.", location="South Mess", category="other", item_type="found", posted_by=5),
+        LostFoundItem(title="Scientific Calculator (Casio fx-991EX)", description="Lost somewhere between LH-1 and Library. Silver colored.", location="Academic Block", category="electronics", item_type="lost", posted_by=6),
+        LostFoundItem(title="Student ID Card", description="Found ID card of a B.Tech 2023 batch student near parking.", location="Main Parking", category="id_cards", item_type="found", posted_by=7),
+        LostFoundItem(title="Black Hoodie", description="Left in LH-3 after evening class on Monday.", location="Lecture Hall 3", category="clothing", item_type="lost", posted_by=5),
+    ]
+    for lf in lost_found:
+        db.add(lf)
+    db.commit()
+    print("  [OK] 4 lost & found items created")
+
+    # ── ANNOUNCEMENTS (Pillar VII) ──
+    announcements = [
+        Announcement(title="Mid-Semester Exam Schedule Released", content="The mid-semester examination schedule for Spring 2025 has been released. Please check the academic calendar for details. Exams will begin from March 10th.", category="academic", pinned=True, posted_by=1),
+        Announcement(title="Campus Recruitment Drive - Week 3", content="TechCorp and Analytics Pro will be visiting campus for recruitment. Eligible students should register on the placement portal by Feb 20th.", category="events", posted_by=2),
+        Announcement(title="Library Renovation Notice", content="The central library will undergo renovation from March 1-5. During this period, the reading room in Block A will be available as an alternative.", category="administrative", posted_by=1),
+        Announcement(title="Annual Sports Meet Registration", content="Register for the Annual Sports Meet 2025. Events include cricket, football, badminton, athletics, and chess. Last date: Feb 25th.", category="events", posted_by=2),
+        Announcement(title="Emergency: Water Supply Disruption", content="Water supply to Hostel Blocks A-D will be disrupted on Feb 16 from 10 AM to 4 PM due to maintenance work. Please store water in advance.", category="emergency", pinned=True, posted_by=1),
+    ]
+    for a in announcements:
+        db.add(a)
+    db.commit()
+    print("  [OK] 5 announcements created")
+
+    # ── FORUM (Pillar VI - Hall of Echoes) ──
+    posts = [
+        ForumPost(id=1, title="Best resources for learning ML?", content="I'm starting CS301 next semester. What are the best resources (books, courses, YouTube channels) to prepare beforehand? Any tips from seniors who've taken this course?", category="academics", author_id=6, upvotes=12, downvotes=1),
+        ForumPost(id=2, title="Campus WiFi keeps disconnecting", content="Is anyone else experiencing constant WiFi drops in Block B? It's been happening since last week and it's really affecting my work. Should we file a collective grievance?", category="tech_support", author_id=5, upvotes=25, downvotes=0),
+        ForumPost(id=3, title="Organize a hackathon this semester?", content="Would anyone be interested in organizing an inter-hostel hackathon? We could do a 24-hour event with prizes from the tech club budget. Looking for co-organizers!", category="events", author_id=7, upvotes=18, downvotes=2),
+        ForumPost(id=4, title="Tips for surviving first winter in Mandi", content="First year here and the cold is no joke! Any tips for staying warm? Best places to buy winter gear locally?", category="campus_life", author_id=6, upvotes=8, downvotes=0),
+    ]
+    for p in posts:
+        db.add(p)
+    db.commit()
+
+    forum_comments = [
+        ForumComment(post_id=1, author_id=5, content="Andrew Ng's ML course on Coursera is a must. Also check out 3Blue1Brown for the math intuition.", upvotes=8),
+        ForumComment(post_id=1, author_id=7, content="The course textbook (ISLR) is actually quite good. Don't skip the exercises!", upvotes=5),
+        ForumComment(post_id=2, author_id=7, content="Same issue in Block C! I've already filed a grievance. You can track it on the platform.", upvotes=15),
+        ForumComment(post_id=2, author_id=6, content="IT department said they're upgrading routers next week. Fingers crossed!", upvotes=10),
+        ForumComment(post_id=3, author_id=5, content="I'm in! Have experience organizing events. DM me.", upvotes=6),
+        ForumComment(post_id=4, author_id=5, content="Get a good room heater and thermal innerwear. The market in town has decent options.", upvotes=4),
+    ]
+    for fc in forum_comments:
+        db.add(fc)
+    db.commit()
+    print("  [OK] 4 forum posts + 6 comments created")
+
+    # ── THE COMMONS (Pillar V) - Caravan & Mercenary ──
+    caravans = [
+        CaravanPool(destination="Mandi Bus Stand", travel_date=datetime.now(timezone.utc) + timedelta(hours=5), available_seats=3, estimated_cost=400, posted_by=5),
+        CaravanPool(destination="Kullu Airport", travel_date=datetime.now(timezone.utc) + timedelta(days=2), available_seats=2, estimated_cost=2500, posted_by=6),
+    ]
+    for c in caravans: db.add(c)
+
+    mercenaries = [
+        MercenaryGig(title="UI/UX Design for Hackathon", description="Need a clean dashboard mockup for our project.", category="design", budget="₹1000", posted_by=5),
+        MercenaryGig(title="Python Debugging Help", description="Fixing a circular import in a FastAPI project.", category="coding", budget="Treat at North Mess", posted_by=6),
+    ]
+    for m in mercenaries: db.add(m)
+    db.commit()
+    print("  [OK] 2 caravans + 2 mercenary gigs created")
+
+    # ── THE SPIRIT (Pillar VII) - Clubs ──
+    clubs = [
+        Club(id=1, name="Kamand Coding Club", description="The official coding club of IIT Mandi. We organize hackathons and workshops.", category="technical", lead_id=3),
+        Club(id=2, name="Music Society", description="For the lovers of rhythm and melody.", category="cultural", lead_id=3),
+    ]
+    for c in clubs: db.add(c)
+    db.commit()
+
+    memberships = [
+        ClubMember(club_id=1, user_id=5, role="coordinator"),
+        ClubMember(club_id=1, user_id=6, role="member"),
+        ClubMember(club_id=2, user_id=7, role="member"),
+    ]
+    for m in memberships: db.add(m)
+    db.commit()
+    print("  [OK] 2 clubs + 3 memberships created")
+
+    # ── Guild Events & Dispatches ──
+    club_events = [
+        ClubEvent(club_id=1, title="Competitive Programming Sprints", description="Join us for a 3-hour intense coding session.", event_date=datetime(2026, 2, 25, 18, 0), location="A10 Block"),
+        ClubEvent(club_id=2, title="Drama Night Rehearsals", description="Preparation for the upcoming spring fest.", event_date=datetime(2026, 2, 28, 20, 0), location="Auditorium"),
+    ]
+    for e in club_events: db.add(e)
+
+    club_ann = [
+        ClubAnnouncement(club_id=1, title="Recruitment Phase 1 Results", content="Check the portal for the list of shortlisted candidates for the Core team."),
+        ClubAnnouncement(club_id=2, title="New Equipment Acquired", content="We have successfully procured a new sound system for all upcoming performances."),
+    ]
+    for a in club_ann: db.add(a)
+
+    db.commit()
+    print("  [OK] Club events and dispatches seeded")
+
+    # ── CONNECTION (Pillar VI) - Pathfinder's Map ──
+    locations = [
+        CampusLocation(name="North Campus Library", description="Main central library for UG/PG students.", category="Facility", latitude=30, longitude=40),
+        CampusLocation(name="A10 Block", description="CSE and EE Department building.", category="Academic", latitude=45, longitude=50),
+        CampusLocation(name="B1 Mess", description="North campus central dining hall.", category="Mess", latitude=35, longitude=30),
+        CampusLocation(name="Cedar Mess", description="South campus mess hall.", category="Mess", latitude=70, longitude=65),
+        CampusLocation(name="Medical Center", description="24/7 emergency medical services.", category="Medic", latitude=50, longitude=45),
+        CampusLocation(name="D2 Hostel", description="Student accommodation with valley view.", category="Hostel", latitude=60, longitude=75),
+    ]
+    for l in locations: db.add(l)
+    db.commit()
+    print("  [OK] 6 campus locations created")
+
+    # ── Hall of Echoes (Forum) Initial Posts ──
+    forum_posts = [
+        ForumPost(title="Best place for night snacks in Kamand?", content="North campus is great, but South campus mess has those parathas. Thoughts?", category="campus_life", author_id=5, upvotes=12),
+        ForumPost(title="Linear Algebra survival guide", content="Prof is fast. Anyone want to form a study group for the mid-sem?", category="academics", author_id=6, upvotes=8),
+    ]
+    for p in forum_posts: db.add(p)
+    db.commit()
+    print("  [OK] 2 forum posts created")
+
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Reset the database and seed demo data, optionally scaled up for load testing.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="demo", help="named volume preset (default: demo only)")
+    parser.add_argument("--users", type=int, help="synthetic accounts; other tables scale with this (default: 0)")
+    parser.add_argument("--courses", type=int, help="synthetic courses (default: users / 50)")
+    parser.add_argument("--enrollments-per-student", type=float, help="mean courses per student (default: 5)")
+    parser.add_argument("--attendance-days", type=int, help="recorded sessions per course (default: 10)")
+    parser.add_argument("--grievances", type=int, help="synthetic grievances (default: 2.5 x users)")
+    parser.add_argument("--comments-per-grievance", type=float, default=1.5, help="mean comments per grievance")
+    parser.add_argument("--internships", type=int, help="synthetic internships (default: users / 100)")
+    parser.add_argument("--applications-per-student", type=float, default=2.0, help="mean applications per applying student")
+    parser.add_argument("--forum-posts", type=int, help="synthetic forum posts (default: users / 10)")
+    parser.add_argument("--comments-per-post", type=float, default=3.0, help="mean comments on an average forum post")
+    parser.add_argument("--seed", type=int, default=42, help="random seed; same flags + seed = same data")
+    parser.add_argument("--no-demo", action="store_true", help="skip the TESTING.md demo rows")
+    opts = parser.parse_args(argv)
+
+    profile = PROFILES[opts.profile]
+    users = opts.users if opts.users is not None else profile.get("users", 0)
+    defaults = {
+        "users": users,
+        "courses": max(10, users // 50),
+        "enrollments_per_student": 5,
+        "attendance_days": 10,
+        "grievances": users * 5 // 2,
+        "internships": users // 100,
+        "forum_posts": users // 10,
+    }
+    for key, default in defaults.items():
+        if getattr(opts, key) is None:
+            setattr(opts, key, profile.get(key, default))
+    return opts
+
+
+def main(argv=None) -> None:
+    opts = parse_args(argv)
+    upgrade_schema(engine)
+    clear_all()
+    pwd = hash_password(DEMO_PASSWORD)
+
+    if not opts.no_demo:
+        print("[SEED] Seeding AEGIS Platform...")
+        db = SessionLocal()
+        try:
+            seed_demo(db, pwd)
+        finally:
+            db.close()
+
+    if opts.users > 0:
+        print(f"\n[SEED] Generating synthetic campus: {opts.users} users, seed {opts.seed}...")
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            if conn.dialect.name == "sqlite":
+                # Bulk load: one fsync at commit is enough, the data is reproducible anyway.
+                conn.execute(text("PRAGMA synchronous=OFF"))
+            counts = SyntheticCampus(conn, opts, pwd).generate()
+        elapsed = time.perf_counter() - started
+        total = sum(counts.values())
+        print(f"  [OK] {total} synthetic rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+
+    with SessionLocal() as db:
+        bump(db, *TRACKED_COLLECTIONS)
+        reconcile(db)  # rows went in without the API's counter adjustments
+        resync_comment_counts(db)
+        db.commit()
+
+    print("\n[DONE] AEGIS Platform seeded successfully!")
+    if not opts.no_demo:
+        print("\nTest Credentials (password: password123):")
+        print("  Admin:     admin@iitmandi.ac.in")
+        print("  Authority:  authority@iitmandi.ac.in")
+        print("  Faculty:    faculty1@iitmandi.ac.in")
+        print("  Student:    student1@iitmandi.ac.in")
+
+
+if __name__ == "__main__":
+    main()